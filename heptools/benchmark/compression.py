@@ -0,0 +1,207 @@
+"""
+Compare the file size and throughput of compression algorithms for :class:`~heptools.root.io.TreeWriter`.
+
+.. code-block:: bash
+
+    python -m heptools.benchmark.compression input.root --tree Events --entries 100000 --codecs ZLIB:1 LZMA:7 LZ4:4 ZSTD:5
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from ..root.io import CompressionLike, RecordLike
+
+__all__ = ["CodecResult", "benchmark_compression", "format_results"]
+
+DEFAULT_CODECS = (None, "ZLIB", "LZMA", "LZ4", "ZSTD")
+
+
+@dataclass
+class CodecResult:
+    """
+    Result of a single codec.
+    """
+
+    codec: str
+    """str : Name and level of the codec."""
+    raw_size: int
+    """int : In-memory size of the data in bytes."""
+    file_size: int
+    """int : Size of the output file in bytes."""
+    write_time: float
+    """float : Best time to write the data in seconds."""
+    read_time: float
+    """float : Best time to read the data in seconds."""
+
+    @property
+    def ratio(self) -> float:
+        """float : Compression ratio."""
+        return self.raw_size / self.file_size
+
+    @property
+    def write_throughput(self) -> float:
+        """float : Uncompressed bytes written per second."""
+        return self.raw_size / self.write_time
+
+    @property
+    def read_throughput(self) -> float:
+        """float : Uncompressed bytes read per second."""
+        return self.raw_size / self.read_time
+
+
+def _codec_name(codec) -> str:
+    if codec is None:
+        return "none"
+    return f"{type(codec).__name__}:{codec.level}"
+
+
+def benchmark_compression(
+    data: RecordLike,
+    codecs: Iterable[CompressionLike] = DEFAULT_CODECS,
+    repeat: int = 3,
+    directory: str = None,
+    **writer_options,
+) -> list[CodecResult]:
+    """
+    Write and read back ``data`` with each codec.
+
+    Parameters
+    ----------
+    data : RecordLike
+        Sample data.
+    codecs : ~typing.Iterable[CompressionLike], optional
+        Codecs to compare. See :func:`~heptools.root.io.parse_compression` for details.
+    repeat : int, optional, default=3
+        Number of repetitions. The best time will be reported.
+    directory : str, optional
+        Directory to store the temporary files. If not given, the system default will be used.
+    **writer_options : dict, optional
+        Additional options passed to :class:`~heptools.root.io.TreeWriter` e.g. ``basket_size`` or ``branch_compression``.
+
+    Returns
+    -------
+    list[CodecResult]
+        Results in the order of ``codecs``.
+    """
+    from ..root._backend import record_backend, sizeof_record
+    from ..root.io import TreeReader, TreeWriter, parse_compression
+
+    library = record_backend(data)
+    if library.startswith("dict"):
+        library = "np"
+    raw_size = sizeof_record(data)
+    reader = TreeReader()
+    results = []
+    with TemporaryDirectory(dir=directory) as tmp:
+        for i, codec in enumerate(codecs):
+            codec = parse_compression(codec)
+            path = os.path.join(tmp, f"{i}.root")
+            writer = TreeWriter(compression=codec, **writer_options)
+            write_time = read_time = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with writer(path):
+                    writer.extend(data)
+                write_time = min(write_time, time.perf_counter() - start)
+                chunk = writer.tree
+                start = time.perf_counter()
+                reader.arrays(chunk, library=library)
+                read_time = min(read_time, time.perf_counter() - start)
+            results.append(
+                CodecResult(
+                    codec=_codec_name(codec),
+                    raw_size=raw_size,
+                    file_size=os.path.getsize(path),
+                    write_time=write_time,
+                    read_time=read_time,
+                )
+            )
+    return results
+
+
+def _binary(value: float, unit: str) -> str:
+    for prefix in ("", "Ki", "Mi", "Gi", "Ti"):
+        if abs(value) < 1024 or prefix == "Ti":
+            break
+        value /= 1024
+    return f"{value:.2f} {prefix}{unit}"
+
+
+def format_results(results: Iterable[CodecResult]) -> str:
+    """
+    Format ``results`` as a plain text table.
+
+    Parameters
+    ----------
+    results : ~typing.Iterable[CodecResult]
+        Results of :func:`benchmark_compression`.
+
+    Returns
+    -------
+    str
+        Table with one row per codec.
+    """
+    header = ("codec", "size", "ratio", "write", "read")
+    rows = [header]
+    for result in results:
+        rows.append(
+            (
+                result.codec,
+                _binary(result.file_size, "B"),
+                f"{result.ratio:.2f}",
+                _binary(result.write_throughput, "B/s"),
+                _binary(result.read_throughput, "B/s"),
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help="path to the input ROOT file")
+    parser.add_argument("--tree", default="Events", help="name of the tree")
+    parser.add_argument("--entries", type=int, default=None, help="number of entries")
+    parser.add_argument("--branches", nargs="+", default=None, help="branches to read")
+    parser.add_argument("--codecs", nargs="+", default=None, help="e.g. ZSTD:5")
+    parser.add_argument("--repeat", type=int, default=3, help="number of repetitions")
+    parser.add_argument(
+        "--basket-size", type=int, default=..., help="entries per basket"
+    )
+    args = parser.parse_args()
+
+    from ..root.chunk import Chunk
+    from ..root.io import TreeReader
+
+    chunk = Chunk(args.input, name=args.tree, fetch=True)
+    if args.entries is not None:
+        chunk = chunk.slice(0, min(args.entries, chunk.num_entries))
+    data = TreeReader(
+        branch_filter=None if args.branches is None else set(args.branches).__and__
+    ).arrays(chunk)
+    from .. import awkward as akext
+
+    counts = {f"n{k}" for k in data.fields if akext.is_jagged(data[k])}
+    data = data[[k for k in data.fields if k not in counts]]
+    codecs = (
+        DEFAULT_CODECS
+        if args.codecs is None
+        else [None if codec.lower() == "none" else codec for codec in args.codecs]
+    )
+    print(
+        format_results(
+            benchmark_compression(
+                data, codecs, repeat=args.repeat, basket_size=args.basket_size
+            )
+        )
+    )
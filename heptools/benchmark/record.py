@@ -0,0 +1,198 @@
+"""
+Compare the layout-level merge and rename of awkward records with the :func:`awkward.zip` based implementation used by :class:`~heptools.root.chain.Chain`.
+
+.. code-block:: bash
+
+    python -m heptools.benchmark.record --entries 100000 --branches 1000 --friends 5
+"""
+
+from __future__ import annotations
+
+import operator as op
+import time
+from dataclasses import dataclass
+from functools import reduce
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import awkward as ak
+
+__all__ = ["RecordResult", "benchmark_record", "format_results"]
+
+
+@dataclass
+class RecordResult:
+    """
+    Result of a single operation.
+    """
+
+    operation: str
+    """str : Name of the operation."""
+    zip_time: float
+    """float : Best time of the :func:`awkward.zip` based implementation in seconds."""
+    layout_time: float
+    """float : Best time of the layout-level implementation in seconds."""
+
+    @property
+    def speedup(self) -> float:
+        """float : Ratio of ``zip_time`` to ``layout_time``."""
+        return self.zip_time / self.layout_time
+
+
+def _zip_merge(data: list[ak.Array]) -> ak.Array:
+    import awkward as ak
+
+    return ak.zip(
+        reduce(op.or_, (dict(zip(ak.fields(arr), ak.unzip(arr))) for arr in data)),
+        depth_limit=1,
+    )
+
+
+def _zip_rename(data: ak.Array, mapping: Callable[[str], str | tuple[str, ...]]):
+    import awkward as ak
+
+    from ..root._backend import _NestedRecord
+
+    def to_array(nested: _NestedRecord):
+        return ak.zip(
+            {
+                k: to_array(v) if isinstance(v, _NestedRecord) else v
+                for k, v in nested.items()
+            },
+            depth_limit=1,
+        )
+
+    nested = _NestedRecord()
+    for k, v in zip(ak.fields(data), ak.unzip(data)):
+        nested[mapping(k)] = v
+    return to_array(nested)
+
+
+def _best(func: Callable, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _nested(branch: str, friend: str):
+    return friend, branch
+
+
+def benchmark_record(
+    entries: int = 100_000,
+    branches: int = 1000,
+    friends: int = 5,
+    repeat: int = 5,
+) -> list[RecordResult]:
+    """
+    Merge and rename records with random jagged and flat columns.
+
+    Parameters
+    ----------
+    entries : int, optional, default=100_000
+        Number of entries in each record.
+    branches : int, optional, default=1000
+        Number of branches in each record.
+    friends : int, optional, default=5
+        Number of records to merge.
+    repeat : int, optional, default=5
+        Number of repetitions. The best time will be reported.
+
+    Returns
+    -------
+    list[RecordResult]
+        Results of ``merge``, ``rename`` and ``rename+merge``.
+    """
+    import awkward as ak
+    import numpy as np
+
+    from ..root._backend import merge_record, rename_record
+
+    rng = np.random.default_rng(0)
+    counts = rng.poisson(3, entries)
+    flat = rng.random(entries)
+    jagged = ak.unflatten(rng.random(counts.sum()), counts)
+    data = [
+        ak.zip(
+            {f"b{j}": (jagged if j % 2 else flat) for j in range(branches)},
+            depth_limit=1,
+        )
+        for _ in range(friends)
+    ]
+    renames = [lambda k, i=i: _nested(k, f"f{i}") for i in range(friends)]
+    results = []
+    for operation, zip_func, layout_func in (
+        ("merge", lambda: _zip_merge(data), lambda: merge_record(data, library="ak")),
+        (
+            "rename",
+            lambda: _zip_rename(data[0], renames[0]),
+            lambda: rename_record(data[0], renames[0], library="ak"),
+        ),
+        (
+            "rename+merge",
+            lambda: _zip_merge([*map(_zip_rename, data, renames)]),
+            lambda: merge_record(
+                [rename_record(d, r, library="ak") for d, r in zip(data, renames)],
+                library="ak",
+            ),
+        ),
+    ):
+        results.append(
+            RecordResult(
+                operation=operation,
+                zip_time=_best(zip_func, repeat),
+                layout_time=_best(layout_func, repeat),
+            )
+        )
+    return results
+
+
+def format_results(results: list[RecordResult]) -> str:
+    """
+    Format ``results`` as a plain text table.
+
+    Parameters
+    ----------
+    results : list[RecordResult]
+        Results of :func:`benchmark_record`.
+
+    Returns
+    -------
+    str
+        Table with one row per operation.
+    """
+    header = ("operation", "zip", "layout", "speedup")
+    rows = [header]
+    for result in results:
+        rows.append(
+            (
+                result.operation,
+                f"{result.zip_time * 1e3:.2f} ms",
+                f"{result.layout_time * 1e3:.2f} ms",
+                f"{result.speedup:.1f}x",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000, help="entries")
+    parser.add_argument("--branches", type=int, default=1000, help="branches")
+    parser.add_argument("--friends", type=int, default=5, help="records to merge")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repetitions")
+    args = parser.parse_args()
+
+    print(
+        format_results(
+            benchmark_record(args.entries, args.branches, args.friends, args.repeat)
+        )
+    )
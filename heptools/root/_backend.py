@@ -4,7 +4,7 @@ import operator as op
 import sys
 from collections import defaultdict
 from functools import partial, reduce
-from typing import TYPE_CHECKING, Callable, Literal, Protocol
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Protocol
 
 if TYPE_CHECKING:
     import awkward
@@ -29,6 +29,8 @@ class _NestedRecord(defaultdict):
     def to_array(self) -> awkward.Array:
         import awkward as ak
 
+        if (layout := self.to_layout()) is not None:
+            return ak.Array(layout)
         return ak.zip(
             {
                 k: v.to_array() if isinstance(v, _NestedRecord) else v
@@ -37,6 +39,22 @@ class _NestedRecord(defaultdict):
             depth_limit=1,
         )
 
+    def to_layout(self) -> awkward.contents.RecordArray | None:
+        import awkward as ak
+
+        contents = []
+        for v in self.values():
+            if isinstance(v, _NestedRecord):
+                v = v.to_layout()
+            elif isinstance(v, ak.Array):
+                v = v.layout
+            if not isinstance(v, ak.contents.Content) or v.backend.name != "cpu":
+                return None
+            contents.append(v)
+        if not contents or len({v.length for v in contents}) != 1:
+            return None
+        return ak.contents.RecordArray(contents, [*self], length=contents[0].length)
+
     def __setitem__(self, key, value):
         if isinstance(key, tuple):
             if len(key) > 1:
@@ -128,6 +146,198 @@ def concat_record(data: list, library: Backends = ...):
         raise TypeError(_UNKNOWN.format(library=library))
 
 
+class _ColumnFill:
+    def __init__(self, layout, size: int):
+        import awkward as ak
+        import numpy as np
+
+        self._size = size
+        self._start = 0
+        self._parameters = layout.parameters
+        self._layouts = None
+        if isinstance(layout, ak.contents.NumpyArray) and layout.data.ndim == 1:
+            self._kind = "flat"
+            self._data = np.empty(size, dtype=layout.data.dtype)
+        elif isinstance(
+            layout, (ak.contents.ListOffsetArray, ak.contents.ListArray)
+        ) and (
+            isinstance(content := layout.content, ak.contents.NumpyArray)
+            and content.data.ndim == 1
+        ):
+            self._kind = "list"
+            self._offsets = np.empty(size + 1, dtype=np.int64)
+            self._offsets[0] = 0
+            self._content = None
+            self._content_dtype = content.data.dtype
+            self._content_parameters = content.parameters
+        else:
+            self._kind = "other"
+            self._layouts = []
+
+    def _match(self, layout):
+        import awkward as ak
+
+        if self._kind == "flat":
+            return (
+                isinstance(layout, ak.contents.NumpyArray)
+                and layout.data.dtype == self._data.dtype
+                and layout.data.ndim == 1
+                and layout.parameters == self._parameters
+            )
+        if self._kind == "list":
+            return (
+                isinstance(layout, (ak.contents.ListOffsetArray, ak.contents.ListArray))
+                and isinstance(layout.content, ak.contents.NumpyArray)
+                and layout.content.data.dtype == self._content_dtype
+                and layout.content.data.ndim == 1
+                and layout.parameters == self._parameters
+                and layout.content.parameters == self._content_parameters
+            )
+        return True
+
+    def _finish_filled(self):
+        import awkward as ak
+        import numpy as np
+
+        stop = self._start
+        if self._kind == "flat":
+            return ak.contents.NumpyArray(
+                self._data[:stop], parameters=self._parameters
+            )
+        content = self._offsets[stop]
+        if self._content is None:
+            content = np.empty(0, dtype=self._content_dtype)
+        else:
+            content = self._content[:content]
+        return ak.contents.ListOffsetArray(
+            ak.index.Index64(self._offsets[: stop + 1]),
+            ak.contents.NumpyArray(content, parameters=self._content_parameters),
+            parameters=self._parameters,
+        )
+
+    def _extend(self, content, length: int):
+        import numpy as np
+
+        start = self._offsets[self._start]
+        stop = start + len(content)
+        if self._content is None:
+            # estimate the total size from the first part
+            capacity = stop * self._size // max(length, 1)
+            self._content = np.empty(max(capacity, stop), dtype=self._content_dtype)
+        elif stop > len(self._content):
+            grown = np.empty(
+                max(stop, len(self._content) * 3 // 2), dtype=self._content_dtype
+            )
+            grown[:start] = self._content[:start]
+            self._content = grown
+        self._content[start:stop] = content
+
+    def fill(self, layout):
+        import numpy as np
+
+        length = layout.length
+        if self._kind != "other" and not self._match(layout):
+            self._layouts = [self._finish_filled()]
+            self._kind = "other"
+            self._data = self._offsets = self._content = None
+        stop = self._start + length
+        if self._kind == "flat":
+            self._data[self._start : stop] = layout.data
+        elif self._kind == "list":
+            layout = layout.to_ListOffsetArray64(True)
+            offsets = np.asarray(layout.offsets.data)
+            self._offsets[self._start + 1 : stop + 1] = (
+                offsets[1:] + self._offsets[self._start]
+            )
+            self._extend(layout.content.data[: offsets[-1]], length)
+        else:
+            self._layouts.append(layout)
+        self._start = stop
+
+    def finish(self):
+        import awkward as ak
+
+        if self._kind != "other":
+            return self._finish_filled()
+        if len(self._layouts) == 1:
+            return self._layouts[0]
+        return ak.concatenate(self._layouts, highlevel=False)
+
+
+def fill_record(data: Iterable, size: int, library: Backends = ...):
+    """
+    Concatenate ``data`` into preallocated columns of length ``size``. Each part is released once copied. The contents of jagged columns are preallocated from the average length per entry of the first part and grown by 1.5 times when exceeded.
+    """
+    if library is ...:
+        data = [*data]
+        if len(data) == 0:
+            return None
+        library = record_backend(data, sequence=True)
+    if library == "np":
+        import numpy as np
+
+        result, start = None, 0
+        for part in data:
+            if result is None:
+                result = {
+                    k: np.empty((size, *v.shape[1:]), dtype=v.dtype)
+                    for k, v in part.items()
+                }
+            stop = start + len_record(part, library=library)
+            for k, v in result.items():
+                v[start:stop] = part[k]
+            start = stop
+            part = None
+        if result is None:
+            return None
+        if start != size:
+            result = {k: v[:start] for k, v in result.items()}
+        return result
+    elif library == "ak":
+        import awkward as ak
+
+        columns: dict[str, _ColumnFill] = None
+        parameters, start = None, 0
+        for part in data:
+            layout = ak.to_layout(part)
+            if columns is None:
+                if not isinstance(layout, ak.contents.RecordArray) or layout.is_tuple:
+                    return concat_record([part, *data], library=library)
+                parameters = layout.parameters
+                columns = {
+                    k: _ColumnFill(layout.content(k), size) for k in layout.fields
+                }
+            for k, column in columns.items():
+                column.fill(layout.content(k))
+            start += layout.length
+            part = layout = None
+        if columns is None:
+            return None
+        return ak.Array(
+            ak.contents.RecordArray(
+                [column.finish() for column in columns.values()],
+                [*columns],
+                length=start,
+                parameters=parameters,
+            )
+        )
+    else:
+        return concat_record([*data], library=library)
+
+
+def _record_contents(data) -> dict[str, awkward.contents.Content] | None:
+    import awkward as ak
+
+    layout = data.layout
+    if (
+        not (data.behavior or data.attrs)
+        and isinstance(layout, ak.contents.RecordArray)
+        and not layout.is_tuple
+        and layout.backend.name == "cpu"
+    ):
+        return {k: layout.content(k) for k in layout.fields}
+
+
 def merge_record(data: list, library: Backends = ...):
     if library is ...:
         library = record_backend(data, sequence=True)
@@ -138,6 +348,12 @@ def merge_record(data: list, library: Backends = ...):
     if library == "ak":
         import awkward as ak
 
+        contents = [*map(_record_contents, data)]
+        if all(c is not None for c in contents):
+            if (
+                layout := _NestedRecord(reduce(op.or_, contents)).to_layout()
+            ) is not None:
+                return ak.Array(layout)
         return ak.zip(
             reduce(op.or_, (dict(zip(ak.fields(arr), ak.unzip(arr))) for arr in data)),
             depth_limit=1,
@@ -197,7 +413,9 @@ def rename_record(
         import awkward as ak
 
         nested = _NestedRecord()
-        for k, v in zip(ak.fields(data), ak.unzip(data)):
+        if (contents := _record_contents(data)) is None:
+            contents = dict(zip(ak.fields(data), ak.unzip(data)))
+        for k, v in contents.items():
             nested[mapping(k)] = v
         return nested.to_array()
     elif library == "pd":
@@ -0,0 +1,220 @@
+"""
+Copy compressed :class:`TBasket` between :class:`TTree` without decompression.
+
+.. warning::
+    This module relies on the internals of :mod:`uproot.writing`.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import defaultdict
+from queue import Queue
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from uproot.behaviors.TBranch import HasBranches
+    from uproot.writing.writable import WritableTree
+
+_KEY_HEADER = struct.Struct(">ihiIh")
+_KEY_SEEK_SMALL = struct.Struct(">ii")
+_KEY_SEEK_BIG = struct.Struct(">qq")
+_KEY_SEEK_START = 18
+_MAX_SMALL_SEEK = 2**31 - 1
+_COUNTER_DTYPE = ">i4"
+
+
+def _dtype_of(interpretation):
+    import numpy as np
+    from uproot.interpretation.numerical import AsDtype
+    from uproot.writing._cascadetree import _dtype_to_char
+
+    if type(interpretation) is not AsDtype:
+        return None
+    dtype = np.dtype(interpretation.from_dtype)
+    base = dtype if dtype.subdtype is None else dtype.subdtype[0]
+    if base.newbyteorder(">") not in _dtype_to_char:
+        return None
+    return dtype
+
+
+def basket_layout(tree: HasBranches, branches: Iterable[str]) -> Optional[dict]:
+    """
+    Get the layout of ``branches`` in ``tree``.
+
+    Returns
+    -------
+    dict or None
+        A mapping from branch name to ``(kind, dtype, counter)``. ``None`` if any branch cannot be copied.
+    """
+    from uproot.interpretation.jagged import AsJagged
+
+    layout = {}
+    for name in branches:
+        branch = tree[name]
+        interpretation = branch.interpretation
+        if isinstance(interpretation, AsJagged):
+            counter = branch.count_branch
+            dtype = _dtype_of(interpretation.content)
+            if (
+                counter is None
+                or interpretation.header_bytes != 0
+                or dtype is None
+                or dtype.subdtype is not None
+                or _dtype_of(counter.interpretation) != _COUNTER_DTYPE
+            ):
+                return None
+            layout[name] = ("jagged", dtype, counter.name)
+            layout[counter.name] = ("counter", _COUNTER_DTYPE, None)
+        elif (dtype := _dtype_of(interpretation)) is not None:
+            layout.setdefault(name, ("normal", dtype, None))
+        else:
+            return None
+    return layout
+
+
+def basket_compression(
+    tree: HasBranches, branches: Iterable[str]
+) -> dict[str, tuple[int, int]]:
+    """
+    Get the compression of ``branches`` in ``tree``.
+
+    Returns
+    -------
+    dict[str, tuple[int, int]]
+        A mapping from branch name to the ``fCompress`` code of the branch and the file. The file code applies when the branch does not set its own.
+    """
+    file = tree.file.fCompress
+    return {name: (tree[name].member("fCompress"), file) for name in branches}
+
+
+def basket_types(layout: dict) -> Optional[dict]:
+    """
+    Get the branch types used by :meth:`uproot.writing.writable.WritableDirectory.mktree` to reproduce ``layout``.
+
+    Returns
+    -------
+    dict or None
+        ``None`` if the layout cannot be reproduced with the default naming.
+    """
+    import awkward as ak
+    import numpy as np
+
+    def ak_type(dtype):
+        return ak.types.NumpyType(
+            ak.types.numpytype.dtype_to_primitive(np.dtype(dtype).newbyteorder("="))
+        )
+
+    types = {}
+    jagged = defaultdict(dict)
+    for name, (kind, dtype, counter) in layout.items():
+        if kind == "normal":
+            types[name] = np.dtype(dtype).newbyteorder("=")
+        elif kind == "jagged":
+            jagged[counter][name] = dtype
+    for counter, fields in jagged.items():
+        prefix = counter[1:]
+        if not counter.startswith("n") or prefix in types:
+            return None
+        if fields.keys() == {prefix}:
+            types[prefix] = ak.types.ListType(ak_type(fields[prefix]))
+        elif all(k.startswith(f"{prefix}_") for k in fields):
+            types[prefix] = ak.types.ListType(
+                ak.types.RecordType(
+                    [ak_type(v) for v in fields.values()],
+                    [k.removeprefix(f"{prefix}_") for k in fields],
+                )
+            )
+        else:
+            return None
+    return types
+
+
+def basket_aligned(tree: HasBranches, branches: Iterable[str]) -> Optional[int]:
+    """
+    Check if all ``branches`` share the same basket boundaries without embedded baskets.
+
+    Returns
+    -------
+    int or None
+        Number of baskets. ``None`` if the baskets are not aligned.
+    """
+    import numpy as np
+
+    edges = None
+    for name in branches:
+        branch = tree[name]
+        if len(branch.embedded_baskets) > 0:
+            return None
+        offsets = np.asarray(branch.entry_offsets)
+        if edges is None:
+            edges = offsets
+        elif not np.array_equal(edges, offsets):
+            return None
+    if edges is None or edges[-1] != tree.num_entries:
+        return None
+    return len(edges) - 1
+
+
+def copy_baskets(output: WritableTree, tree: HasBranches, branches: list[str]):
+    """
+    Append the compressed baskets of ``branches`` in ``tree`` to ``output``. Only the seek locations in the :class:`TKey` are updated.
+    """
+    cascade = output._cascading
+    sink = output._file.sink
+    source = tree.file.source
+    parent = cascade._directory.key.location
+    branches = [tree[name] for name in branches]
+    data = [cascade._branch_data[cascade._branch_lookup[b.name]] for b in branches]
+    for branch, datum in zip(branches, data):
+        if datum["kind"] == "counter":
+            datum["tleaf_maximum_value"] = max(
+                datum["tleaf_maximum_value"],
+                branch.member("fLeaves")[0].member("fMaximum"),
+            )
+        elif datum["counter"] is not None:
+            datum["fEntryOffsetLen"] = max(
+                datum["fEntryOffsetLen"], branch.member("fEntryOffsetLen")
+            )
+    edges = branches[0].entry_offsets
+    for i in range(len(edges) - 1):
+        if cascade._num_baskets >= cascade._basket_capacity - 1:
+            raise RuntimeError("Basket capacity exceeded.")
+        ranges = []
+        for branch in branches:
+            start = int(branch.member("fBasketSeek")[i])
+            ranges.append((start, start + int(branch.member("fBasketBytes")[i])))
+        chunks = source.chunks(ranges, notifications=Queue())
+        num_entries = edges[i + 1] - edges[i]
+        total_bytes = zip_bytes = 0
+        for chunk, datum in zip(chunks, data):
+            chunk.wait()
+            basket = bytearray(chunk.raw_data)
+            n_bytes, version, obj_len, _, key_len = _KEY_HEADER.unpack_from(basket)
+            if n_bytes != len(basket):
+                raise RuntimeError(f'Corrupted basket in branch "{datum["fName"]}".')
+            location = cascade._freesegments.allocate(n_bytes, dry_run=False)
+            if version > 1000:
+                _KEY_SEEK_BIG.pack_into(basket, _KEY_SEEK_START, location, parent)
+            elif location <= _MAX_SMALL_SEEK:
+                _KEY_SEEK_SMALL.pack_into(basket, _KEY_SEEK_START, location, parent)
+            else:
+                raise RuntimeError("Cannot relocate a small TKey beyond 2 GiB.")
+            sink.write(location, basket)
+            total_bytes += key_len + obj_len
+            zip_bytes += n_bytes
+            datum["fTotBytes"] += key_len + obj_len
+            datum["fZipBytes"] += n_bytes
+            datum["fBasketBytes"][cascade._num_baskets] = n_bytes
+            datum["fBasketEntry"][cascade._num_baskets + 1] = (
+                datum["fBasketEntry"][cascade._num_baskets] + num_entries
+            )
+            datum["fBasketSeek"][cascade._num_baskets] = location
+            datum["arrays_write_stop"] = cascade._num_baskets + 1
+        cascade._num_entries += num_entries
+        cascade._num_baskets += 1
+        cascade._metadata["fTotBytes"] += total_bytes
+        cascade._metadata["fZipBytes"] += zip_bytes
+    cascade._freesegments.write(sink)
+    sink.set_file_length(cascade._freesegments.fileheader.end)
+    cascade.write_updates(sink)
@@ -0,0 +1,256 @@
+"""
+A persistent local cache of decompressed columns backed by memory-mapped files.
+
+.. note::
+    The cache is disabled unless :data:`ColumnCache.directory` is set. Each column is stored in a separate file keyed by the UUID, tree name, branch name and entry range of the chunk, and will be memory-mapped when read. After each store, the directory is rescanned and the least recently used files are removed once the total size exceeds :data:`ColumnCache.max_bytes`, so the limit also holds when the directory is shared by multiple processes. The files that cannot be loaded are removed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, Literal
+
+from ..config import Configurable, config
+
+if TYPE_CHECKING:
+    import awkward as ak
+
+    from .chunk import Chunk
+
+__all__ = ["ColumnCache", "column_cache"]
+
+_HEADER = struct.Struct("<Q")
+_ALIGN = 64
+_SUFFIX = ".column"
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _dump_column(path: str, array: ak.Array):
+    import awkward as ak
+    import numpy as np
+
+    form, length, container = ak.to_buffers(array)
+    buffers = []
+    offset = 0
+    for key, buffer in container.items():
+        buffer = np.ascontiguousarray(buffer)
+        offset = _aligned(offset)
+        buffers.append((key, buffer.dtype.str, offset, buffer.nbytes))
+        container[key] = buffer
+        offset += buffer.nbytes
+    header = json.dumps(
+        {"form": form.to_dict(), "length": length, "buffers": buffers}
+    ).encode()
+    start = _aligned(_HEADER.size + len(header))
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(len(header)))
+        f.write(header)
+        for key, _, offset, _ in buffers:
+            f.write(b"\x00" * (start + offset - f.tell()))
+            f.write(container[key].data)
+
+
+def _load_column(path: str) -> tuple[dict, ak.Array]:
+    import awkward as ak
+    import numpy as np
+
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    (size,) = _HEADER.unpack(data[: _HEADER.size].tobytes())
+    header = json.loads(data[_HEADER.size : _HEADER.size + size].tobytes())
+    start = _aligned(_HEADER.size + size)
+    container = {}
+    for key, dtype, offset, nbytes in header["buffers"]:
+        offset += start
+        container[key] = data[offset : offset + nbytes].view(dtype)
+    return header["form"], ak.from_buffers(header["form"], header["length"], container)
+
+
+def _is_numpy(form: dict, library: Literal["ak", "pd", "np"]) -> bool:
+    if library == "ak":
+        return True
+    if form.get("class") != "NumpyArray":
+        return False
+    return library == "np" or not form.get("inner_shape")
+
+
+class ColumnCache(Configurable, namespace="root.ColumnCache"):
+    """
+    Store the decompressed columns read by :class:`~.io.TreeReader`.
+    """
+
+    directory = config(None)
+    """str : Directory to store the cached columns. If ``None``, the cache is disabled."""
+    max_bytes = config(16 * 1024**3)
+    """int : Maximum total size of the cached columns in bytes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._directory: str = None
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+
+    @property
+    def enabled(self):
+        """bool : Whether the cache is enabled."""
+        return self.directory is not None
+
+    def _scan(self, rescan: bool = False) -> str:
+        directory = os.fspath(self.directory)
+        if rescan or directory != self._directory:
+            os.makedirs(directory, exist_ok=True)
+            files = []
+            for entry in os.scandir(directory):
+                if entry.name.endswith(_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, entry.name, stat.st_size))
+            self._files = OrderedDict((name, size) for _, name, size in sorted(files))
+            self._size = sum(self._files.values())
+            self._directory = directory
+        return directory
+
+    def _forget(self, name: str):
+        self._size -= self._files.pop(name, 0)
+
+    def _evict(self, directory: str):
+        while self._size > self.max_bytes and self._files:
+            name, size = self._files.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                ...
+
+    @classmethod
+    def _key(cls, chunk: Chunk, branch: str) -> str:
+        key = json.dumps(
+            [str(chunk.uuid), chunk.name, branch, chunk.entry_start, chunk.entry_stop]
+        )
+        return hashlib.sha1(key.encode()).hexdigest() + _SUFFIX
+
+    def get(
+        self,
+        chunk: Chunk,
+        branches: Iterable[str],
+        library: Literal["ak", "pd", "np"] = "ak",
+    ) -> dict[str, ak.Array]:
+        """
+        Load the cached columns of ``chunk``.
+
+        Parameters
+        ----------
+        chunk : Chunk
+            Chunk of :class:`TTree`.
+        branches : ~typing.Iterable[str]
+            Name of branches.
+        library : ~typing.Literal['ak', 'np', 'pd'], optional, default='ak'
+            The library to represent the arrays. For ``library='np'`` and ``library='pd'``, only the columns that can be converted to :class:`numpy.ndarray` without copy will be loaded.
+
+        Returns
+        -------
+        dict[str, ak.Array]
+            A mapping from branch name to memory-mapped array. The missing columns are not included.
+        """
+        if not self.enabled:
+            return {}
+        names = {}
+        with self._lock:
+            directory = self._scan()
+            for branch in branches:
+                name = self._key(chunk, branch)
+                if name in self._files:
+                    self._files.move_to_end(name)
+                    names[branch] = name
+        found = {}
+        for branch, name in names.items():
+            path = os.path.join(directory, name)
+            try:
+                form, array = _load_column(path)
+                os.utime(path)
+            except Exception as e:
+                if not isinstance(e, FileNotFoundError):
+                    logging.warning(
+                        f'Failed to load cached column "{path}"', exc_info=e
+                    )
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        ...
+                with self._lock:
+                    self._forget(name)
+                continue
+            if _is_numpy(form, library):
+                found[branch] = array
+        return found
+
+    def put(self, chunk: Chunk, columns: dict[str, ak.Array]):
+        """
+        Store ``columns`` of ``chunk``. The columns larger than :data:`max_bytes` will be skipped.
+
+        Parameters
+        ----------
+        chunk : Chunk
+            Chunk of :class:`TTree`.
+        columns : dict[str, ak.Array]
+            A mapping from branch name to array.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            directory = self._scan()
+        for branch, array in columns.items():
+            if array.nbytes > self.max_bytes:
+                continue
+            name = self._key(chunk, branch)
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=directory)
+            os.close(fd)
+            try:
+                _dump_column(tmp, array)
+                size = os.path.getsize(tmp)
+                os.replace(tmp, os.path.join(directory, name))
+            except Exception as e:
+                logging.warning(f'Failed to cache column "{branch}"', exc_info=e)
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    ...
+                continue
+            with self._lock:
+                self._forget(name)
+                self._files[name] = size
+                self._size += size
+        with self._lock:
+            # the directory may be shared with other processes
+            self._evict(self._scan(rescan=True))
+
+    def clear(self):
+        """
+        Remove all cached columns.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            directory = self._scan()
+            self._files, files = OrderedDict(), self._files
+            self._size = 0
+        for name in files:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                ...
+
+
+column_cache = ColumnCache()
+"""ColumnCache : The cache used by :mod:`heptools.root`."""
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING, Generator, Iterable, Literal, overload
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Literal, overload
+from uuid import uuid4
 
 from ._backend import (
     NameMapping,
+    _NestedRecord,
     apply_naming,
     keyof_record,
     merge_record,
@@ -13,7 +20,8 @@ from ._backend import (
 )
 from .chunk import Chunk
 from .friend import Friend
-from .io import BRANCH_FILTER, ReaderOptions, TreeReader
+from .io import BRANCH_FILTER, ReaderOptions, TreeReader, _prefetch
+from .pool import file_pool
 
 if TYPE_CHECKING:
     import awkward as ak
@@ -47,6 +55,9 @@ def _merge_data_impl(
     return merge_record(data, library=library)
 
 
+_timing_lock = threading.Lock()
+
+
 @dataclass
 class _read_method:
     method: Literal["dask", "concat"]
@@ -55,6 +66,170 @@ class _read_method:
         return getattr(obj, self.method)(*args, **kwargs)
 
 
+@dataclass
+class _timed_read:
+    timing: dict[str, dict[str, float]]
+    source: str
+    read: Callable[[], DelayedRecordLike]
+
+    def __call__(self):
+        start = time.perf_counter()
+        try:
+            return self.read()
+        finally:
+            elapsed = time.perf_counter() - start
+            with _timing_lock:
+                timing = self.timing.setdefault(
+                    self.source, {"count": 0, "total": 0.0, "max": 0.0}
+                )
+                timing["count"] += 1
+                timing["total"] += elapsed
+                timing["max"] = max(timing["max"], elapsed)
+
+
+def _conform(data: ak.Array, form: ak.forms.Form) -> ak.Array:
+    # the buffers are matched to the form by position
+    import awkward as ak
+
+    if not isinstance(form, ak.forms.RecordForm) or form.is_tuple:
+        return data
+    return ak.zip(
+        {field: _conform(data[field], form.content(field)) for field in form.fields},
+        depth_limit=1,
+    )
+
+
+class LazyRecord(Mapping):
+    """
+    A read-only mapping returned by :meth:`Chain.concat` with ``lazy=True``. Each column is read from the chunks and friend trees the first time it is accessed.
+
+    The keys are the top-level fields of the output record. A nested record created by ``renaming`` is read as a whole.
+    """
+
+    def __init__(
+        self,
+        read: Callable[[ReaderOptions], RecordLike],
+        columns: dict[str, list[tuple[str, str, tuple[str, ...]]]],
+        forms: Callable[[], dict],
+        length: int,
+        library: Literal["ak", "np"],
+        reader_options: ReaderOptions,
+    ):
+        self._read = read
+        self._columns = columns
+        self._forms = forms
+        self._length = length
+        self._library = library
+        self._options = reader_options
+        self._lock = threading.Lock()
+        self._reading: dict[str, threading.Lock] = {}
+        self._loaded: dict[str, RecordLike] = {}
+        self._buffers: dict[str, dict] = {}
+        self._array_forms: dict[str, ak.forms.Form] = {}
+        self._array = None
+
+    def __getitem__(self, key: str):
+        if key not in self._columns:
+            raise KeyError(key)
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+            reading = self._reading.setdefault(key, threading.Lock())
+        # only the reads of the same key are serialized
+        with reading:
+            with self._lock:
+                if key in self._loaded:
+                    return self._loaded[key]
+            options = self._options.copy()
+            options[BRANCH_FILTER] = self._branches(key).intersection
+            data = self._read(options)[key]
+            with self._lock:
+                self._loaded[key] = data
+                self._reading.pop(key, None)
+            return data
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({[*self._columns]}, used={sorted(self.used)})"
+
+    def _branches(self, key: str) -> frozenset[str]:
+        return frozenset(branch for _, branch, _ in self._columns[key])
+
+    @property
+    def used(self) -> frozenset[str]:
+        """frozenset[str] : The keys that have been accessed."""
+        return frozenset(self._loaded)
+
+    @property
+    def branches(self) -> frozenset[str]:
+        """frozenset[str] : The branches in the main and friend trees read so far."""
+        return frozenset().union(*map(self._branches, self._loaded))
+
+    @property
+    def branch_filter(self) -> Callable[[set[str]], set[str]]:
+        """~typing.Callable[[set[str]], set[str]] : A ``branch_filter`` that only selects :data:`branches`, which can be passed to the ``reader_options`` of the next run."""
+        return self.branches.intersection
+
+    def _buffer(self, key: str, form_key: str, buffer: str):
+        import awkward as ak
+
+        with self._lock:
+            buffers = self._buffers.get(key)
+        if buffers is None:
+            _, _, buffers = ak.to_buffers(
+                _conform(self[key], self._array_forms[key]), form_key=form_key
+            )
+            with self._lock:
+                self._buffers[key] = buffers
+        return buffers[buffer]
+
+    @property
+    def array(self) -> ak.Array:
+        """ak.Array : An array with virtual buffers. Only available for ``library='ak'``."""
+        if self._library != "ak":
+            raise ValueError(f'"array" is not available for library="{self._library}"')
+        if self._array is None:
+            import awkward as ak
+
+            forms = self._forms()
+            contents = []
+            container = {}
+            for i, (key, form) in enumerate(forms.items()):
+                form_key = f"{i}-{{id}}"
+                form, _, buffers = ak.to_buffers(
+                    form.length_zero_array(), form_key=form_key
+                )
+                contents.append(form)
+                self._array_forms[key] = form
+                for buffer in buffers:
+                    container[buffer] = partial(self._buffer, key, form_key, buffer)
+            self._array = ak.from_buffers(
+                ak.forms.RecordForm(contents, [*forms]), self._length, container
+            )
+        return self._array
+
+    def materialize(self) -> RecordLike:
+        """
+        Read all columns.
+
+        Returns
+        -------
+        RecordLike
+            The same record as :meth:`Chain.concat` with ``lazy=False``.
+        """
+        data = {key: self[key] for key in self._columns}
+        if self._library == "ak":
+            import awkward as ak
+
+            return ak.zip(data, depth_limit=1)
+        return data
+
+
 class Chain:
     """
     A :class:`TChain` like object to manage multiple :class:`~.chunk.Chunk` and :class:`Friend`.
@@ -87,6 +262,7 @@ class Chain:
         self._chunks: list[Chunk] = []
         self._friends: dict[str, Friend] = {}
         self._rename: dict[str, str | NameMapping] = {}
+        self._timing: dict[str, dict[str, float]] = {}
 
     def add_chunk(self, *chunks: Chunk):
         """
@@ -156,6 +332,19 @@ class Chain:
         chain._rename |= self._rename
         return chain
 
+    @property
+    def timing(self) -> dict[str | None, dict[str, float]]:
+        """dict[str | None, dict[str, float]] : The ``count``, ``total`` and ``max`` seconds spent on reading each friend tree. The main tree is stored under ``None``."""
+        with _timing_lock:
+            return {k: v.copy() for k, v in self._timing.items()}
+
+    def reset_timing(self):
+        """
+        Clear :data:`timing`.
+        """
+        with _timing_lock:
+            self._timing.clear()
+
     def __iadd__(self, other) -> Chain:
         if isinstance(other, Chunk):
             return self.add_chunk(other)
@@ -180,7 +369,11 @@ class Chain:
         return NotImplemented
 
     def _filter(
-        self, chunks: tuple[Chunk], reader_options: ReaderOptions, friend_only: bool
+        self,
+        chunks: tuple[Chunk],
+        reader_options: ReaderOptions,
+        friend_only: bool,
+        usage: dict[str, frozenset[str]] = None,
     ) -> tuple[dict[str, ReaderOptions], ReaderOptions]:
         output = set()
         b_filter = reader_options.get(BRANCH_FILTER, lambda x: x)
@@ -207,12 +400,19 @@ class Chain:
                 output.difference_update(branches)
                 if renames is not None:
                     branches = {renames[b] for b in branches}
+                if usage is not None:
+                    branches = branches.intersection(usage.get(name, ()))
+                    if not branches:
+                        opt_friends[name] = None
+                        continue
                 opt = reader_options.copy()
                 opt[BRANCH_FILTER] = branches.intersection
                 opt_friends[name] = opt
         opt_main = None
         if not friend_only:
             branches = b_main.intersection(output)
+            if usage is not None:
+                branches = branches.intersection(usage.get(None, ()))
             if branches:
                 opt_main = reader_options.copy()
                 opt_main[BRANCH_FILTER] = branches.intersection
@@ -225,26 +425,45 @@ class Chain:
         reader_options: ReaderOptions,
         friend_only: bool = False,
         method: Literal["dask", "concat"] = "concat",
+        usage: dict[str, frozenset[str]] = None,
+        executor: Executor = None,
     ):
         reader = _read_method(method)
-        opt_friends, opt_main = self._filter(chunks, reader_options or {}, friend_only)
-        friends = {}
+        opt_friends, opt_main = self._filter(
+            chunks, reader_options or {}, friend_only, usage
+        )
+        jobs: dict[str, Callable[[], DelayedRecordLike]] = {}
+        if not (friend_only or (opt_main is None)):
+            jobs[None] = partial(
+                reader, TreeReader(**opt_main), *chunks, library=library
+            )
         for name, friend in self._friends.items():
             opt = opt_friends[name]
             if opt is not None:
-                data = reader(
+                jobs[name] = partial(
+                    reader,
                     friend,
                     *chunks,
                     library=library,
                     reader_options=opt,
                 )
-                if data is None or len(keyof_record(data, library)) == 0:
-                    continue
-                friends[name] = data
-        if friend_only or (opt_main is None):
-            main = None
+        if method == "concat":
+            jobs = {k: _timed_read(self._timing, k, v) for k, v in jobs.items()}
+        if executor is None or len(jobs) < 2:
+            results = {k: v() for k, v in jobs.items()}
         else:
-            main = reader(TreeReader(**opt_main), *chunks, library=library)
+            futures = {k: executor.submit(v) for k, v in jobs.items()}
+            try:
+                results = {k: v.result() for k, v in futures.items()}
+            finally:
+                for future in futures.values():
+                    future.cancel()
+        main = results.pop(None, None)
+        friends = {}
+        for name, data in results.items():
+            if data is None or len(keyof_record(data, library)) == 0:
+                continue
+            friends[name] = data
         return main, friends
 
     def _non_dask(
@@ -253,6 +472,7 @@ class Chain:
         library: Literal["ak", "pd", "np"],
         reader_options: ReaderOptions,
         friend_only: bool = False,
+        executor: Executor = None,
     ) -> RecordLike:
         return _merge_data_impl(
             *self._fetch(
@@ -261,6 +481,7 @@ class Chain:
                 reader_options,
                 friend_only,
                 "concat",
+                executor=executor,
             ),
             self._rename,
             library,
@@ -272,6 +493,8 @@ class Chain:
         library: Literal["ak"] = "ak",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        lazy: bool = False,
+        concurrency: int = ...,
     ) -> ak.Array: ...
 
     @overload
@@ -280,6 +503,8 @@ class Chain:
         library: Literal["pd"] = "pd",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        lazy: bool = False,
+        concurrency: int = ...,
     ) -> pd.DataFrame: ...
 
     @overload
@@ -288,6 +513,8 @@ class Chain:
         library: Literal["np"] = "np",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        lazy: bool = False,
+        concurrency: int = ...,
     ) -> dict[str, np.ndarray]: ...
 
     def concat(
@@ -295,6 +522,8 @@ class Chain:
         library: Literal["ak", "pd", "np"] = "ak",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        lazy: bool = False,
+        concurrency: int = ...,
     ) -> RecordLike:
         """
         Read all chunks and friend trees into one record.
@@ -307,27 +536,151 @@ class Chain:
             Additional options passed to :class:`~.io.TreeReader`.
         friend_only : bool, optional, default=False
             If ``True``, only read friend trees.
+        lazy : bool, optional, default=False
+            If ``True``, return a :class:`LazyRecord` and only read the columns when they are accessed. Only available for ``library='ak'`` and ``library='np'``.
+        concurrency : int, optional
+            If given, read the main tree and friend trees concurrently with up to ``concurrency`` threads. The time spent on each tree is recorded in :data:`timing`.
 
         Returns
         -------
-        RecordLike
+        RecordLike or LazyRecord
             Concatenated data.
+
+        Examples
+        --------
+        Use :data:`LazyRecord.branch_filter` to narrow down the branches for the next run:
+
+        .. code-block:: python
+
+            >>> record = chain.concat(lazy=True)
+            >>> events = record.array
+            >>> ... # only the accessed columns are read
+            >>> branch_filter = record.branch_filter
         """
-        return self._non_dask(
-            self._chunks,
-            library=library,
-            reader_options=reader_options,
-            friend_only=friend_only,
+        if lazy:
+            return self._lazy(self._chunks, library, reader_options or {}, friend_only)
+        if concurrency is ...:
+            return self._non_dask(
+                self._chunks,
+                library=library,
+                reader_options=reader_options,
+                friend_only=friend_only,
+            )
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return self._non_dask(
+                self._chunks,
+                library=library,
+                reader_options=reader_options,
+                friend_only=friend_only,
+                executor=pool,
+            )
+
+    def _lazy(
+        self,
+        chunks: list[Chunk],
+        library: Literal["ak", "np"],
+        reader_options: ReaderOptions,
+        friend_only: bool,
+    ):
+        if library not in ("ak", "np"):
+            raise ValueError(f'Lazy record is not supported for library="{library}"')
+        columns = self._columns(chunks, reader_options, friend_only)
+        return LazyRecord(
+            partial(self._non_dask, chunks, library, friend_only=friend_only),
+            columns,
+            partial(self._lazy_forms, chunks[0], columns),
+            sum(map(len, chunks)),
+            library,
+            reader_options,
         )
 
+    def _columns(
+        self,
+        chunks: list[Chunk],
+        reader_options: ReaderOptions,
+        friend_only: bool,
+    ) -> dict[str, list[tuple[str, str, tuple[str, ...]]]]:
+        b_filter = reader_options.get(BRANCH_FILTER, lambda x: x)
+        columns: defaultdict[str, list[tuple[str, str, tuple[str, ...]]]] = defaultdict(
+            list
+        )
+        if not friend_only:
+            for branch in sorted(b_filter(Chunk.common(*chunks)[0].branches)):
+                columns[branch].append((None, branch, ()))
+        for name, friend in self._friends.items():
+            rename = self._rename.get(name)
+            for branch in sorted(b_filter(friend.branches)):
+                key = branch
+                if rename is not None:
+                    key = _rename_wrapper(branch, name, rename)
+                if isinstance(key, tuple):
+                    key, subkey = key[0], key[1:]
+                else:
+                    subkey = ()
+                columns[key].append((name, branch, subkey))
+        return dict(columns)
+
+    def _lazy_forms(
+        self,
+        chunk: Chunk,
+        columns: dict[str, list[tuple[str, str, tuple[str, ...]]]],
+        labels: list[tuple[str, str]] = None,
+    ):
+        import awkward as ak
+
+        sources: defaultdict[str, set[str]] = defaultdict(set)
+        for fields in columns.values():
+            for source, branch, _ in fields:
+                sources[source].add(branch)
+        forms = {}
+        for source, branches in sources.items():
+            tree = chunk
+            if source is not None:
+                tree = self._friends[source]._match_chunks(chunk)[0]
+            with file_pool.open(tree.path, tree._uuid) as file:
+                tree = file[tree.name]
+                for branch in branches:
+                    form = tree[branch].interpretation.awkward_form(tree.file)
+                    if labels is not None:
+                        form, _, _ = ak.to_buffers(
+                            form.length_zero_array(), form_key=f"{len(labels)}-{{id}}"
+                        )
+                        labels.append((source, branch))
+                    forms[source, branch] = form
+
+        def to_form(nested):
+            if isinstance(nested, _NestedRecord):
+                return ak.forms.RecordForm(
+                    [to_form(v) for v in nested.values()], [*nested]
+                )
+            return nested
+
+        output = {}
+        for key, fields in columns.items():
+            nested = None
+            for source, branch, subkey in fields:
+                if not subkey:
+                    nested = forms[source, branch]
+                else:
+                    if not isinstance(nested, _NestedRecord):
+                        nested = _NestedRecord()
+                    nested[subkey] = forms[source, branch]
+            output[key] = to_form(nested)
+        return output
+
     @overload
     def iterate(
         self,
         step: int = ...,
         library: Literal["ak"] = "ak",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
+        concurrency: int = ...,
     ) -> Generator[ak.Array, None, None]: ...
 
     @overload
@@ -335,9 +688,14 @@ class Chain:
         self,
         step: int = ...,
         library: Literal["pd"] = "pd",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
+        concurrency: int = ...,
     ) -> Generator[pd.DataFrame, None, None]: ...
 
     @overload
@@ -345,18 +703,28 @@ class Chain:
         self,
         step: int = ...,
         library: Literal["np"] = "np",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
+        concurrency: int = ...,
     ) -> Generator[dict[str, np.ndarray], None, None]: ...
 
     def iterate(
         self,
         step: int = ...,
         library: Literal["ak", "pd", "np"] = "ak",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
+        concurrency: int = ...,
     ) -> Generator[RecordLike, None, None]:
         """
         Iterate over chunks and friend trees.
@@ -367,34 +735,97 @@ class Chain:
             Number of entries to read in each iteration step. If not given, the chunk size will be used and the ``mode`` will be ignored.
         library : ~typing.Literal['ak', 'np', 'pd'], optional, default='ak'
             The library used to represent arrays.
-        mode : ~typing.Literal['balance', 'partition'], optional, default='partition'
-            The mode to generate iteration steps. See :meth:`~.io.TreeReader.iterate` for details.
+        mode : ~typing.Literal['balance', 'partition', 'basket'], optional, default='partition'
+            The mode to generate iteration steps. See :meth:`~.io.TreeReader.iterate` for details. The ``mode='basket'`` only aligns to the :class:`TBasket` of the main tree.
         reader_options : dict, optional
             Additional options passed to :class:`~.io.TreeReader`.
         friend_only : bool, optional, default=False
             If ``True``, only read friend trees.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``step``. See :meth:`~.io.TreeReader.iterate` for details. The size is estimated from the main tree only.
+        prefetch : int, optional
+            If given, read up to ``prefetch`` steps ahead in the background. See :meth:`~.io.TreeReader.iterate` for details.
+        executor : ~concurrent.futures.Executor, optional
+            An executor used to read the prefetched steps. See :meth:`~.io.TreeReader.iterate` for details.
+        max_bytes : int, optional
+            The memory budget of prefetched steps. See :meth:`~.io.TreeReader.iterate` for details.
+        concurrency : int, optional
+            If given, read the main tree and friend trees in each step concurrently with up to ``concurrency`` threads. The time spent on each tree is recorded in :data:`timing`. The ``executor`` must be thread-based in this case, since the steps share the thread pool and :data:`timing` of ``self``.
 
         Yields
         ------
         RecordLike
             A chunk of merged data from main and friend :class:`TTree`.
         """
+        if prefetch is not ... and prefetch < 1:
+            raise ValueError(f"prefetch must be a positive integer, got {prefetch}.")
+        if concurrency is not ... and isinstance(executor, ProcessPoolExecutor):
+            raise ValueError(
+                "concurrency cannot be used with a process-based executor, please use a thread-based executor instead."
+            )
+        split = dict(
+            common_branches=True,
+            unit=unit,
+            branch_filter=(reader_options or {}).get(BRANCH_FILTER),
+        )
         if step is ...:
             chunks = Chunk.common(*self._chunks)
         elif mode == "partition":
-            chunks = Chunk.partition(step, *self._chunks, common_branches=True)
+            chunks = Chunk.partition(step, *self._chunks, **split)
         elif mode == "balance":
-            chunks = Chunk.balance(step, *self._chunks, common_branches=True)
+            chunks = Chunk.balance(step, *self._chunks, **split)
+        elif mode == "basket":
+            chunks = Chunk.basket(step, *self._chunks, **split)
         else:
             raise ValueError(f'Unknown mode "{mode}"')
-        for chunk in chunks:
-            if not isinstance(chunk, list):
-                chunk = (chunk,)
-            yield self._non_dask(
-                chunk,
-                library=library,
-                reader_options=reader_options,
-                friend_only=friend_only,
+        chunks = (chunk if isinstance(chunk, list) else (chunk,) for chunk in chunks)
+        if concurrency is ...:
+            yield from self._iterate(
+                chunks,
+                library,
+                reader_options,
+                friend_only,
+                prefetch,
+                executor,
+                max_bytes,
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                yield from self._iterate(
+                    chunks,
+                    library,
+                    reader_options,
+                    friend_only,
+                    prefetch,
+                    executor,
+                    max_bytes,
+                    pool,
+                )
+
+    def _iterate(
+        self,
+        chunks: Iterable[list[Chunk]],
+        library: Literal["ak", "pd", "np"],
+        reader_options: ReaderOptions,
+        friend_only: bool,
+        prefetch: int,
+        executor: Executor,
+        max_bytes: int,
+        pool: Executor = None,
+    ):
+        read = partial(
+            self._non_dask,
+            library=library,
+            reader_options=reader_options,
+            friend_only=friend_only,
+            executor=pool,
+        )
+        if prefetch is ...:
+            for chunk in chunks:
+                yield read(chunk)
+        else:
+            yield from _prefetch(
+                read, ((chunk,) for chunk in chunks), prefetch, executor, max_bytes
             )
 
     @overload
@@ -404,6 +835,9 @@ class Chain:
         library: Literal["ak"] = "ak",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
+        trace: Callable[[dak.Array], Any] = None,
     ) -> dak.Array: ...
 
     @overload
@@ -413,6 +847,9 @@ class Chain:
         library: Literal["np"] = "np",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
+        trace: Callable[[dak.Array], Any] = None,
     ) -> dict[str, da.Array]: ...
 
     def dask(
@@ -421,6 +858,9 @@ class Chain:
         library: Literal["ak", "np"] = "ak",
         reader_options: ReaderOptions = None,
         friend_only: bool = False,
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
+        trace: Callable[[dak.Array], Any] = None,
     ) -> DelayedRecordLike:
         """
         Read chunks and friend trees into delayed arrays.
@@ -438,17 +878,35 @@ class Chain:
             Additional options passed to :class:`~.io.TreeReader`.
         friend_only : bool, optional, default=False
             If ``True``, only read friend trees.
+        mode : ~typing.Literal['balance', 'basket'], optional, default='balance'
+            The mode to generate partitions. See :meth:`~.io.TreeReader.dask` for details. The ``mode='basket'`` only aligns to the :class:`TBasket` of the main tree.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``partition``. See :meth:`~.io.TreeReader.iterate` for details. The size is estimated from the main tree only.
+        trace : ~typing.Callable[[dak.Array], ~typing.Any], optional
+            If given, only read the branches used by ``trace``. See :meth:`trace` for details.
 
         Returns
         -------
         DelayedRecordLike
             Delayed data from main and friend :class:`TTree`.
         """
+        usage = None
+        if trace is not None:
+            usage = self.trace(trace, reader_options, friend_only)
         chunks = self._chunks
+        split = dict(
+            common_branches=True,
+            unit=unit,
+            branch_filter=(reader_options or {}).get(BRANCH_FILTER),
+        )
         if partition is ...:
             partitions = Chunk.common(*chunks)
+        elif mode == "balance":
+            partitions = [*Chunk.balance(partition, *chunks, **split)]
+        elif mode == "basket":
+            partitions = [*Chunk.basket(partition, *chunks, **split)]
         else:
-            partitions = [*Chunk.balance(partition, *chunks, common_branches=True)]
+            raise ValueError(f'Unknown mode "{mode}"')
         args = (
             *self._fetch(
                 partitions,
@@ -456,6 +914,7 @@ class Chain:
                 reader_options,
                 friend_only,
                 "dask",
+                usage,
             ),
             self._rename,
             library,
@@ -466,3 +925,72 @@ class Chain:
             from ..dask.awkward import partition_mapping
 
             return partition_mapping(_merge_data_impl, label="merge-friend-tree")(*args)
+
+    def trace(
+        self,
+        func: Callable[[dak.Array], Any],
+        reader_options: ReaderOptions = None,
+        friend_only: bool = False,
+    ) -> dict[str | None, frozenset[str]]:
+        """
+        Find the branches used by ``func`` in a dry run on a typetracer.
+
+        Parameters
+        ----------
+        func : ~typing.Callable[[dak.Array], ~typing.Any]
+            A function that takes the output of :meth:`dask` with ``library='ak'``. The data touched when building the graph and by the returned collections will be recorded. The graph given to ``func`` is a placeholder and should never be computed.
+        reader_options : dict, optional
+            Additional options passed to :class:`~.io.TreeReader`.
+        friend_only : bool, optional, default=False
+            If ``True``, only read friend trees.
+
+        Returns
+        -------
+        dict[str | None, frozenset[str]]
+            A mapping from the name of friend tree to the used branches before renaming. The branches of the main tree are stored under ``None``.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            >>> def analysis(events):
+            ...     return dak.sum(events.Jet_pt, axis=1)
+            >>> chain.trace(analysis)
+            {None: frozenset({'Jet_pt'})}
+            >>> result = analysis(chain.dask(partition=100_000, trace=analysis))
+        """
+        import awkward as ak
+        from dask.base import unpack_collections
+        from dask.highlevelgraph import HighLevelGraph
+        from dask_awkward.lib.core import new_array_object
+
+        labels: list[tuple[str, str]] = []
+        forms = self._lazy_forms(
+            self._chunks[0],
+            self._columns(self._chunks, reader_options or {}, friend_only),
+            labels,
+        )
+        layout, report = ak.typetracer.typetracer_with_report(
+            ak.forms.RecordForm([*forms.values()], [*forms])
+        )
+        name = f"chain-trace-{uuid4().hex}"
+        array = new_array_object(
+            HighLevelGraph.from_collections(name, {(name, 0): None}),
+            name,
+            meta=ak.Array(layout),
+            divisions=(None, None),
+        )
+        collections, _ = unpack_collections(func(array), traverse=True)
+        for collection in collections:
+            meta = getattr(collection, "_meta", None)
+            if isinstance(meta, (ak.Array, ak.Record)):
+                ak.typetracer.touch_data(meta)
+        if not report.data_touched and forms:
+            ak.typetracer.touch_data(layout.content(0))
+        usage: defaultdict[str, set[str]] = defaultdict(set)
+        for key in report.data_touched:
+            index, _, _ = str(key).partition("-")
+            if index.isdigit():
+                source, branch = labels[int(index)]
+                usage[source].add(branch)
+        return {k: frozenset(v) for k, v in usage.items()}
@@ -1,15 +1,164 @@
 from __future__ import annotations
 
+import asyncio
+import bisect
 import logging
+from collections import defaultdict
 from concurrent.futures import Executor
+from dataclasses import dataclass
 from functools import partial
-from typing import Iterable, Optional
+from itertools import accumulate
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Mapping, Optional
 from uuid import UUID
 
 from ..math.utils import balance_split
 from ..system.eos import EOS, PathLike
 from ..typetools import check_type
 from ..utils import map_executor
+from .index import metadata_index
+from .pool import file_pool
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_COLUMN_UNSET = -1
+_COLUMN_NONE = -2
+_COLUMN_INTS = ("num_entries", "entry_start", "entry_stop")
+
+
+def _encode_int(value) -> int:
+    if value is ...:
+        return _COLUMN_UNSET
+    if value is None:
+        return _COLUMN_NONE
+    return value
+
+
+def _decode_int(value: int):
+    if value == _COLUMN_UNSET:
+        return ...
+    if value == _COLUMN_NONE:
+        return None
+    return value
+
+
+def _encode_dict(values: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    lookup: dict[str, int] = {}
+    codes = np.fromiter(
+        (lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int32
+    )
+    return np.array([*lookup], dtype=str), codes
+
+
+class _ChunkColumns:
+    def __init__(self, columns: Mapping[str, np.ndarray], prefix: str = ""):
+        self._source = columns
+        self._keys = {
+            k.removeprefix(prefix): k for k in columns if k.startswith(prefix)
+        }
+        self._columns: dict[str, np.ndarray] = {}
+        self._paths: dict[int, EOS] = {}
+        self._names: dict[int, str] = {}
+        self._branches: dict[int, frozenset[str]] = {}
+
+    def __len__(self):
+        return len(self._column("path"))
+
+    def __getstate__(self):
+        columns = {k: self._column(k) for k in self._keys}
+        return self.__dict__ | {"_source": columns, "_keys": dict.fromkeys(columns)}
+
+    def __setstate__(self, state):
+        state["_keys"] = {k: k for k in state["_keys"]}
+        self.__dict__.update(state)
+
+    def _column(self, key: str) -> np.ndarray:
+        # the columns are read on first access, e.g. from a lazily loaded npz file
+        if key not in self._columns:
+            self._columns[key] = self._source[self._keys[key]]
+        return self._columns[key]
+
+    def _path(self, code: int):
+        if code not in self._paths:
+            self._paths[code] = EOS(str(self._column("path.dict")[code]))
+        return self._paths[code]
+
+    def _name(self, code: int):
+        if code not in self._names:
+            self._names[code] = str(self._column("name.dict")[code])
+        return self._names[code]
+
+    def _branch_set(self, code: int):
+        if code == _COLUMN_UNSET:
+            return ...
+        if code == _COLUMN_NONE:
+            return None
+        if code not in self._branches:
+            start, stop = self._column("branches.offsets")[code : code + 2]
+            names = self._column("branches.dict")[
+                self._column("branches.index")[start:stop]
+            ]
+            self._branches[code] = frozenset(map(str, names))
+        return self._branches[code]
+
+    def decode(self, rows: slice | np.ndarray = None, branches=...) -> list[Chunk]:
+        column = self._column
+        if rows is None:
+            rows = slice(None)
+        paths = column("path")[rows].tolist()
+        names = column("name")[rows].tolist()
+        uuids = column("uuid")[rows]
+        masks = column("uuid.mask")[rows].tolist()
+        sets = column("branches")[rows].tolist() if "branches" in self._keys else None
+        ints = [column(k)[rows].tolist() for k in _COLUMN_INTS]
+        chunks = []
+        for i in range(len(paths)):
+            chunk = Chunk.__new__(Chunk)
+            chunk.path = self._path(paths[i])
+            chunk.name = self._name(names[i])
+            chunk._uuid = UUID(bytes=uuids[i].tobytes()) if masks[i] else ...
+            chunk._branches = branches if sets is None else self._branch_set(sets[i])
+            chunk._num_entries, chunk._entry_start, chunk._entry_stop = (
+                _decode_int(v[i]) for v in ints
+            )
+            chunks.append(chunk)
+        return chunks
+
+
+@dataclass
+class _chunk_integrity_job:
+    path: EOS
+    chunks: list[Chunk]
+
+    def __call__(self) -> tuple[Optional[str], list[Optional[Chunk]]]:
+        if not self.path.exists:
+            return "file not exists", [None] * len(self.chunks)
+        trees: dict[str, Optional[Chunk]] = {}
+        # the file may have been rewritten since the pooled handles were opened
+        file_pool.invalidate(self.path)
+        try:
+            with file_pool.open(self.path) as file:
+                for chunk in self.chunks:
+                    if chunk.name not in trees:
+                        tree = Chunk(source=self.path, name=chunk.name)
+                        try:
+                            tree._fetch_file(file)
+                        except Exception:
+                            tree = None
+                        trees[chunk.name] = tree
+        except Exception as e:
+            return f"cannot open file ({e!r})", [None] * len(self.chunks)
+        reloaded = []
+        for chunk in self.chunks:
+            tree = trees[chunk.name]
+            if tree is not None:
+                tree = tree.deepcopy(
+                    entry_start=chunk._entry_start, entry_stop=chunk._entry_stop
+                )
+            reloaded.append(tree)
+        return None, reloaded
 
 
 class _ChunkMeta(type):
@@ -126,69 +275,165 @@ class Chunk(metaclass=_ChunkMeta):
         Check and report the following:
 
         - :data:`path` not exists
+        - :data:`name` not in file
         - :data:`uuid` different from file
         - :data:`num_entries` different from file
         - :data:`branches` not in file
         - :data:`entry_start` out of range
         - :data:`entry_stop` out of range
 
+        The metadata read from file will be stored to :data:`~.index.metadata_index`.
+
         Returns
         -------
         Chunk or None
-            A deep copy of ``self`` with corrected metadata. If file not exists, return ``None``.
+            A deep copy of ``self`` with corrected metadata. If file or tree not exists, return ``None``.
         """
+        return self.integrity_many((self,))[0]
+
+    @classmethod
+    def _integrity_files(cls, chunks: list[Chunk]):
+        files: defaultdict[EOS, list[int]] = defaultdict(list)
+        for i, chunk in enumerate(chunks):
+            files[chunk.path].append(i)
+        return [
+            (indices, _chunk_integrity_job(path, [chunks[i] for i in indices]))
+            for path, indices in files.items()
+        ]
+
+    @classmethod
+    def _integrity_run(
+        cls,
+        files: list[tuple[list[int], _chunk_integrity_job]],
+        executor: Optional[Executor],
+    ):
+        results = (map if executor is None else executor.map)(
+            _chunk_integrity_job.__call__, (job for _, job in files)
+        )
+        return [*zip((indices for indices, _ in files), results)]
+
+    @classmethod
+    async def _integrity_run_async(
+        cls, files: list[tuple[list[int], _chunk_integrity_job]], concurrency: int
+    ):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check(job: _chunk_integrity_job):
+            async with semaphore:
+                return await asyncio.to_thread(job)
+
+        results = await asyncio.gather(*(check(job) for _, job in files))
+        return [*zip((indices for indices, _ in files), results)]
+
+    @classmethod
+    def _integrity_report(
+        cls, chunks: list[Chunk], results: Iterable[tuple[list[int], tuple]]
+    ):
+        checked: list[Optional[Chunk]] = [None] * len(chunks)
+        for indices, (error, reloaded) in results:
+            for i, new in zip(indices, reloaded):
+                checked[i] = chunks[i]._integrity_check(error, new)
+        metadata_index.remove(
+            *(chunk for chunk, new in zip(chunks, checked) if new is None)
+        )
+        metadata_index.save(*(new for new in checked if new is not None))
+        return checked
+
+    def _integrity_check(self, error: Optional[str], reloaded: Optional[Chunk]):
         chunk_name = f'chunk  "{self.path}"\n    '
-        if not self.path.exists:
-            logging.error(f"{chunk_name}file not exists")
+        if error is not None:
+            logging.error(f"{chunk_name}{error}")
+            return None
+        if reloaded is None:
+            logging.error(f'{chunk_name}tree "{self.name}" not in file')
             return None
+        if not self._ignore(self._uuid) and self._uuid != reloaded.uuid:
+            logging.error(
+                f"{chunk_name}UUID {self._uuid}(stored) != {reloaded.uuid}(file)"
+            )
+        if (
+            not self._ignore(self._num_entries)
+            and self._num_entries != reloaded.num_entries
+        ):
+            logging.error(
+                f"{chunk_name}number of entries {self._num_entries}(stored) != {reloaded.num_entries}(file)"
+            )
+        if not self._ignore(self._branches):
+            diff = self._branches - reloaded.branches
+            if diff:
+                logging.error(f"{chunk_name}branches {diff} not in file")
+        out_of_range = False
+        if not self._ignore(self._entry_start):
+            out_of_range |= (
+                self._entry_start < 0 or self._entry_start >= reloaded.num_entries
+            )
         else:
-            reloaded = Chunk(
-                source=self.path,
-                name=self.name,
-                entry_start=self._entry_start,
-                entry_stop=self._entry_stop,
-                fetch=True,
+            reloaded._entry_start = 0
+        if not self._ignore(self._entry_stop):
+            out_of_range |= (
+                self._entry_stop <= reloaded.entry_start
+                or self._entry_stop > reloaded.num_entries
             )
-            if not self._ignore(self._uuid) and self._uuid != reloaded.uuid:
-                logging.error(
-                    f"{chunk_name}UUID {self._uuid}(stored) != {reloaded.uuid}(file)"
-                )
-            if (
-                not self._ignore(self._num_entries)
-                and self._num_entries != reloaded.num_entries
-            ):
-                logging.error(
-                    f"{chunk_name}number of entries {self._num_entries}(stored) != {reloaded.num_entries}(file)"
-                )
-            if not self._ignore(self._branches):
-                diff = self._branches - reloaded.branches
-                if diff:
-                    logging.error(f"{chunk_name}branches {diff} not in file")
-            out_of_range = False
-            if not self._ignore(self._entry_start):
-                out_of_range |= (
-                    self._entry_start < 0 or self._entry_start >= reloaded.num_entries
-                )
-            else:
-                reloaded._entry_start = 0
-            if not self._ignore(self._entry_stop):
-                out_of_range |= (
-                    self._entry_stop <= reloaded.entry_start
-                    or self._entry_stop > reloaded.num_entries
-                )
-            else:
-                reloaded._entry_stop = reloaded.num_entries
-            if out_of_range:
-                logging.warning(
-                    f"{chunk_name}invalid entry range [0,{reloaded.num_entries}) -> [{reloaded.entry_start},{reloaded.entry_stop})"
-                )
-            return reloaded
+        else:
+            reloaded._entry_stop = reloaded.num_entries
+        if out_of_range:
+            logging.warning(
+                f"{chunk_name}invalid entry range [0,{reloaded.num_entries}) -> [{reloaded.entry_start},{reloaded.entry_stop})"
+            )
+        return reloaded
+
+    @classmethod
+    def integrity_many(
+        cls, chunks: Iterable[Chunk], executor: Optional[Executor] = None
+    ) -> list[Optional[Chunk]]:
+        """
+        Perform :meth:`integrity` on ``chunks`` in bulk. The chunks are grouped by file and each file is only opened once.
+
+        Parameters
+        ----------
+        chunks : ~typing.Iterable[Chunk]
+            Chunks to check.
+        executor: ~concurrent.futures.Executor, optional
+            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. Each file will be checked in a separate task. If not provided, the tasks will run sequentially in the current thread.
+
+        Returns
+        -------
+        list[Chunk or None]
+            The results of :meth:`integrity` in the same order as ``chunks``.
+        """
+        chunks = [*chunks]
+        return cls._integrity_report(
+            chunks, cls._integrity_run(cls._integrity_files(chunks), executor)
+        )
+
+    @classmethod
+    async def integrity_async(
+        cls, chunks: Iterable[Chunk], concurrency: int = 16
+    ) -> list[Optional[Chunk]]:
+        """
+        Asynchronous version of :meth:`integrity_many`. Each file is checked in a separate thread by :func:`asyncio.to_thread`.
+
+        Parameters
+        ----------
+        chunks : ~typing.Iterable[Chunk]
+            Chunks to check.
+        concurrency : int, optional, default=16
+            Maximum number of files checked at the same time.
+
+        Returns
+        -------
+        list[Chunk or None]
+            The results of :meth:`integrity` in the same order as ``chunks``.
+        """
+        chunks = [*chunks]
+        return cls._integrity_report(
+            chunks,
+            await cls._integrity_run_async(cls._integrity_files(chunks), concurrency),
+        )
 
     def _fetch(self):
         if any(v is ... for v in (self._branches, self._num_entries, self._uuid)):
-            import uproot
-
-            with uproot.open(self.path) as file:
+            with file_pool.open(self.path, self._uuid) as file:
                 self._fetch_file(file)
         return self
 
@@ -201,6 +446,81 @@ class Chunk(metaclass=_ChunkMeta):
         if self._uuid is ...:
             self._uuid = file.file.uuid
 
+    def basket_edges(self, branches: Iterable[str] = None) -> list[int]:
+        """
+        Find the entry boundaries shared by the :class:`TBasket` of ``branches``.
+
+        Parameters
+        ----------
+        branches : ~typing.Iterable[str], optional
+            Name of branches. If not given, all branches will be used.
+
+        Returns
+        -------
+        list[int]
+            Sorted entry boundaries including ``0`` and :data:`num_entries`.
+        """
+        if branches is None:
+            branches = self.branches
+        edges = None
+        with file_pool.open(self.path, self._uuid) as file:
+            tree = file[self.name]
+            for branch in branches:
+                offsets = set(tree[branch].entry_offsets)
+                edges = offsets if edges is None else edges & offsets
+        if edges is None:
+            edges = {0, self.num_entries}
+        return sorted(edges)
+
+    def entry_bytes(self, branches: Iterable[str] = None) -> float:
+        """
+        Estimate the uncompressed size per entry of ``branches`` from the :class:`TBranch` metadata.
+
+        Parameters
+        ----------
+        branches : ~typing.Iterable[str], optional
+            Name of branches. If not given, all branches will be used.
+
+        Returns
+        -------
+        float
+            Average number of uncompressed bytes per entry.
+        """
+        if branches is None:
+            branches = self.branches
+        with file_pool.open(self.path, self._uuid) as file:
+            tree = file[self.name]
+            total = sum(tree[branch].uncompressed_bytes for branch in branches)
+        return total / max(self.num_entries, 1)
+
+    @classmethod
+    def _entry_weights(
+        cls,
+        chunks: Iterable[Chunk],
+        unit: Literal["entry", "byte"],
+        branch_filter: Optional[Callable[[set[str]], set[str]]],
+    ) -> list[float]:
+        if unit == "entry":
+            return [1] * len(chunks)
+        elif unit == "byte":
+            weights = []
+            for chunk in chunks:
+                branches = chunk.branches
+                if branch_filter is not None:
+                    branches = branch_filter(branches)
+                weights.append(chunk.entry_bytes(branches))
+            return weights
+        else:
+            raise ValueError(f'Unknown unit "{unit}".')
+
+    @classmethod
+    def _entry_target(cls, size: int, weight: float) -> int:
+        if weight == 1:
+            return size
+        if weight <= 0:
+            return None
+        return max(2, round(size / weight))
+
     def __hash__(self):
         return hash((self.uuid, self.name))
 
@@ -283,7 +603,7 @@ class Chunk(metaclass=_ChunkMeta):
     @classmethod
     def from_path(cls, *paths: tuple[str, str], executor: Optional[Executor] = None):
         """
-        Create :class:`Chunk` from ``paths`` and fetch metadata in parallel.
+        Create :class:`Chunk` from ``paths`` and fetch metadata in parallel. The metadata found in :data:`~.index.metadata_index` will not be fetched again.
 
         Parameters
         ----------
@@ -298,10 +618,16 @@ class Chunk(metaclass=_ChunkMeta):
             List of chunks from ``paths``.
         """
         chunks = [Chunk(path, name) for path, name in paths]
-        chunks = (map_executor if executor is None else executor.map)(
-            Chunk._fetch, chunks
+        missing = [
+            i for i, found in enumerate(metadata_index.load(chunks)) if not found
+        ]
+        fetched = (map_executor if executor is None else executor.map)(
+            Chunk._fetch, [chunks[i] for i in missing]
         )
-        return [*chunks]
+        for i, chunk in zip(missing, fetched):
+            chunks[i] = chunk
+        metadata_index.save(*(chunks[i] for i in missing))
+        return chunks
 
     @classmethod
     def common(
@@ -337,6 +663,8 @@ class Chunk(metaclass=_ChunkMeta):
         size: int,
         *chunks: Chunk,
         common_branches: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        branch_filter: Callable[[set[str]], set[str]] = None,
     ):
         """
         Partition ``chunks`` into groups. The sum of entries in each group is equal to ``size`` except for the last one. The order of chunks is preserved.
@@ -349,22 +677,39 @@ class Chunk(metaclass=_ChunkMeta):
             Chunks to partition.
         common_branches : bool, optional, default=False
             If ``True``, only common branches of all chunks are kept.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``size``.
+
+            - ``unit='entry'``: number of entries.
+            - ``unit='byte'``: uncompressed bytes estimated by :meth:`entry_bytes`. Each group will have at least one entry and will stop before exceeding ``size`` except for the first entry of each chunk.
+        branch_filter : ~typing.Callable[[set[str]], set[str]], optional
+            A function to select branches used to estimate the size when ``unit='byte'``. If not given, all branches will be used.
 
         Yields
         ------
         list[Chunk]
-            A group of chunks with total entries equal to ``size``.
+            A group of chunks with total size equal to ``size``.
         """
-        i, start, remain = 0, 0, size
-        group: list[Chunk] = []
         if common_branches:
             chunks = cls.common(*chunks)
+        yield from cls._partition(
+            size, chunks, cls._entry_weights(chunks, unit, branch_filter)
+        )
+
+    @classmethod
+    def _partition(cls, size: int, chunks: list[Chunk], weights: list[float]):
+        i, start, remain = 0, 0, size
+        group: list[Chunk] = []
         while i < len(chunks):
-            chunk = min(remain, len(chunks[i]) - start)
+            weight = weights[i]
+            if weight <= 0:
+                chunk = len(chunks[i]) - start
+            else:
+                chunk = min(max(1, int(remain // weight)), len(chunks[i]) - start)
             group.append(chunks[i].slice(start, start + chunk))
-            remain -= chunk
+            remain -= chunk * weight
             start += chunk
-            if remain == 0:
+            if remain < weight or remain <= 0:
                 yield group
                 group = []
                 remain = size
@@ -380,6 +725,8 @@ class Chunk(metaclass=_ChunkMeta):
         size: int,
         *chunks: Chunk,
         common_branches: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+        branch_filter: Callable[[set[str]], set[str]] = None,
     ):
         """
         Split ``chunks`` into smaller pieces with ``size`` entries in each. If not possible, will try to find another size minimizing the average deviation.
@@ -387,26 +734,96 @@ class Chunk(metaclass=_ChunkMeta):
         Parameters
         ----------
         size : int
-            Target number of entries in each chunk.
+            Target size of each chunk.
         chunks : tuple[Chunk]
             Chunks to balance.
         common_branches : bool, optional, default=False
             If ``True``, only common branches of all chunks are kept.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``size``. If ``unit='byte'``, ``size`` is converted to a number of entries for each chunk using :meth:`entry_bytes`.
+        branch_filter : ~typing.Callable[[set[str]], set[str]], optional
+            A function to select branches used to estimate the size when ``unit='byte'``. If not given, all branches will be used.
 
         Yields
         -------
         list[Chunk]
-            Resized chunks with about ``size`` entries in each.
+            Resized chunks with about ``size`` in each.
         """
         if common_branches:
             chunks = cls.common(*chunks)
-        for chunk in chunks:
+        weights = cls._entry_weights(chunks, unit, branch_filter)
+        for chunk, weight in zip(chunks, weights):
             total = len(chunk)
             start = 0
-            for step in balance_split(total, size):
+            for step in balance_split(total, cls._entry_target(size, weight)):
                 yield chunk.slice(start, start + step)
                 start += step
 
+    @classmethod
+    def basket(
+        cls,
+        size: int,
+        *chunks: Chunk,
+        branch_filter: Callable[[set[str]], set[str]] = None,
+        tolerance: float = 0.1,
+        common_branches: bool = False,
+        unit: Literal["entry", "byte"] = "entry",
+    ):
+        """
+        Split ``chunks`` like :meth:`balance` and move each boundary to the nearest :class:`TBasket` boundary shared by the selected branches.
+
+        Parameters
+        ----------
+        size : int
+            Target size of each chunk.
+        chunks : tuple[Chunk]
+            Chunks to split.
+        branch_filter : ~typing.Callable[[set[str]], set[str]], optional
+            A function to select branches used to find the :class:`TBasket` boundaries and to estimate the size when ``unit='byte'``. If not given, all branches will be used.
+        tolerance : float, optional, default=0.1
+            The maximum shift of each boundary as a fraction of ``size``. The boundaries without a shared :class:`TBasket` boundary in range will not be moved.
+        common_branches : bool, optional, default=False
+            If ``True``, only common branches of all chunks are kept.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``size``. See :meth:`balance` for details.
+
+        Yields
+        -------
+        list[Chunk]
+            Resized chunks with about ``size`` entries in each.
+        """
+        if common_branches:
+            chunks = cls.common(*chunks)
+        weights = cls._entry_weights(chunks, unit, branch_filter)
+        for chunk, weight in zip(chunks, weights):
+            branches = chunk.branches
+            if branch_filter is not None:
+                branches = branch_filter(branches)
+            edges = chunk.basket_edges(branches)
+            start, stop = chunk.entry_start, chunk.entry_stop
+            bounds = [start]
+            target = cls._entry_target(size, weight)
+            steps = balance_split(len(chunk), target)[:-1]
+            for ideal in accumulate(steps, initial=start):
+                if ideal == start:
+                    continue
+                bound = ideal
+                idx = bisect.bisect_left(edges, ideal)
+                nearest = [
+                    edges[i]
+                    for i in (idx - 1, idx)
+                    if 0 <= i < len(edges) and bounds[-1] < edges[i] < stop
+                ]
+                if nearest:
+                    edge = min(nearest, key=lambda edge: abs(edge - ideal))
+                    if abs(edge - ideal) <= tolerance * target:
+                        bound = edge
+                if bound > bounds[-1]:
+                    bounds.append(bound)
+            bounds.append(stop)
+            for i in range(len(bounds) - 1):
+                yield chunk.slice(bounds[i] - start, bounds[i + 1] - start)
+
     def to_json(self):
         """
         Convert ``self`` to JSON data.
@@ -472,6 +889,88 @@ class Chunk(metaclass=_ChunkMeta):
             kwargs[key] = value
         return cls(**kwargs)
 
+    @classmethod
+    def to_columns(
+        cls, chunks: Iterable[Chunk], branches: bool = True
+    ) -> dict[str, np.ndarray]:
+        """
+        Convert ``chunks`` to columns of :class:`numpy.ndarray`. The paths, tree names and branch sets are dictionary-encoded.
+
+        Parameters
+        ----------
+        chunks : ~typing.Iterable[Chunk]
+            Chunks to convert.
+        branches : bool, optional, default=True
+            If ``False``, the branches will not be stored.
+
+        Returns
+        -------
+        dict[str, ~numpy.ndarray]
+            Columns that can be saved by :func:`numpy.savez`.
+        """
+        import numpy as np
+
+        chunks = [*chunks]
+        columns = {}
+        columns["path.dict"], columns["path"] = _encode_dict(
+            str(chunk.path) for chunk in chunks
+        )
+        columns["name.dict"], columns["name"] = _encode_dict(
+            chunk.name for chunk in chunks
+        )
+        uuids = np.zeros((len(chunks), 16), dtype=np.uint8)
+        masks = np.zeros(len(chunks), dtype=bool)
+        for i, chunk in enumerate(chunks):
+            if chunk._uuid is not ...:
+                uuids[i] = np.frombuffer(chunk._uuid.bytes, dtype=np.uint8)
+                masks[i] = True
+        columns["uuid"], columns["uuid.mask"] = uuids, masks
+        if branches:
+            sets: dict[frozenset[str], int] = {}
+            codes = np.empty(len(chunks), dtype=np.int32)
+            for i, chunk in enumerate(chunks):
+                if chunk._branches is ...:
+                    codes[i] = _COLUMN_UNSET
+                elif chunk._branches is None:
+                    codes[i] = _COLUMN_NONE
+                else:
+                    codes[i] = sets.setdefault(chunk._branches, len(sets))
+            columns["branches"] = codes
+            columns["branches.dict"], columns["branches.index"] = _encode_dict(
+                k for s in sets for k in sorted(s)
+            )
+            columns["branches.offsets"] = np.cumsum(
+                [0, *map(len, sets)], dtype=np.int64
+            )
+        for key in _COLUMN_INTS:
+            columns[key] = np.fromiter(
+                (_encode_int(getattr(chunk, f"_{key}")) for chunk in chunks),
+                dtype=np.int64,
+                count=len(chunks),
+            )
+        return columns
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, np.ndarray], rows: slice | np.ndarray = None
+    ) -> list[Chunk]:
+        """
+        Create :class:`Chunk` from columns.
+
+        Parameters
+        ----------
+        columns : ~typing.Mapping[str, ~numpy.ndarray]
+            Columns generated by :meth:`to_columns` e.g. the file loaded by :func:`numpy.load`.
+        rows : slice or ~numpy.ndarray, optional
+            Only decode the given rows. If not given, all rows will be decoded.
+
+        Returns
+        -------
+        list[Chunk]
+            Chunks from columns.
+        """
+        return _ChunkColumns(columns).decode(rows)
+
     @classmethod
     def from_coffea_events(cls, events):
         """
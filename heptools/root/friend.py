@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import bisect
+import json
 import logging
+import os
+import threading
+import time
 from collections import defaultdict, deque
 from concurrent.futures import Executor, Future, wait
 from dataclasses import dataclass
@@ -9,7 +13,6 @@ from functools import partial
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
-    Generator,
     Iterable,
     Literal,
     Optional,
@@ -17,12 +20,19 @@ from typing import (
     Callable,
 )
 
+import numpy as np
+
 from ..config import Configurable, config
 from ..dask.delayed import delayed
 from ..system.eos import EOS, PathLike
-from ..utils import map_executor
-from ._backend import NameMapping, apply_naming
-from .chunk import Chunk
+from ._backend import (
+    NameMapping,
+    apply_naming,
+    concat_record,
+    record_backend,
+    sizeof_record,
+)
+from .chunk import Chunk, _ChunkColumns
 from .io import BRANCH_FILTER, ReaderOptions, TreeReader, TreeWriter, WriterOptions
 from .merge import resize
 
@@ -30,7 +40,7 @@ if TYPE_CHECKING:
     import awkward as ak
     import dask.array as da
     import dask_awkward as dak
-    import numpy as np
+    import numpy.typing as npt
     import pandas as pd
 
     from .io import DelayedRecordLike, RecordLike
@@ -52,38 +62,6 @@ def _eos_cp(src: EOS, dst: EOS):
     return src, dst
 
 
-@dataclass
-class _friend_cleanup_job:
-    chunk: _FriendItem
-    branches: frozenset[str]
-
-    def __call__(self):
-        chunk = self.chunk.chunk
-        import uproot
-
-        try:
-            with uproot.open(chunk.path) as f:
-                assert f.file.uuid == chunk.uuid
-                tree = f[chunk.name]
-                if chunk._num_entries is not ...:
-                    assert tree.num_entries == chunk.num_entries
-                assert frozenset(tree.keys()) <= self.branches
-        except Exception:
-            return None
-        return chunk
-
-
-@dataclass
-class _friend_cleanup_callback:
-    friend: Friend
-    target: Chunk
-
-    def __call__(self, result: Chunk | Future[Chunk]):
-        chunk = result.result() if isinstance(result, Future) else result
-        if chunk is not None:
-            self.friend.add(self.target, chunk)
-
-
 def _friend_merge_impl(
     name: str,
     branches: frozenset[str],
@@ -91,16 +69,18 @@ def _friend_merge_impl(
 ):
     friend = Friend(name)
     friend._branches = frozenset(branches)
+    items = []
     for k, vs in data.items():
         for start, stop, chunks in vs:
             for chunk in chunks:
                 chunk._branches = friend._branches
-                friend.add(k.slice(start, start + len(chunk)), chunk)
+                items.append((k.slice(start, start + len(chunk)), chunk))
                 start += len(chunk)
             if start != stop:
                 raise RuntimeError(
                     f'Failed to merge friend "{name}". The merged chunk does not cover the range [{start},{stop}) for target {k}.'
                 )
+    friend.add_many(items)
     return friend
 
 
@@ -150,14 +130,42 @@ class _friend_dump_job:
         return f.tree
 
 
+_journal_lock = threading.Lock()
+
+
+def _journal_write(journal: PathLike, record: dict):
+    line = (json.dumps(record) + "\n").encode()
+    with _journal_lock, open(journal, "ab+") as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = b"\n" + line
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 @dataclass
 class _friend_dump_callback:
     friend: Friend
     item: _FriendItem
+    target: Chunk = None
+    journal: Optional[PathLike] = None
 
     def __call__(self, tree: Chunk | Future[Chunk]):
         self.item.chunk = tree.result() if isinstance(tree, Future) else tree
         self.friend._check_item(self.item)
+        if self.journal is not None:
+            _journal_write(
+                self.journal,
+                {
+                    "name": self.friend.name,
+                    "target": self.target.to_json(),
+                    "start": self.item.start,
+                    "stop": self.item.stop,
+                    "chunk": self.item.chunk.to_json(),
+                },
+            )
 
 
 class FriendTreeError(Exception): ...
@@ -196,6 +204,192 @@ class _FriendItem:
         return isinstance(self.chunk, Chunk)
 
 
+def _object_array(items: list) -> np.ndarray:
+    objects = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        objects[i] = item
+    return objects
+
+
+@dataclass
+class _friend_lazy_items:
+    columns: _ChunkColumns
+    rows: slice
+    starts: np.ndarray
+    stops: np.ndarray
+    branches: frozenset[str]
+
+    def __call__(self):
+        chunks = self.columns.decode(self.rows, branches=self.branches)
+        return [
+            _FriendItem(start, stop, chunk)
+            for start, stop, chunk in zip(
+                self.starts.tolist(), self.stops.tolist(), chunks
+            )
+        ]
+
+
+class _FriendSeries:
+    _MAX_PENDING = 1024
+
+    def __init__(self, items: Iterable[_FriendItem] = ()):
+        self._starts = np.empty(0, dtype=np.int64)
+        self._stops = np.empty(0, dtype=np.int64)
+        self._gaps = np.zeros(0, dtype=np.int64)
+        self._items = np.empty(0, dtype=object)
+        self._pending: list[_FriendItem] = []
+        self._pending_stops: list[int] = []
+        self._stop = None
+        if items:
+            self.add_many(items)
+
+    @classmethod
+    def _lazy(cls, starts: np.ndarray, stops: np.ndarray, loader: Callable[[], list]):
+        series = cls()
+        series._commit(starts, stops, None)
+        series._loader = loader
+        return series
+
+    @property
+    def _items(self) -> np.ndarray:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            self._objects = _object_array(loader())
+        return self._objects
+
+    @_items.setter
+    def _items(self, items: np.ndarray):
+        self._loader = None
+        self._objects = items
+
+    def _overlap(self, item: _FriendItem, exist: _FriendItem, target):
+        return ValueError(
+            f"The new chunk {item} overlaps with the existing one {exist} when inserting into {target}"
+        )
+
+    def _compact(self):
+        if not self._pending:
+            return
+        starts = np.fromiter((i.start for i in self._pending), dtype=np.int64)
+        stops = np.asarray(self._pending_stops, dtype=np.int64)
+        self._commit(*self._merge(starts, stops, self._pending, True))
+        self._pending = []
+        self._pending_stops = []
+
+    def _merge(self, starts, stops, items: list[_FriendItem], ordered: bool):
+        objects = _object_array(items)
+        if not ordered:
+            order = np.argsort(starts, kind="stable")
+            starts, stops, objects = starts[order], stops[order], objects[order]
+        idx = np.searchsorted(self._starts, starts, side="right")
+        return (
+            np.insert(self._starts, idx, starts),
+            np.insert(self._stops, idx, stops),
+            np.insert(self._items, idx, objects),
+        )
+
+    def _commit(self, starts, stops, items):
+        self._starts, self._stops, self._items = starts, stops, items
+        self._gaps = np.zeros(len(starts), dtype=np.int64)
+        if len(starts) > 1:
+            np.cumsum(starts[1:] != stops[:-1], out=self._gaps[1:])
+        self._stop = int(stops.max()) if len(starts) > 0 else None
+
+    def add(self, item: _FriendItem, target=None):
+        idx = len(self._pending)
+        if self._stop is not None and item.start < self._stop:
+            exist = np.searchsorted(self._stops, item.start, side="right")
+            if exist < len(self._starts) and self._starts[exist] < item.stop:
+                raise self._overlap(item, self._items[exist], target)
+            idx = bisect.bisect_right(self._pending_stops, item.start)
+            if idx < len(self._pending) and self._pending[idx].start < item.stop:
+                raise self._overlap(item, self._pending[idx], target)
+        self._pending.insert(idx, item)
+        self._pending_stops.insert(idx, item.stop)
+        self._stop = item.stop if self._stop is None else max(self._stop, item.stop)
+        if len(self._pending) > self._MAX_PENDING:
+            self._compact()
+
+    append = add
+
+    def prepare(self, items: Iterable[_FriendItem], target=None):
+        self._compact()
+        items = [*items]
+        starts = np.fromiter((i.start for i in items), dtype=np.int64, count=len(items))
+        stops = np.fromiter((i.stop for i in items), dtype=np.int64, count=len(items))
+        merged = self._merge(starts, stops, items, False)
+        starts, stops, items = merged
+        overlaps = np.flatnonzero(starts[1:] < stops[:-1])
+        if len(overlaps) > 0:
+            idx = overlaps[0]
+            raise self._overlap(items[idx + 1], items[idx], target)
+        return merged
+
+    def add_many(self, items: Iterable[_FriendItem], target=None):
+        self._commit(*self.prepare(items, target))
+
+    def replace(self, start: int, stop: int, item: _FriendItem):
+        self._compact()
+        lo = np.searchsorted(self._starts, start, side="left")
+        hi = np.searchsorted(self._stops, stop, side="right")
+        self._commit(
+            np.concatenate((self._starts[:lo], [item.start], self._starts[hi:])),
+            np.concatenate((self._stops[:lo], [item.stop], self._stops[hi:])),
+            np.concatenate((self._items[:lo], _object_array([item]), self._items[hi:])),
+        )
+
+    def locate(self, starts: npt.ArrayLike, stops: npt.ArrayLike):
+        """
+        Find the items overlapping with each range ``[start, stop)``.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The first and last (exclusive) index of the items and whether each range is fully covered.
+        """
+        self._compact()
+        starts = np.asarray(starts, dtype=np.int64)
+        stops = np.asarray(stops, dtype=np.int64)
+        lo = np.searchsorted(self._stops, starts, side="right")
+        hi = np.searchsorted(self._starts, stops, side="left")
+        covered = stops <= starts
+        found = (lo < hi) & ~covered
+        first, last = lo[found], hi[found] - 1
+        covered[found] = (
+            (self._starts[first] <= starts[found])
+            & (self._stops[last] >= stops[found])
+            & (self._gaps[last] == self._gaps[first])
+        )
+        return lo, np.maximum(lo, hi), covered
+
+    def __iter__(self):
+        self._compact()
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._starts) + len(self._pending)
+
+    def __getitem__(self, index):
+        self._compact()
+        return self._items[index]
+
+    def __repr__(self):
+        return repr([*self])
+
+    @property
+    def n_entries(self) -> int:
+        self._compact()
+        return int((self._stops - self._starts).sum())
+
+    def copy(self):
+        self._compact()
+        if self._loader is not None:
+            return _FriendSeries._lazy(self._starts, self._stops, self._loader)
+        series = _FriendSeries()
+        series._commit(self._starts, self._stops, self._items.copy())
+        return series
+
+
 class Friend(Configurable, namespace="root.Friend"):
     """
     A tool to create and manage a collection of addtional :class:`TBranch` stored in separate ROOT files. (also known as friend :class:`TTree`)
@@ -241,14 +435,14 @@ class Friend(Configurable, namespace="root.Friend"):
         """
         int: Number of friend tree files.
         """
-        return sum(len(vs) for vs in self._data.values())
+        return sum(map(len, self._data.values()))
 
     @property
     def n_entries(self):
         """
         int: Number of entries in the friend tree.
         """
-        return sum(sum(len(v) for v in vs) for vs in self._data.values())
+        return sum(vs.n_entries for vs in self._data.values())
 
     def __on_disk(func):
         def wrapper(self: Friend, *args, **kwargs):
@@ -274,7 +468,7 @@ class Friend(Configurable, namespace="root.Friend"):
     def __init__(self, name: str):
         self.name = name
         self._branches: frozenset[str] = None
-        self._data: defaultdict[Chunk, list[_FriendItem]] = defaultdict(list)
+        self._data: defaultdict[Chunk, _FriendSeries] = defaultdict(_FriendSeries)
 
     @__on_disk
     def __iadd__(self, other) -> Friend:
@@ -289,8 +483,7 @@ class Friend(Configurable, namespace="root.Friend"):
             if self._branches != other._branches:
                 raise ValueError(msg.format(attr="branches"))
             for k, vs in other._data.items():
-                for v in vs:
-                    self._insert(k, v)
+                self._data[k].add_many(vs, k)
             return self
         return NotImplemented
 
@@ -320,9 +513,23 @@ class Friend(Configurable, namespace="root.Friend"):
         naming: str | NameMapping = ...,
         writer_options: WriterOptions = None,
         executor: Executor = None,
+        journal: PathLike = None,
+        coalesce: bool = False,
+        max_bytes: int = ...,
+        max_fragments: int = ...,
+        max_age: float = ...,
     ):
         """
-        Automatically dump the in-memory data when :meth:`add` is called. The parameters are the same as :meth:`dump`.
+        Automatically dump the in-memory data when :meth:`add` is called. The parameters not listed below are the same as :meth:`dump`.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Dump when the in-memory data estimated by :func:`~._backend.sizeof_record` reaches this size in bytes.
+        max_fragments : int, optional
+            Dump when the number of in-memory chunks reaches this value.
+        max_age : float, optional
+            Dump when the oldest in-memory chunk has been waiting for this number of seconds.
 
         Notes
         -----
@@ -334,24 +541,62 @@ class Friend(Configurable, namespace="root.Friend"):
             >>>     ...
             >>>     friend.add(target, data)
             >>>     ...
+
+        If none of ``max_bytes``, ``max_fragments`` and ``max_age`` is given, the data will be dumped on every :meth:`add`. Otherwise, the thresholds are checked on every :meth:`add` and the data will be dumped once any of them is reached. The remaining data will be dumped when exiting the with statement. Use ``coalesce=True`` to write the contiguous chunks of the same target into one file.
         """
-        self.__auto = False, {
-            "base_path": base_path,
-            "naming": naming,
-            "writer_options": writer_options,
-            "executor": executor,
-        }
+        self.__auto = (
+            False,
+            {
+                "base_path": base_path,
+                "naming": naming,
+                "writer_options": writer_options,
+                "executor": executor,
+                "journal": journal,
+                "coalesce": coalesce,
+            },
+            {
+                "max_bytes": max_bytes,
+                "max_fragments": max_fragments,
+                "max_age": max_age,
+            },
+        )
         return self
 
     def __enter__(self):
         if hasattr(self, _FRIEND_AUTO):
-            self.__auto = True, self.__auto[1]
+            self.__auto = True, *self.__auto[1:]
         return self
 
     def __exit__(self, *_):
         if hasattr(self, _FRIEND_AUTO):
+            self.dump(**self.__auto[1])
             del self.__auto
 
+    def _dump_due(self):
+        policy = self.__auto[2]
+        if all(v is ... for v in policy.values()):
+            return True
+        return (
+            (policy["max_bytes"] is not ... and self.__size >= policy["max_bytes"])
+            or (
+                policy["max_fragments"] is not ...
+                and len(self.__dump) >= policy["max_fragments"]
+            )
+            or (
+                policy["max_age"] is not ...
+                and time.monotonic() - self.__since >= policy["max_age"]
+            )
+        )
+
+    def _queue_dump(self, items: list[tuple[Chunk, _FriendItem]]):
+        self._init_dump()
+        if not self.__dump:
+            self.__since = time.monotonic()
+        self.__dump.extend(items)
+        self.__size += sum(sizeof_record(item.chunk) for _, item in items)
+        if self._auto_dump and self._dump_due():
+            self.dump(**self.__auto[1])
+
     @property
     def _has_dump(self):
         if hasattr(self, _FRIEND_DUMP):
@@ -362,6 +607,8 @@ class Friend(Configurable, namespace="root.Friend"):
         if not hasattr(self, _FRIEND_DUMP):
             self.__dump: list[tuple[Chunk, _FriendItem]] = []
             self.__naming: dict[Chunk, dict[str, str]] = {}
+            self.__size = 0
+            self.__since = None
 
     @classmethod
     def _path_parts(cls, path: EOS, format="path{}") -> list[str]:
@@ -394,18 +641,7 @@ class Friend(Configurable, namespace="root.Friend"):
         item.chunk = item.chunk.deepcopy(branches=self._branches)
 
     def _insert(self, target: Chunk, item: _FriendItem):
-        series = self._data[target]
-        idx = bisect.bisect_left(series, item)
-        if idx >= len(series):
-            series.append(item)
-        else:
-            exist = series[idx]
-            if item.stop <= exist.start:
-                series.insert(idx, item)
-            else:
-                raise ValueError(
-                    f"The new chunk {item} overlaps with the existing one {exist} when inserting into {target}"
-                )
+        self._data[target].add(item, target)
 
     def add(
         self,
@@ -424,14 +660,40 @@ class Friend(Configurable, namespace="root.Friend"):
         """
         item = _FriendItem(target.entry_start, target.entry_stop, data)
         key = target.key()
-        if not item.on_disk:
-            self._init_dump()
-            self.__dump.append((key, item))
-            if self._auto_dump:
-                self.dump(**self.__auto[1])
-        else:
+        if item.on_disk:
             self._check_item(item)
         self._insert(key, item)
+        if not item.on_disk:
+            self._queue_dump([(key, item)])
+
+    def add_many(self, items: Iterable[tuple[Chunk, RecordLike | Chunk]]):
+        """
+        Create friend :class:`TTree` for multiple targets. Same as calling :meth:`add` for each pair, but the overlaps are validated in batch before any change is made.
+
+        Parameters
+        ----------
+        items : ~typing.Iterable[tuple[Chunk, RecordLike | Chunk]]
+            Pairs of ``target`` and ``data``. See :meth:`add` for details.
+        """
+        groups: defaultdict[Chunk, list[_FriendItem]] = defaultdict(list)
+        in_memory = []
+        for target, data in items:
+            item = _FriendItem(target.entry_start, target.entry_stop, data)
+            key = target.key()
+            groups[key].append(item)
+            if item.on_disk:
+                self._check_item(item)
+            else:
+                in_memory.append((key, item))
+        merged = {}
+        for key, group in groups.items():
+            series = self._data[key] if key in self._data else _FriendSeries()
+            merged[key] = series, series.prepare(group, key)
+        for key, (series, data) in merged.items():
+            series._commit(*data)
+            self._data[key] = series
+        if in_memory:
+            self._queue_dump(in_memory)
 
     def _new_reader(self, reader_options: ReaderOptions):
         reader_options = dict(reader_options or {})
@@ -442,40 +704,48 @@ class Friend(Configurable, namespace="root.Friend"):
         reader_options[BRANCH_FILTER] = branches.intersection
         return TreeReader(**reader_options)
 
-    def _match_chunks(self, target: Chunk) -> Generator[Chunk, None, None]:
-        if target not in self._data:
-            raise FriendTreeError(
-                _FRIEND_MISSING_ERROR.format(name=self.name, range="", target=target)
-            )
-        series = self._data[target]
-        start = target.entry_start
-        stop = target.entry_stop
-        idx = bisect.bisect_left(
-            series, _FriendItem(target.entry_start, target.entry_stop)
-        )
-        if idx == len(series):
-            raise FriendTreeError(
-                _FRIEND_MISSING_ERROR.format(
-                    name=self.name,
-                    range=f" [{target.entry_start},{target.entry_stop})",
-                    target=target,
-                )
-            )
-        for i in range(idx, len(series)):
-            if start >= stop:
-                break
-            item = series[i]
-            if item.start > start:
+    def _match_many(self, targets: Iterable[Chunk]) -> list[list[Chunk]]:
+        targets = [*targets]
+        matched: list[list[Chunk]] = [None] * len(targets)
+        groups: defaultdict[Chunk, list[int]] = defaultdict(list)
+        for i, target in enumerate(targets):
+            groups[target].append(i)
+        for key, indices in groups.items():
+            if key not in self._data:
                 raise FriendTreeError(
-                    _FRIEND_MISSING_ERROR.format(
-                        name=self.name, range=f" [{start},{item.start})", target=target
-                    )
+                    _FRIEND_MISSING_ERROR.format(name=self.name, range="", target=key)
                 )
-            else:
-                chunk_start = start - item.start
-                start = min(stop, item.stop)
-                chunk_stop = start - item.start
-                yield item.chunk.slice(chunk_start, chunk_stop)
+            series = self._data[key]
+            starts = [targets[i].entry_start for i in indices]
+            stops = [targets[i].entry_stop for i in indices]
+            lo, hi, covered = series.locate(starts, stops)
+            for j, i in enumerate(indices):
+                start, stop = starts[j], stops[j]
+                if not covered[j]:
+                    missing = stop
+                    for item in series[lo[j] : hi[j]]:
+                        if item.start > start:
+                            missing = item.start
+                            break
+                        start = item.stop
+                    raise FriendTreeError(
+                        _FRIEND_MISSING_ERROR.format(
+                            name=self.name,
+                            range=f" [{start},{missing})",
+                            target=targets[i],
+                        )
+                    )
+                matched[i] = [
+                    item.chunk.slice(
+                        max(start, item.start) - item.start,
+                        min(stop, item.stop) - item.start,
+                    )
+                    for item in series[lo[j] : hi[j]]
+                ]
+        return matched
+
+    def _match_chunks(self, target: Chunk) -> list[Chunk]:
+        return self._match_many((target,))[0]
 
     @overload
     def arrays(
@@ -580,7 +850,7 @@ class Friend(Configurable, namespace="root.Friend"):
             Concatenated data.
         """
         return self._new_reader(reader_options).concat(
-            *chain(*map(self._match_chunks, targets)), library=library
+            *chain(*self._match_many(targets)), library=library
         )
 
     @overload
@@ -625,8 +895,7 @@ class Friend(Configurable, namespace="root.Friend"):
             Delayed arrays of entries from the friend :class:`TTree`.
         """
         friends = []
-        for target in targets:
-            chunks = tuple(self._match_chunks(target))
+        for chunks in self._match_many(targets):
             if len(chunks) > 1:
                 raise FriendTreeError(
                     'Cannot read one partition from multiple files. Call "merge()" first.'
@@ -640,6 +909,8 @@ class Friend(Configurable, namespace="root.Friend"):
         naming: str | NameMapping = ...,
         writer_options: WriterOptions = None,
         executor: Executor = None,
+        journal: PathLike = None,
+        coalesce: bool = False,
     ):
         """
         Dump all in-memory data to ROOT files with a given ``naming`` format.
@@ -654,6 +925,10 @@ class Friend(Configurable, namespace="root.Friend"):
             Additional options passed to :class:`~.io.TreeWriter`.
         executor: ~concurrent.futures.Executor, optional
             An executor with at least the :meth:`~concurrent.futures.Executor.submit` method implemented. If not provided, the tasks will run sequentially in the current thread.
+        journal : PathLike, optional
+            Path to a local file. If given, each dumped chunk will be appended to the file once the writing is finished, which can be used by :meth:`resume` to recover the dumped chunks.
+        coalesce : bool, optional, default=False
+            If ``True``, the contiguous in-memory chunks of the same target will be concatenated and written into one file.
 
         Notes
         -----
@@ -705,47 +980,123 @@ class Friend(Configurable, namespace="root.Friend"):
             if naming is ...:
                 naming = _NAMING
             opts = writer_options or {}
-            for target, item in self.__dump:
+            pending = self.__dump
+            if coalesce:
+                pending = self._coalesce_dump(pending)
+            for target, item in pending:
                 if base_path is ...:
                     path = target.path.parent
                 else:
                     path = base_path
                 path = path / apply_naming(naming, self._name_dump(target, item))
                 job = _friend_dump_job(path, opts, item.chunk)
-                callback = _friend_dump_callback(self, item)
+                callback = _friend_dump_callback(self, item, target, journal)
                 if executor is None:
                     callback(job())
                 else:
                     executor.submit(job).add_done_callback(callback)
             self.__dump.clear()
+            self.__size = 0
+            self.__since = None
+
+    def _coalesce_dump(self, pending: list[tuple[Chunk, _FriendItem]]):
+        groups: defaultdict[Chunk, list[_FriendItem]] = defaultdict(list)
+        for target, item in pending:
+            groups[target].append(item)
+        coalesced = []
+        for target, items in groups.items():
+            items.sort(key=lambda item: item.start)
+            runs = [[items[0]]]
+            for item in items[1:]:
+                last = runs[-1][-1]
+                if item.start == last.stop and record_backend(
+                    item.chunk
+                ) == record_backend(last.chunk):
+                    runs[-1].append(item)
+                else:
+                    runs.append([item])
+            for run in runs:
+                if len(run) == 1:
+                    item = run[0]
+                else:
+                    item = _FriendItem(
+                        run[0].start,
+                        run[-1].stop,
+                        concat_record([item.chunk for item in run]),
+                    )
+                    self._data[target].replace(item.start, item.stop, item)
+                coalesced.append((target, item))
+        return coalesced
+
+    def _cleanup_items(self):
+        items = [
+            (target, item) for target, items in self._data.items() for item in items
+        ]
+        return items, Chunk._integrity_files([item.chunk for _, item in items])
+
+    def _cleanup_report(
+        self,
+        items: list[tuple[Chunk, _FriendItem]],
+        results: list[tuple[list[int], tuple]],
+    ):
+        valid = []
+        for indices, (_, reloaded) in results:
+            for i, new in zip(indices, reloaded):
+                chunk = items[i][1].chunk
+                if (
+                    new is not None
+                    and new.uuid == chunk.uuid
+                    and (
+                        chunk._num_entries is ...
+                        or new.num_entries == chunk.num_entries
+                    )
+                    and new.branches <= self._branches
+                ):
+                    valid.append(i)
+        friend = Friend(self.name)
+        friend.add_many(
+            (target.slice(item.start, item.stop), item.chunk)
+            for target, item in (items[i] for i in sorted(valid))
+        )
+        return friend
 
     @__on_disk
     def cleanup(self, executor: Optional[Executor] = None) -> Friend:
         """
-        Remove invalid chunks.
+        Remove invalid chunks. The chunks are grouped by file and each file is only opened once.
 
         Parameters
         ----------
         executor: ~concurrent.futures.Executor, optional
-            An executor with at least the :meth:`~concurrent.futures.Executor.submit` method implemented. If not provided, the tasks will run sequentially in the current thread
+            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. Each file will be checked in a separate task. If not provided, the tasks will run sequentially in the current thread.
 
         Returns
         -------
         Friend
             A copy of ``self`` with invalid chunks removed.
         """
-        friend = Friend(self.name)
-        for target, chunks in self._data.items():
-            for chunk in chunks:
-                callback = _friend_cleanup_callback(
-                    friend, target.slice(chunk.start, chunk.stop)
-                )
-                job = _friend_cleanup_job(chunk, self._branches)
-                if executor is None:
-                    callback(job())
-                else:
-                    executor.submit(job).add_done_callback(callback)
-        return friend
+        items, files = self._cleanup_items()
+        return self._cleanup_report(items, Chunk._integrity_run(files, executor))
+
+    @__on_disk
+    async def cleanup_async(self, concurrency: int = 16) -> Friend:
+        """
+        Asynchronous version of :meth:`cleanup`.
+
+        Parameters
+        ----------
+        concurrency : int, optional, default=16
+            Maximum number of files checked at the same time.
+
+        Returns
+        -------
+        Friend
+            A copy of ``self`` with invalid chunks removed.
+        """
+        items, files = self._cleanup_items()
+        return self._cleanup_report(
+            items, await Chunk._integrity_run_async(files, concurrency)
+        )
 
     def update(self, paths: Iterable[Chunk]) -> Friend:
         """
@@ -763,13 +1114,15 @@ class Friend(Configurable, namespace="root.Friend"):
         """
         sources = {chunk.uuid: chunk.path for chunk in paths}
         friend = Friend(self.name)
+        items = []
         for target, chunks in self._data.items():
             for chunk in chunks:
                 new = chunk.chunk
                 if (path := sources.get(new.uuid)) is not None:
                     new = new.deepcopy()
                     new.path = path
-                friend.add(target.slice(chunk.start, chunk.stop), new)
+                items.append((target.slice(chunk.start, chunk.stop), new))
+        friend.add_many(items)
         return friend
 
     def reset(
@@ -785,7 +1138,7 @@ class Friend(Configurable, namespace="root.Friend"):
         confirm : bool, optional, default=True
             Confirm the deletion.
         executor: ~concurrent.futures.Executor, optional
-            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. If not provided, the tasks will run sequentially in the current thread
+            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. If not provided, the files will be removed by :meth:`~heptools.system.eos.EOS.rm_many`.
 
         """
         files: list[EOS] = []
@@ -800,12 +1153,17 @@ class Friend(Configurable, namespace="root.Friend"):
             if confirmation != self.name:
                 logging.info("Deletion aborted.")
                 return
-        (map_executor if executor is None else executor.map)(_eos_rm, files)
+        if executor is None:
+            EOS.rm_many(files).raise_errors()
+        else:
+            executor.map(_eos_rm, files)
         self._branches = None
         self._data.clear()
         if hasattr(self, _FRIEND_DUMP):
             del self.__dump
             del self.__naming
+            del self.__size
+            del self.__since
         if hasattr(self, _FRIEND_AUTO):
             del self.__auto
 
@@ -839,6 +1197,9 @@ class Friend(Configurable, namespace="root.Friend"):
         clean: bool = True,
         executor: Optional[Executor] = None,
         transform: Callable[[ak.Array], ak.Array] = None,
+        copy_baskets: bool = False,
+        max_writes: int = ...,
+        retries: int = 0,
         dask: bool = False,
     ) -> Friend | Future[Friend]:
         """
@@ -866,9 +1227,15 @@ class Friend(Configurable, namespace="root.Friend"):
         clean : bool, optional, default=True
             If ``True``, clean the original friend chunks after merging.
         executor: ~concurrent.futures.Executor, optional
-            An executor with at least the :meth:`~concurrent.futures.Executor.submit` method implemented.
+            An executor with at least the :meth:`~concurrent.futures.Executor.submit` method implemented. Each output chunk will be submitted as a separate task.
         transform : ~typing.Callable[[ak.Array], ak.Array], optional
             A function to transform the array before writing.
+        copy_baskets : bool, optional, default=False
+            If ``True``, copy the compressed baskets without decompression when possible. See :func:`~.merge.merge` for details.
+        max_writes : int, optional
+            Maximum number of concurrent tasks writing to the same host. Only used with ``executor``. See :func:`~.merge.resize` for details.
+        retries : int, optional, default=0
+            Number of retries for each failed task. Only used with ``executor``.
         dask : bool, optional, default=False
             If ``True``, return a :class:`~dask.delayed.Delayed` object.
 
@@ -899,13 +1266,14 @@ class Friend(Configurable, namespace="root.Friend"):
                 reader_options=reader_options,
                 clean_source=clean,
                 transform=transform,
+                copy_baskets=copy_baskets,
                 dask=dask,
             )
             callback = _friend_merge_callback(data, dummy.start, dummy.stop, target)
             if executor is None:
                 callback(chunks())
             else:
-                job = executor.submit(chunks)
+                job = chunks(executor=executor, max_writes=max_writes, retries=retries)
                 job.add_done_callback(callback)
                 jobs.append(job)
         friend_meta = dict(name=self.name, branches=self._branches)
@@ -934,7 +1302,7 @@ class Friend(Configurable, namespace="root.Friend"):
         execute : bool, optional, default=False
             If ``True``, clone the files immediately.
         executor: ~concurrent.futures.Executor, optional
-            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. If not provided, the tasks will run sequentially in the current thread.
+            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. If not provided, the files will be copied by :meth:`~heptools.system.eos.EOS.cp_many`.
 
         Returns
         -------
@@ -978,9 +1346,21 @@ class Friend(Configurable, namespace="root.Friend"):
                 chunk.path = path
                 friend._data[target].append(_FriendItem(item.start, item.stop, chunk))
         if execute:
-            (map_executor if executor is None else executor.map)(_eos_cp, src, dst)
+            if executor is None:
+                EOS.cp_many(zip(src, dst), parents=True, overwrite=True).raise_errors()
+            else:
+                executor.map(_eos_cp, src, dst)
         return friend
 
+    def _integrity_chunks(self):
+        checked = []
+        for target, items in self._data.items():
+            checked.append(target)
+            for item in items:
+                if item.on_disk:
+                    checked.append(item.chunk)
+        return checked
+
     def integrity(self, executor: Executor = None):
         """
         Check and report the following:
@@ -991,23 +1371,31 @@ class Friend(Configurable, namespace="root.Friend"):
         - gaps or overlaps between friend chunks
         - in-memory data
 
-        This method can be very expensive for large friend trees.
+        The chunks are checked by :meth:`~.chunk.Chunk.integrity_many`, so each file is only opened once.
 
         Parameters
         ----------
         executor: ~concurrent.futures.Executor, optional
-            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. If not provided, the tasks will run sequentially in the current thread.
+            An executor with at least the :meth:`~concurrent.futures.Executor.map` method implemented. Each file will be checked in a separate task. If not provided, the tasks will run sequentially in the current thread.
         """
-        checked = []
-        files = set()
-        for target, items in self._data.items():
-            checked.append(target)
-            for item in items:
-                if item.on_disk:
-                    checked.append(item.chunk)
-        checked = deque(
-            (map if executor is None else executor.map)(Chunk.integrity, checked)
+        self._integrity_report(Chunk.integrity_many(self._integrity_chunks(), executor))
+
+    async def integrity_async(self, concurrency: int = 16):
+        """
+        Asynchronous version of :meth:`integrity`.
+
+        Parameters
+        ----------
+        concurrency : int, optional, default=16
+            Maximum number of files checked at the same time.
+        """
+        self._integrity_report(
+            await Chunk.integrity_async(self._integrity_chunks(), concurrency)
         )
+
+    def _integrity_report(self, checked: list[Optional[Chunk]]):
+        checked = deque(checked)
+        files = set()
         for target, items in self._data.items():
             target = checked.popleft()
             if target is not None:
@@ -1068,7 +1456,7 @@ class Friend(Configurable, namespace="root.Friend"):
             "branches": (
                 list(self._branches) if self._branches is not None else self._branches
             ),
-            "data": [*self._data.items()],
+            "data": [(k, [*vs]) for k, vs in self._data.items()],
         }
 
     @classmethod
@@ -1093,7 +1481,132 @@ class Friend(Configurable, namespace="root.Friend"):
             for v in vs:
                 v["chunk"]["branches"] = friend._branches
                 items.append(_FriendItem.from_json(v))
-            friend._data[Chunk.from_json(k)] = items
+            friend._data[Chunk.from_json(k)] = _FriendSeries(items)
+        return friend
+
+    @classmethod
+    def resume(cls, journal: PathLike, name: str = None) -> Friend:
+        """
+        Recover the dumped chunks from ``journal`` written by :meth:`dump`. The dumped files will not be read.
+
+        Parameters
+        ----------
+        journal : PathLike
+            Path to the journal file.
+        name : str, optional
+            Name of the friend tree. Only used when ``journal`` does not exist or is empty.
+
+        Returns
+        -------
+        Friend
+            A :class:`Friend` object with all recorded chunks.
+
+        Notes
+        -----
+        A record that cannot be parsed (e.g. the last line written by an interrupted job) will be skipped with a warning. If the same range of a target is recorded multiple times, the last record will be used.
+        """
+        records: dict[tuple[Chunk, int, int], Chunk] = {}
+        if os.path.exists(journal):
+            with open(journal) as f:
+                for i, line in enumerate(f):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logging.warning(
+                            f'Skip corrupted record at line {i + 1} in journal "{journal}"'
+                        )
+                        continue
+                    if name is None:
+                        name = record["name"]
+                    elif name != record["name"]:
+                        raise ValueError(
+                            f'Cannot resume friend tree "{name}" from the record of "{record["name"]}"'
+                        )
+                    target = Chunk.from_json(record["target"])
+                    key = target, record["start"], record["stop"]
+                    records.pop(key, None)
+                    records[key] = Chunk.from_json(record["chunk"])
+        if name is None:
+            raise ValueError(f'Cannot find the name of friend tree in "{journal}"')
+        friend = cls(name)
+        friend.add_many(
+            (target.slice(start, stop), chunk)
+            for (target, start, stop), chunk in records.items()
+        )
+        return friend
+
+    @__on_disk
+    def to_npz(self, file, compressed: bool = False):
+        """
+        Save ``self`` to a ``.npz`` file in a columnar format. See :meth:`~.chunk.Chunk.to_columns` for details.
+
+        Parameters
+        ----------
+        file : str or file-like
+            Output file passed to :func:`numpy.savez`.
+        compressed : bool, optional, default=False
+            If ``True``, use :func:`numpy.savez_compressed`.
+        """
+        targets = [*self._data]
+        items = [item for target in targets for item in self._data[target]]
+        columns = {
+            "name": np.array(self.name),
+            "branches": np.array(sorted(self._branches or ()), dtype=str),
+            "branches.mask": np.array(self._branches is not None),
+            "target.offsets": np.cumsum(
+                [0, *(len(self._data[target]) for target in targets)], dtype=np.int64
+            ),
+            "friend.start": np.fromiter(
+                (item.start for item in items), dtype=np.int64, count=len(items)
+            ),
+            "friend.stop": np.fromiter(
+                (item.stop for item in items), dtype=np.int64, count=len(items)
+            ),
+        }
+        for prefix, chunks, branches in (
+            ("target.", targets, True),
+            ("friend.", (item.chunk for item in items), False),
+        ):
+            for k, v in Chunk.to_columns(chunks, branches=branches).items():
+                columns[f"{prefix}{k}"] = v
+        (np.savez_compressed if compressed else np.savez)(file, **columns)
+
+    @classmethod
+    def from_npz(cls, file, lazy: bool = True):
+        """
+        Load :class:`Friend` from a ``.npz`` file created by :meth:`to_npz`.
+
+        Parameters
+        ----------
+        file : str or file-like
+            Input file passed to :func:`numpy.load`.
+        lazy : bool, optional, default=True
+            If ``True``, the friend chunks of each target will only be created when the target is accessed, and each column of the friend chunks will only be read when first needed. The ``file`` is kept open until the :class:`Friend` is released.
+
+        Returns
+        -------
+        Friend
+            A :class:`Friend` object from the file.
+        """
+        npz = np.load(file)
+        friend = cls(str(npz["name"]))
+        if npz["branches.mask"]:
+            friend._branches = frozenset(map(str, npz["branches"]))
+        targets = _ChunkColumns(npz, "target.").decode()
+        chunks = _ChunkColumns(npz, "friend.")
+        offsets = npz["target.offsets"].tolist()
+        starts, stops = npz["friend.start"], npz["friend.stop"]
+        for i, target in enumerate(targets):
+            rows = slice(offsets[i], offsets[i + 1])
+            loader = _friend_lazy_items(
+                chunks, rows, starts[rows], stops[rows], friend._branches
+            )
+            series = _FriendSeries._lazy(starts[rows], stops[rows], loader)
+            if not lazy:
+                series._items
+            friend._data[target] = series
+        if not lazy:
+            npz.close()
         return friend
 
     @__on_disk
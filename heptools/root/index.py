@@ -0,0 +1,219 @@
+"""
+A persistent local index of :class:`~.chunk.Chunk` metadata backed by :mod:`sqlite3`.
+
+.. note::
+    The index is disabled unless :data:`MetadataIndex.path` is set. The files are validated by size and modification time from :meth:`~heptools.system.eos.EOS.stat`. Set :data:`MetadataIndex.trust_remote` to skip the validation of remote files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from typing import TYPE_CHECKING, Iterable, Optional
+from uuid import UUID
+
+from ..config import Configurable, config
+
+if TYPE_CHECKING:
+    from .chunk import Chunk
+
+__all__ = ["MetadataIndex", "metadata_index"]
+
+_BATCH = 500
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS branch_sets (
+    id INTEGER PRIMARY KEY,
+    digest TEXT UNIQUE NOT NULL,
+    names TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    num_entries INTEGER NOT NULL,
+    branch_set INTEGER NOT NULL REFERENCES branch_sets(id),
+    size INTEGER,
+    mtime REAL,
+    PRIMARY KEY (path, name)
+);
+"""
+
+
+def _stat_many(
+    chunks: list[Chunk], remote: bool = True
+) -> dict[str, tuple[Optional[int], Optional[float]]]:
+    from ..system.eos import EOS
+
+    stats = {}
+    paths = [*dict.fromkeys(chunk.path for chunk in chunks)]
+    for path in paths:
+        if path.is_local:
+            try:
+                stat = os.stat(path.path)
+            except OSError:
+                continue
+            stats[str(path)] = stat.st_size, stat.st_mtime
+    if remote:
+        report = EOS.stat_many(path for path in paths if not path.is_local)
+        for path, stat in report.results.items():
+            stats[str(path)] = stat.st_size, stat.st_mtime
+    return stats
+
+
+class MetadataIndex(Configurable, namespace="root.MetadataIndex"):
+    """
+    Store the ``branches``, ``num_entries`` and ``uuid`` of chunks keyed by path and tree name.
+    """
+
+    path = config(None)
+    """str : Path to the SQLite database. If ``None``, the index is disabled."""
+    timeout = config(60.0)
+    """float : Seconds to wait for the database lock."""
+    trust_remote = config(False)
+    """bool : If ``True``, skip the :meth:`~heptools.system.eos.EOS.stat` of remote files and only invalidate their records when the UUID of the chunk differs from the stored one."""
+
+    @property
+    def enabled(self):
+        """bool : Whether the index is enabled."""
+        return self.path is not None
+
+    def _connect(self):
+        db = sqlite3.connect(os.fspath(self.path), timeout=self.timeout)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript(_SCHEMA)
+        return db
+
+    def load(self, chunks: Iterable[Chunk]) -> list[bool]:
+        """
+        Fill the missing metadata of ``chunks`` in-place from the index.
+
+        Parameters
+        ----------
+        chunks : ~typing.Iterable[Chunk]
+            Chunks to look up.
+
+        Returns
+        -------
+        list[bool]
+            Whether each chunk is found in the index.
+        """
+        chunks = [*chunks]
+        if not self.enabled or not chunks:
+            return [False] * len(chunks)
+        paths = [*dict.fromkeys(str(chunk.path) for chunk in chunks)]
+        rows: dict[tuple[str, str], tuple] = {}
+        sets: dict[int, frozenset[str]] = {}
+        with closing(self._connect()) as db:
+            for i in range(0, len(paths), _BATCH):
+                batch = paths[i : i + _BATCH]
+                for path, name, *row in db.execute(
+                    "SELECT path, name, uuid, num_entries, branch_set, size, mtime "
+                    f"FROM chunks WHERE path IN ({','.join('?' * len(batch))})",
+                    batch,
+                ):
+                    rows[path, name] = row
+            ids = [*{row[2] for row in rows.values()}]
+            for i in range(0, len(ids), _BATCH):
+                batch = ids[i : i + _BATCH]
+                for id, names in db.execute(
+                    "SELECT id, names FROM branch_sets "
+                    f"WHERE id IN ({','.join('?' * len(batch))})",
+                    batch,
+                ):
+                    sets[id] = frozenset(json.loads(names))
+        stats = _stat_many(
+            [
+                chunk
+                for chunk in chunks
+                if (str(chunk.path), chunk.name) in rows
+                and (chunk.path.is_local or not self.trust_remote)
+            ]
+        )
+        found = []
+        for chunk in chunks:
+            row = rows.get((str(chunk.path), chunk.name))
+            if row is None:
+                found.append(False)
+                continue
+            uuid, num_entries, branch_set, size, mtime = row
+            uuid = UUID(uuid)
+            if (
+                (chunk._uuid is not ... and chunk._uuid != uuid)
+                or (chunk._num_entries is not ... and chunk._num_entries != num_entries)
+                or (
+                    (chunk.path.is_local or not self.trust_remote)
+                    and (size is None or (size, mtime) != stats.get(str(chunk.path)))
+                )
+            ):
+                found.append(False)
+                continue
+            chunk._uuid = uuid
+            chunk._num_entries = num_entries
+            if chunk._branches is ...:
+                chunk._branches = sets[branch_set]
+            found.append(True)
+        return found
+
+    def save(self, *chunks: Chunk):
+        """
+        Store the metadata of ``chunks`` to the index. The existing records will be replaced.
+
+        Parameters
+        ----------
+        chunks : tuple[Chunk]
+            Chunks with metadata fetched.
+        """
+        if not self.enabled or not chunks:
+            return
+        sets: dict[str, str] = {}
+        records = []
+        stats = _stat_many(chunks, remote=not self.trust_remote)
+        for chunk in chunks:
+            names = json.dumps(sorted(chunk.branches))
+            digest = hashlib.sha1(names.encode()).hexdigest()
+            sets[digest] = names
+            records.append(
+                (
+                    str(chunk.path),
+                    chunk.name,
+                    str(chunk.uuid),
+                    chunk.num_entries,
+                    digest,
+                    *stats.get(str(chunk.path), (None, None)),
+                )
+            )
+        with closing(self._connect()) as db, db:
+            db.executemany(
+                "INSERT OR IGNORE INTO branch_sets (digest, names) VALUES (?, ?)",
+                sets.items(),
+            )
+            db.executemany(
+                "INSERT OR REPLACE INTO chunks "
+                "(path, name, uuid, num_entries, branch_set, size, mtime) "
+                "SELECT ?, ?, ?, ?, id, ?, ? FROM branch_sets WHERE digest = ?",
+                [(*r[:4], *r[5:], r[4]) for r in records],
+            )
+
+    def remove(self, *chunks: Chunk):
+        """
+        Remove ``chunks`` from the index.
+
+        Parameters
+        ----------
+        chunks : tuple[Chunk]
+            Chunks to remove.
+        """
+        if not self.enabled or not chunks:
+            return
+        with closing(self._connect()) as db, db:
+            db.executemany(
+                "DELETE FROM chunks WHERE path = ? AND name = ?",
+                [(str(chunk.path), chunk.name) for chunk in chunks],
+            )
+
+
+metadata_index = MetadataIndex()
+"""MetadataIndex : The index used by :mod:`heptools.root`."""
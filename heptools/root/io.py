@@ -32,8 +32,22 @@ A wrapper for ROOT file I/O :func:`uproot.reading.open`, :func:`uproot._dask.das
 from __future__ import annotations
 
 import logging
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
 from numbers import Number
-from typing import TYPE_CHECKING, Callable, Generator, Literal, TypedDict, overload
+from queue import Queue
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generator,
+    Iterable,
+    Literal,
+    Optional,
+    TypedDict,
+    overload,
+)
 
 import uproot
 from packaging.version import Version
@@ -41,12 +55,18 @@ from packaging.version import Version
 from ..system.eos import EOS, PathLike
 from ._backend import (
     concat_record,
+    fill_record,
+    keyof_record,
     len_record,
     materialize_record,
     record_backend,
+    sizeof_record,
     slice_record,
 )
+from .cache import column_cache
 from .chunk import Chunk
+from .index import metadata_index
+from .pool import file_pool
 
 if TYPE_CHECKING:
     import awkward as ak
@@ -74,14 +94,165 @@ if TYPE_CHECKING:
     str, Number, ~numpy.typing.ArrayLike: dtypes supported by :mod:`uproot`
     """
 
+if TYPE_CHECKING:
+    from uproot.compression import Compression
+
+    CompressionLike = str | tuple[str, int] | Compression | None
+    """
+    str, tuple[str, int], ~uproot.compression.Compression, None: A compression algorithm with optional level e.g. ``'ZSTD'``, ``'ZSTD:5'``, ``('ZSTD', 5)`` or ``uproot.ZSTD(5)``. ``None`` means no compression.
+    """
+
 _UTF8_NULL = "\x00"
 _UTF8_CONT = b"\x80"
+_COMPRESSION_LEVELS = {"ZLIB": 1, "LZMA": 7, "LZ4": 4, "ZSTD": 5}
 
 
 def _align_utf8(s: bytes, n: int) -> bytes:
     return s + _UTF8_CONT * ((n - len(s)) % n)
 
 
+def parse_compression(spec: CompressionLike) -> Optional[Compression]:
+    """
+    Convert ``spec`` to :class:`uproot.compression.Compression`.
+
+    Parameters
+    ----------
+    spec : CompressionLike
+        Compression algorithm and level. If the level is not given, the ROOT default of the algorithm will be used.
+
+    Returns
+    -------
+    ~uproot.compression.Compression or None
+        Compression used by :mod:`uproot`.
+    """
+    if spec is None or isinstance(spec, uproot.compression.Compression):
+        return spec
+    if isinstance(spec, str):
+        algorithm, _, level = spec.partition(":")
+        level = int(level) if level else ...
+    else:
+        algorithm, level = spec
+    algorithm = algorithm.upper()
+    if algorithm not in _COMPRESSION_LEVELS:
+        raise ValueError(f'Unknown compression algorithm "{algorithm}".')
+    if level is ...:
+        level = _COMPRESSION_LEVELS[algorithm]
+    return getattr(uproot, algorithm)(level)
+
+
+def _prefetch(
+    func: Callable[..., RecordLike],
+    steps: Iterable[tuple],
+    depth: int,
+    executor: Executor = None,
+    max_bytes: int = ...,
+) -> Generator[RecordLike, None, None]:
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=depth) as pool:
+            yield from _prefetch(func, steps, depth, pool, max_bytes)
+        return
+    steps = iter(steps)
+    queue: deque[Future] = deque()
+    sizes: dict[Future, int] = {}
+    estimate = None
+    try:
+        while True:
+            while len(queue) < depth:
+                if queue and max_bytes is not ...:
+                    if estimate is None:
+                        break
+                    for future in queue:
+                        if future not in sizes and future.done():
+                            if future.exception() is None:
+                                sizes[future] = sizeof_record(future.result())
+                    inflight = sum(sizes.get(f, estimate) for f in queue)
+                    if inflight + estimate > max_bytes:
+                        break
+                args = next(steps, None)
+                if args is None:
+                    break
+                queue.append(executor.submit(func, *args))
+            if not queue:
+                return
+            future = queue.popleft()
+            data = future.result()
+            size = sizes.pop(future, None)
+            if max_bytes is not ...:
+                if size is None:
+                    size = sizeof_record(data)
+                estimate = size if estimate is None else max(estimate, size)
+            future = None
+            yield data
+            data = None
+    finally:
+        for future in queue:
+            future.cancel()
+
+
+def _cache_columns(data: RecordLike, library: str) -> dict[str, ak.Array]:
+    import awkward as ak
+
+    if library == "ak":
+        return {k: data[k] for k in data.fields}
+    if library == "pd":
+        data = {k: data[k].to_numpy() for k in data.columns}
+    return {k: ak.from_numpy(v) for k, v in data.items() if v.dtype != object}
+
+
+def _merge_cached(
+    data: Optional[RecordLike],
+    cached: dict[str, ak.Array],
+    library: str,
+    order: list[str],
+) -> RecordLike:
+    import awkward as ak
+
+    if library == "ak":
+        columns = {} if data is None else {k: data[k] for k in data.fields}
+        columns |= cached
+        return ak.zip({k: columns[k] for k in order}, depth_limit=1)
+    cached = {k: ak.to_numpy(v) for k, v in cached.items()}
+    if library == "pd":
+        import pandas as pd
+
+        cached = pd.DataFrame(cached)
+        if data is None:
+            return cached
+        return pd.concat([data, cached], axis=1)[order]
+    columns = (data or {}) | cached
+    return {k: columns[k] for k in order}
+
+
+class _BackgroundWriter:
+    def __init__(self, size: int):
+        self.error: BaseException = None
+        self._queue: Queue[Callable[[], None]] = Queue(maxsize=size)
+        self._thread = threading.Thread(
+            target=self._run, name="TreeWriter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while (job := self._queue.get()) is not None:
+            if self.error is None:
+                try:
+                    job()
+                except BaseException as e:
+                    self.error = e
+
+    def check(self):
+        if self.error is not None:
+            raise self.error
+
+    def submit(self, job: Callable[[], None]):
+        self.check()
+        self._queue.put(job)
+
+    def join(self):
+        self._queue.put(None)
+        self._thread.join()
+
+
 class _Reader:
     _open_options = {
         "object_cache": None,
@@ -103,11 +274,15 @@ class WriterOptions(TypedDict, total=False):
     name: str
     parents: bool
     basket_size: int
+    background: int
+    compression: CompressionLike
+    branch_compression: dict[str, CompressionLike]
 
 
 class ReaderOptions(TypedDict, total=False):
     branch_filter: Callable[[set[str]], set[str]]
     transform: Callable[[RecordLike], RecordLike]
+    cache: bool
 
 
 BRANCH_FILTER = "branch_filter"
@@ -125,8 +300,17 @@ class TreeWriter:
         Create parent directories if not exist.
     basket_size : int, optional
         Size of :class:`TBasket`. If not given, a new :class:`TBasket` will be created for each :meth:`extend` call.
+    background : int, optional
+        If given, compress and write :class:`TBasket` in a background thread with at most ``background`` pending baskets. :meth:`extend` will block when the queue is full. The errors raised in the background will be raised by the next :meth:`extend` or :meth:`__exit__`.
+    compression : CompressionLike, optional
+        Default compression of all branches. If not given, the :mod:`uproot` default will be used. See :func:`parse_compression` for details.
+    branch_compression : dict[str, CompressionLike], optional
+        Override the compression of the branches with given names, including the generated counter branches e.g. ``n{name}`` for jagged arrays.
     **options: dict, optional
         Additional options passed to :func:`uproot.recreate`.
+
+    .. warning::
+        When ``background`` is given, the data passed to :meth:`extend` may be written after the call returns and should not be modified in-place.
     """
 
     tree: Chunk | list[Chunk]
@@ -137,11 +321,20 @@ class TreeWriter:
         name: str = "Events",
         parents: bool = True,
         basket_size: int = ...,
+        background: int = ...,
+        compression: CompressionLike = ...,
+        branch_compression: dict[str, CompressionLike] = None,
         **options,
     ):
         self._default_name = name
         self._parents = parents
         self._basket_size = basket_size
+        self._background = background
+        self._branch_compression = {
+            k: parse_compression(v) for k, v in (branch_compression or {}).items()
+        }
+        if compression is not ...:
+            options["compression"] = parse_compression(compression)
         self._options = options
 
         self.tree: Chunk | list[Chunk] = None
@@ -178,14 +371,24 @@ class TreeWriter:
         self._temp = self._path.local_temp(dir=".")
         self._file = uproot.recreate(self._temp, **self._options)
         self._trees = {self._tree_name: 0}
+        if self._background is not ...:
+            self._writer = _BackgroundWriter(self._background)
         return self
 
     def __exit__(self, *exc):
         """
-        If no exception is raised, move the temporary file to the output path and store :class:`~.chunk.Chunk` information to :data:`tree`.
+        If no exception is raised, move the temporary file to the output path and store :class:`~.chunk.Chunk` information to :data:`tree`. When copied to a remote path, the temporary file is only removed after the adler32 checksum is verified. See :data:`EOS.transfer_streams <heptools.system.eos.EOS.transfer_streams>` for parallel transfers.
         """
         if not any(exc):
-            self._flush()
+            try:
+                self._flush()
+                self._join(check=True)
+            except BaseException:
+                self._join(check=False)
+                self._file.close()
+                self._temp.rm()
+                self._reset()
+                raise
             self._file.close()
             self.tree = []
             with uproot.open(self._temp) as file:
@@ -201,12 +404,17 @@ class TreeWriter:
                             f'Tree "{tree}" is corrupted. Expected {size} entries, got {chunk.num_entries}.'
                         )
             if len(self.tree) > 0:
-                self._temp.move_to(self._path, parents=self._parents, overwrite=True)
+                file_pool.invalidate(self._path)
+                self._temp.move_to(
+                    self._path, parents=self._parents, overwrite=True, checksum=True
+                )
+                metadata_index.save(*self.tree)
                 if len(self.tree) == 1:
                     self.tree = self.tree[0]
             else:
                 self._temp.rm()
         else:
+            self._join(check=False)
             self._file.close()
             self._temp.rm()
         self._reset()
@@ -222,6 +430,48 @@ class TreeWriter:
         self._buffer = None if self._basket_size is ... else []
         self._backend = None
         self._trees = None
+        self._writer: _BackgroundWriter = None
+
+    def _join(self, check: bool):
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.join()
+            if check:
+                writer.check()
+
+    def _submit(self, func: Callable, *args):
+        if self._writer is None:
+            func(*args)
+        else:
+            self._writer.submit(partial(func, *args))
+
+    def _write(self, name: str, data: RecordLike, override: bool = True):
+        if name not in self._file:
+            if not (override and self._branch_compression):
+                self._file[name] = data
+                return
+            if self._backend == "ak":
+                import awkward as ak
+
+                types = {k: ak.type(data[k]).content for k in keyof_record(data)}
+            else:
+                import numpy as np
+
+                types = {}
+                for k in keyof_record(data):
+                    column = data[k]
+                    types[k] = (
+                        column.dtype
+                        if column.ndim <= 1
+                        else np.dtype((column.dtype, column.shape[1:]))
+                    )
+            tree = self._file.mktree(name, types)
+            for branch, codec in self._branch_compression.items():
+                try:
+                    tree[branch].compression = codec
+                except KeyError:
+                    ...
+        self._file[name].extend(data)
 
     def _flush(self):
         if self._basket_size is ...:
@@ -236,10 +486,7 @@ class TreeWriter:
 
                 if akext.is_jagged(data):
                     data = {k: data[k] for k in data.fields}
-            if self._tree_name not in self._file:
-                self._file[self._tree_name] = data
-            else:
-                self._file[self._tree_name].extend(data)
+            self._submit(self._write, self._tree_name, data)
         data = None
 
     def extend(self, data: RecordLike):
@@ -294,6 +541,86 @@ class TreeWriter:
                     self._flush()
         return self
 
+    def _copy(self, name: str, sources: list[Chunk], branches: list[str], types, size):
+        from ._basket import copy_baskets
+
+        tree = self._file.mktree(name, types, initial_basket_capacity=size + 1)
+        for source in sources:
+            with file_pool.open(source.path, source._uuid) as file:
+                copy_baskets(tree, file[source.name], branches)
+
+    def copy_baskets(
+        self,
+        *sources: Chunk,
+        branch_filter: Callable[[set[str]], set[str]] = None,
+    ) -> bool:
+        """
+        Copy the compressed :class:`TBasket` of ``sources`` to the current :class:`TTree` without decompression, similar to ``hadd -f0``.
+
+        The baskets will only be copied if the current tree is empty, the writer does not set ``compression``, ``branch_compression`` or ``basket_size``, and all ``sources`` are whole :class:`TTree` with the same branch layout, compression and aligned baskets. Otherwise, nothing will be written.
+
+        .. note::
+            The copied baskets keep the compression and basket boundaries of ``sources``.
+
+        Parameters
+        ----------
+        sources : tuple[~heptools.root.chunk.Chunk]
+            Chunks to copy.
+        branch_filter : ~typing.Callable[[set[str]], set[str]], optional
+            A function to select branches from the common branches of ``sources``. The counter branches of the selected jagged branches are always copied.
+
+        Returns
+        -------
+        bool
+            Whether the baskets are copied.
+        """
+        from ._basket import (
+            basket_aligned,
+            basket_compression,
+            basket_layout,
+            basket_types,
+        )
+
+        if not sources or self._trees.get(self._tree_name) != 0:
+            return False
+        if (
+            "compression" in self._options
+            or self._branch_compression
+            or self._basket_size is not ...
+        ):
+            return False
+        for source in sources:
+            if source.entry_start != 0 or source.entry_stop != source.num_entries:
+                return False
+        branches = frozenset.intersection(*(source.branches for source in sources))
+        if branch_filter is not None:
+            branches = branch_filter(set(branches))
+        if not branches:
+            return False
+        layout = compression = None
+        size = 0
+        for source in sources:
+            with file_pool.open(source.path, source._uuid) as file:
+                tree = file[source.name]
+                current = basket_layout(tree, branches)
+                if current is None or (layout is not None and current != layout):
+                    return False
+                layout = current
+                current = basket_compression(tree, layout)
+                if compression is not None and current != compression:
+                    return False
+                compression = current
+                baskets = basket_aligned(tree, layout)
+                if baskets is None:
+                    return False
+                size += baskets
+        types = basket_types(layout)
+        if types is None:
+            return False
+        self._trees[self._tree_name] += sum(source.num_entries for source in sources)
+        self._submit(self._copy, self._tree_name, [*sources], [*layout], types, size)
+        return True
+
     def switch(self, name: str):
         """
         Switch to another tree in the same ROOT file.
@@ -345,7 +672,9 @@ class TreeWriter:
         else:
             self._trees[name] = None
         if Version(uproot.__version__) >= Version("5.0.0"):
-            self._file[name] = {k: [v] for k, v in metadata.items()}
+            self._submit(
+                self._write, name, {k: [v] for k, v in metadata.items()}, False
+            )
         else:
             import awkward as ak
             import numpy as np
@@ -356,7 +685,7 @@ class TreeWriter:
                     v = np.frombuffer(_align_utf8(v.encode("utf-8"), 8), dtype=np.int64)
                     k = f"{_UTF8_NULL}{k}"
                 data[k] = ak.Array([v])
-            self._file[name] = data
+            self._submit(self._write, name, data, False)
         return self
 
 
@@ -370,6 +699,8 @@ class TreeReader(_Reader):
         A function to select branches. If not given, all branches will be read.
     transform : ~typing.Callable[[RecordLike], RecordLike], optional
         A function to transform the data after reading. If not given, no transformation will be applied.
+    cache : bool, optional, default=True
+        If ``True``, use the :data:`~.cache.column_cache` when it is enabled. See :meth:`arrays` for details.
     **options : dict, optional
         Additional options passed to :func:`uproot.open`.
     """
@@ -378,11 +709,13 @@ class TreeReader(_Reader):
         self,
         branch_filter: Callable[[set[str]], set[str]] = None,
         transform: Callable[[RecordLike], RecordLike] = None,
+        cache: bool = True,
         **options,
     ):
         super().__init__(**options)
         self._filter = branch_filter
         self._transform = transform
+        self._cache = cache
 
     @overload
     def arrays(
@@ -431,24 +764,42 @@ class TreeReader(_Reader):
         -------
         RecordLike
             Data from :class:`TTree`.
+
+        Notes
+        -----
+        If the :data:`~.cache.column_cache` is enabled and no additional ``options`` are given, the cached columns will be loaded before opening the file and only the missing ones will be read. The newly read columns will be stored to the cache before ``transform`` is applied. For ``library='np'`` and ``library='pd'``, the jagged columns are always read from the file.
         """
         options["library"] = library
         branches = source.branches
         if self._filter is not None:
             branches = self._filter(branches)
+        cached = {}
+        cache = self._cache and column_cache.enabled and len(options) == 1
+        if cache:
+            order = [*branches]
+            cached = column_cache.get(source, order, library)
+            branches = [k for k in order if k not in cached]
         try:
-            with uproot.open(source.path, **self._open_options) as file:
-                data = file[source.name].arrays(
-                    expressions=branches,
-                    entry_start=source.entry_start,
-                    entry_stop=source.entry_stop,
-                    **options,
-                )
+            data = None
+            if not cached or branches:
+                with file_pool.open(
+                    source.path, source._uuid, **self._open_options
+                ) as file:
+                    data = file[source.name].arrays(
+                        expressions=branches,
+                        entry_start=source.entry_start,
+                        entry_stop=source.entry_stop,
+                        **options,
+                    )
                 if library == "pd":
                     data.reset_index(drop=True, inplace=True)
-                if self._transform is not None:
-                    data = self._transform(data)
-                return data
+                if cache:
+                    column_cache.put(source, _cache_columns(data, library))
+            if cached:
+                data = _merge_cached(data, cached, library, order)
+            if self._transform is not None:
+                data = self._transform(data)
+            return data
         except Exception as e:
             logging.error(f"Failed to read {source.path}", exc_info=e)
             raise
@@ -483,6 +834,8 @@ class TreeReader(_Reader):
         """
         Read ``sources`` into one array. The branches of ``sources`` must be the same after filtering.
 
+        If no ``transform`` is given, the output of ``library='ak'`` and ``library='np'`` will be preallocated from the length of ``sources`` and each source will be released once copied.
+
         .. todo::
             Add :mod:`multiprocessing` support.
 
@@ -505,6 +858,12 @@ class TreeReader(_Reader):
             return self.arrays(sources[0], **options)
         if library in ("ak", "pd", "np"):
             sources = Chunk.common(*sources)
+            if self._transform is None and library in ("ak", "np"):
+                return fill_record(
+                    (self.arrays(s, **options) for s in sources),
+                    sum(map(len, sources)),
+                    library=library,
+                )
             return concat_record(
                 [self.arrays(s, **options) for s in sources], library=library
             )
@@ -517,7 +876,11 @@ class TreeReader(_Reader):
         *sources: Chunk,
         step: int = ...,
         library: Literal["ak"] = "ak",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
         **options,
     ) -> Generator[ak.Array, None, None]: ...
     @overload
@@ -526,7 +889,11 @@ class TreeReader(_Reader):
         *sources: Chunk,
         step: int = ...,
         library: Literal["pd"] = "pd",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
         **options,
     ) -> Generator[pd.DataFrame, None, None]: ...
     @overload
@@ -535,7 +902,11 @@ class TreeReader(_Reader):
         *sources: Chunk,
         step: int = ...,
         library: Literal["np"] = "np",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
         **options,
     ) -> Generator[dict[str, np.ndarray], None, None]: ...
     def iterate(
@@ -543,7 +914,11 @@ class TreeReader(_Reader):
         *sources: Chunk,
         step: int = ...,
         library: Literal["ak", "pd", "np"] = "ak",
-        mode: Literal["balance", "partition"] = "partition",
+        mode: Literal["balance", "partition", "basket"] = "partition",
+        unit: Literal["entry", "byte"] = "entry",
+        prefetch: int = ...,
+        executor: Executor = None,
+        max_bytes: int = ...,
         **options,
     ) -> Generator[RecordLike, None, None]:
         """
@@ -557,11 +932,20 @@ class TreeReader(_Reader):
             Number of entries to read in each iteration step. If not given, the chunk size will be used and the ``mode`` will be ignored.
         library : ~typing.Literal['ak', 'np', 'pd'], optional, default='ak'
             The library used to represent arrays.
-        mode : ~typing.Literal['balance', 'partition'], optional, default='partition'
+        mode : ~typing.Literal['balance', 'partition', 'basket'], optional, default='partition'
             The mode to generate iteration steps.
 
             - ``mode='balance'``: use :meth:`~.chunk.Chunk.balance`. The length of output arrays is not guaranteed to be ``step`` but no need to concatenate.
             - ``mode='partition'``: use :meth:`~.chunk.Chunk.partition`. The length of output arrays is guaranteed to be ``step`` except for the last one but need to concatenate.
+            - ``mode='basket'``: use :meth:`~.chunk.Chunk.basket`. Same as ``mode='balance'`` but the boundaries are aligned to the :class:`TBasket` of the selected branches when possible.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``step``. If ``unit='byte'``, the steps are derived from the uncompressed size per entry of the selected branches. See :meth:`~.chunk.Chunk.partition` and :meth:`~.chunk.Chunk.balance` for details.
+        prefetch : int, optional
+            If given, read up to ``prefetch`` steps ahead in the background while the current one is being consumed. Must be at least 1. The order of output is preserved.
+        executor : ~concurrent.futures.Executor, optional
+            An executor with at least the :meth:`~concurrent.futures.Executor.submit` method implemented to read the prefetched steps. If not provided, a :class:`~concurrent.futures.ThreadPoolExecutor` with ``prefetch`` workers will be used. Only used when ``prefetch`` is given.
+        max_bytes : int, optional
+            If given, stop prefetching when the in-flight data measured by :func:`~._backend.sizeof_record` would exceed ``max_bytes``. The size of pending steps is estimated by the largest step read so far. At least one step is always in flight.
         **options : dict, optional
             Additional options passed to :meth:`arrays`.
 
@@ -570,19 +954,28 @@ class TreeReader(_Reader):
         RecordLike
             A chunk of data from :class:`TTree`.
         """
+        if prefetch is not ... and prefetch < 1:
+            raise ValueError(f"prefetch must be a positive integer, got {prefetch}.")
         options["library"] = library
+        split = dict(common_branches=True, unit=unit, branch_filter=self._filter)
         if step is ...:
             chunks = Chunk.common(*sources)
         elif mode == "partition":
-            chunks = Chunk.partition(step, *sources, common_branches=True)
+            chunks = Chunk.partition(step, *sources, **split)
         elif mode == "balance":
-            chunks = Chunk.balance(step, *sources, common_branches=True)
+            chunks = Chunk.balance(step, *sources, **split)
+        elif mode == "basket":
+            chunks = Chunk.basket(step, *sources, **split)
         else:
             raise ValueError(f'Unknown mode "{mode}".')
-        for chunk in chunks:
-            if not isinstance(chunk, list):
-                chunk = (chunk,)
-            yield self.concat(*chunk, **options)
+        chunks = (chunk if isinstance(chunk, list) else (chunk,) for chunk in chunks)
+        if prefetch is ...:
+            for chunk in chunks:
+                yield self.concat(*chunk, **options)
+        else:
+            yield from _prefetch(
+                partial(self.concat, **options), chunks, prefetch, executor, max_bytes
+            )
 
     @overload
     def dask(
@@ -590,6 +983,8 @@ class TreeReader(_Reader):
         *sources: Chunk,
         partition: int = ...,
         library: Literal["ak"] = "ak",
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
     ) -> dak.Array: ...
     @overload
     def dask(
@@ -597,12 +992,16 @@ class TreeReader(_Reader):
         *sources: Chunk,
         partition: int = ...,
         library: Literal["np"] = "np",
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
     ) -> dict[str, da.Array]: ...
     def dask(
         self,
         *sources: Chunk,
         partition: int = ...,
         library: Literal["ak", "np"] = "ak",
+        mode: Literal["balance", "basket"] = "balance",
+        unit: Literal["entry", "byte"] = "entry",
     ) -> DelayedRecordLike:
         """
         Read ``sources`` into delayed arrays.
@@ -615,16 +1014,28 @@ class TreeReader(_Reader):
             If given, the ``sources`` will be splitted into smaller chunks targeting ``partition`` entries.
         library : ~typing.Literal['ak', 'np'], optional, default='ak'
             The library used to represent arrays.
+        mode : ~typing.Literal['balance', 'basket'], optional, default='balance'
+            The mode to generate partitions. Only used when ``partition`` is given.
+
+            - ``mode='balance'``: use :meth:`~.chunk.Chunk.balance`.
+            - ``mode='basket'``: use :meth:`~.chunk.Chunk.basket`.
+        unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+            The unit of ``partition``. See :meth:`iterate` for details.
 
         Returns
         -------
         DelayedRecordLike
             Delayed data from :class:`TTree`.
         """
+        split = dict(common_branches=True, unit=unit, branch_filter=self._filter)
         if partition is ...:
             sources = Chunk.common(*sources)
+        elif mode == "balance":
+            sources = [*Chunk.balance(partition, *sources, **split)]
+        elif mode == "basket":
+            sources = [*Chunk.basket(partition, *sources, **split)]
         else:
-            sources = [*Chunk.balance(partition, *sources, common_branches=True)]
+            raise ValueError(f'Unknown mode "{mode}".')
         branches = sources[0].branches
         if self._filter is not None:
             branches = self._filter(branches)
@@ -661,7 +1072,7 @@ class TreeReader(_Reader):
         dict[str, UprootSupportedDtypes]
             A dictionary of metadata.
         """
-        with uproot.open(source.path, **self._open_options) as file:
+        with file_pool.open(source.path, source._uuid, **self._open_options) as file:
             if (num_entries := file[name].num_entries) != 1:
                 raise ValueError(
                     f"Expected one entry in {source.path}[{name}], got {num_entries}."
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Optional
 
 from ..dask.delayed import delayed
 from ..system.eos import EOS, PathLike
 from .chunk import Chunk
-from .io import ReaderOptions, TreeReader, TreeWriter, WriterOptions
+from .io import BRANCH_FILTER, ReaderOptions, TreeReader, TreeWriter, WriterOptions
 
 if TYPE_CHECKING:
     import awkward as ak
@@ -39,7 +44,7 @@ def move(
     """
     source = source.deepcopy()
     source.path = (source.path.move_to if clean_source else source.path.copy_to)(
-        path, overwrite=True, parents=True
+        path, overwrite=True, parents=True, checksum=True
     )
     return source
 
@@ -52,6 +57,8 @@ def merge(
     writer_options: WriterOptions = None,
     reader_options: ReaderOptions = None,
     transform: Callable[[ak.Array], ak.Array] = None,
+    unit: Literal["entry", "byte"] = "entry",
+    copy_baskets: bool = False,
     dask: bool = False,
 ):
     """
@@ -71,6 +78,10 @@ def merge(
         Additional options passed to :class:`~.io.TreeReader`.
     transform : ~typing.Callable[[ak.Array], ak.Array], optional
         A function to transform the array before writing.
+    unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+        The unit of ``step``. See :meth:`~.io.TreeReader.iterate` for details.
+    copy_baskets : bool, optional, default=False
+        If ``True``, copy the compressed baskets without decompression when no ``transform`` is given, ``writer_options`` does not set the compression or basket size, and all ``sources`` are whole trees with the same layout and compression. The output keeps the baskets of ``sources`` regardless of ``step``. See :meth:`~.io.TreeWriter.copy_baskets` for details.
     dask : bool, optional, default=False
         If ``True``, return a :class:`~dask.delayed.Delayed` object.
 
@@ -81,11 +92,20 @@ def merge(
     """
     writer_options = writer_options or {}
     reader_options = reader_options or {}
+    copy_baskets &= transform is None and reader_options.get("transform") is None
     with TreeWriter(**writer_options)(path) as writer:
-        for data in TreeReader(**reader_options).iterate(*sources, step=step):
-            if transform:
-                data = transform(data)
-            writer.extend(data)
+        if not (
+            copy_baskets
+            and writer.copy_baskets(
+                *sources, branch_filter=reader_options.get(BRANCH_FILTER)
+            )
+        ):
+            for data in TreeReader(**reader_options).iterate(
+                *sources, step=step, unit=unit
+            ):
+                if transform:
+                    data = transform(data)
+                writer.extend(data)
     return writer.tree
 
 
@@ -119,6 +139,139 @@ def clean(
     return merged
 
 
+def _move_job(path: EOS, source: Chunk, kwargs: dict):
+    return move(path, source, **kwargs)
+
+
+def _merge_job(path: EOS, sources: list[Chunk], kwargs: dict):
+    return merge(path, *sources, **kwargs)
+
+
+class _HostLimiter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running: defaultdict[str, int] = defaultdict(int)
+        self._pending: defaultdict[str, deque[tuple[int, Callable[[], None]]]] = (
+            defaultdict(deque)
+        )
+
+    def acquire(self, host: str, limit: int, start: Callable[[], None]):
+        with self._lock:
+            if limit is not ... and self._running[host] >= limit:
+                self._pending[host].append((limit, start))
+                return
+            self._running[host] += 1
+        start()
+
+    def release(self, host: str):
+        start = None
+        with self._lock:
+            self._running[host] -= 1
+            pending = self._pending[host]
+            if pending and (
+                pending[0][0] is ... or self._running[host] < pending[0][0]
+            ):
+                _, start = pending.popleft()
+                self._running[host] += 1
+        if start is not None:
+            start()
+
+
+_host_limiter = _HostLimiter()
+
+
+def _file_entry_bytes(chunks: Iterable[Chunk]) -> dict[tuple, float]:
+    chunks = [*chunks]
+    report = EOS.stat_many(chunk.path for chunk in chunks)
+    sizes = {str(path): stat.st_size for path, stat in report.results.items()}
+    weights = {
+        (chunk.uuid, chunk.name): sizes[str(chunk.path)] / max(chunk.num_entries, 1)
+        for chunk in chunks
+        if str(chunk.path) in sizes
+    }
+    default = sum(weights.values()) / len(weights) if weights else 1
+    for chunk in chunks:
+        weights.setdefault((chunk.uuid, chunk.name), default)
+    return weights
+
+
+class _ResizePlan:
+    def __init__(self, executor: Executor, max_writes: int, retries: int):
+        self._executor = executor
+        self._max_writes = max_writes
+        self._retries = retries
+        self._lock = threading.Lock()
+        self._future: Future[list[Chunk]] = Future()
+
+    def run(
+        self, tasks: list[tuple[float, str, Callable[[], Chunk]]], to_clean: Iterable
+    ):
+        self._to_clean = [*to_clean]
+        self._results = [None] * len(tasks)
+        self._remaining = len(tasks)
+        if not tasks:
+            self._finish()
+        order = sorted(range(len(tasks)), key=lambda i: tasks[i][0], reverse=True)
+        for i in order:
+            _, host, job = tasks[i]
+            _host_limiter.acquire(
+                host,
+                self._max_writes,
+                partial(self._start, i, host, job, self._retries),
+            )
+        return self._future
+
+    def _start(self, index: int, host: str, job: Callable, retries: int):
+        if self._future.done():
+            _host_limiter.release(host)
+            return
+        try:
+            future = self._executor.submit(job)
+        except BaseException as e:
+            _host_limiter.release(host)
+            self._fail(e)
+            return
+        future.add_done_callback(partial(self._done, index, host, job, retries))
+
+    def _done(self, index: int, host: str, job: Callable, retries: int, future):
+        error = future.exception() if not future.cancelled() else None
+        if future.cancelled() or error is not None:
+            if retries > 0 and not future.cancelled() and not self._future.done():
+                logging.warning(
+                    f"Retry resize task ({retries} left) after error: {error!r}"
+                )
+                self._start(index, host, job, retries - 1)
+                return
+            _host_limiter.release(host)
+            self._fail(error or Exception("Resize task is cancelled."))
+            return
+        _host_limiter.release(host)
+        with self._lock:
+            self._results[index] = future.result()
+            self._remaining -= 1
+            finished = self._remaining == 0
+        if finished:
+            self._finish()
+
+    def _fail(self, error: BaseException):
+        with self._lock:
+            if self._future.done():
+                return
+            self._future.set_exception(error)
+
+    def _finish(self):
+        try:
+            results = self._results
+            if self._to_clean:
+                results = clean(self._to_clean, results)
+        except BaseException as e:
+            self._fail(e)
+            return
+        with self._lock:
+            if not self._future.done():
+                self._future.set_result(results)
+
+
 def resize(
     path: PathLike,
     *sources: Chunk,
@@ -128,6 +281,11 @@ def resize(
     reader_options: ReaderOptions = None,
     clean_source: bool = True,
     transform: Callable[[ak.Array], ak.Array] = None,
+    unit: Literal["entry", "byte"] = "entry",
+    copy_baskets: bool = False,
+    executor: Optional[Executor] = None,
+    max_writes: int = ...,
+    retries: int = 0,
     dask: bool = False,
 ):
     """
@@ -151,14 +309,30 @@ def resize(
         If ``True``, remove the source chunk after moving.
     transform : ~typing.Callable[[ak.Array], ak.Array], optional
         A function to transform the array before writing.
+    unit : ~typing.Literal['entry', 'byte'], optional, default='entry'
+        The unit of ``step`` and ``chunk_size``. If ``unit='byte'``, the sizes are estimated from the uncompressed size per entry of the branches selected by ``reader_options``.
+    copy_baskets : bool, optional, default=False
+        If ``True``, copy the compressed baskets when possible. See :func:`merge` for details.
+    executor : ~concurrent.futures.Executor, optional
+        If given, each output chunk will be submitted to ``executor`` as a separate task. The tasks with more input bytes are submitted first, where the bytes are the uncompressed sizes estimated by :meth:`~.chunk.Chunk.partition` if ``unit='byte'``, otherwise the sizes of the source files.
+    max_writes : int, optional
+        Maximum number of concurrent tasks writing to the same host, shared by all :func:`resize` calls in the process. Only used with ``executor``. If not given, no limit will be applied.
+    retries : int, optional, default=0
+        Number of retries for each failed task. Only used with ``executor``.
     dask : bool, optional, default=False
         If ``True``, return a :class:`~dask.delayed.Delayed` object.
 
     Returns
     -------
-    list[Chunk] or Delayed
+    list[Chunk] or Delayed or Future[list[Chunk]]
         Merged chunks.
+
+    Notes
+    -----
+    The ``sources`` will only be cleaned after all tasks are finished successfully. If any task fails after all retries, the returned future will be set with the error and the pending tasks will be skipped.
     """
+    if executor is not None and dask:
+        raise ValueError("Please specify an parallel backend.")
     path = EOS(path)
     results: list[Chunk] = []
     move_kws = dict(
@@ -170,32 +344,63 @@ def resize(
         reader_options=reader_options,
         writer_options=writer_options,
         transform=transform,
+        unit=unit,
+        copy_baskets=copy_baskets,
         dask=dask,
     )
     to_clean = {(chunk.path, chunk.uuid): chunk for chunk in sources}
+    entry_bytes = None
+    plan: list[tuple[EOS, list[Chunk]]] = []
     if chunk_size is ...:
-        if len(sources) == 1:
-            results.append(move(path, sources[0], **move_kws))
-            to_clean.clear()
-        else:
-            results.append(merge(path, *sources, **merge_kws))
+        plan.append((path, [*sources]))
     else:
         output = path
         parent = path.parent
         filename = f'{path.stem}.chunk{{index}}{"".join(path.suffixes)}'
-        chunks = [*Chunk.partition(chunk_size, *sources, common_branches=True)]
+        common = Chunk.common(*sources)
+        weights = Chunk._entry_weights(
+            common, unit, (reader_options or {}).get(BRANCH_FILTER)
+        )
+        if unit == "byte":
+            entry_bytes = {
+                (chunk.uuid, chunk.name): weight
+                for chunk, weight in zip(common, weights)
+            }
+        chunks = [*Chunk._partition(chunk_size, common, weights)]
         for index, to_merges in enumerate(chunks):
             if len(chunks) > 1:
                 output = parent / filename.format(index=index)
-            if (
-                len(to_merges) == 1
-                and (to_merge := to_merges[0]).entry_start == 0
+            plan.append((output, to_merges))
+    jobs = []
+    for output, to_merges in plan:
+        if len(to_merges) == 1 and (
+            chunk_size is ...
+            or (
+                (to_merge := to_merges[0]).entry_start == 0
                 and to_merge.entry_stop == to_merge.num_entries
-            ):
-                results.append(move(output, to_merge, **move_kws))
-                to_clean.pop((to_merge.path, to_merge.uuid), None)
-            else:
-                results.append(merge(output, *to_merges, **merge_kws))
-    if clean_source and to_clean:
+            )
+        ):
+            jobs.append(partial(_move_job, output, to_merges[0], move_kws))
+            to_clean.pop((to_merges[0].path, to_merges[0].uuid), None)
+        else:
+            jobs.append(partial(_merge_job, output, to_merges, merge_kws))
+    if not clean_source:
+        to_clean.clear()
+    if executor is not None:
+        if entry_bytes is None:
+            entry_bytes = _file_entry_bytes(sources)
+        return _ResizePlan(executor, max_writes, retries).run(
+            [
+                (
+                    sum(len(c) * entry_bytes[c.uuid, c.name] for c in to_merges),
+                    output.host,
+                    job,
+                )
+                for (output, to_merges), job in zip(plan, jobs)
+            ],
+            to_clean.values(),
+        )
+    results = [job() for job in jobs]
+    if to_clean:
         results = clean(to_clean.values(), results, dask=dask)
     return results
@@ -0,0 +1,217 @@
+"""
+A process-wide pool of open ROOT files shared by all readers.
+
+.. note::
+    Each handle is checked out by one thread at a time. If all handles of a file are in use, a new one will be opened. Handles beyond :data:`FilePool.max_open` are closed once released.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Generator, Optional
+from uuid import UUID
+
+from ..config import Configurable, config
+from ..system.eos import PathLike
+
+if TYPE_CHECKING:
+    from uproot.reading import ReadOnlyDirectory
+
+__all__ = ["FilePool", "file_pool"]
+
+
+class _Handle:
+    def __init__(self, key: tuple, file: ReadOnlyDirectory):
+        self.key = key
+        self.file = file
+        self.uuid: UUID = file.file.uuid
+        self.last_used = time.monotonic()
+        self.pooled = True
+
+    def close(self):
+        try:
+            self.file.close()
+        except Exception:
+            ...
+
+
+class FilePool(Configurable, namespace="root.FilePool"):
+    """
+    A pool of :func:`uproot.open` handles with LRU eviction and idle timeout.
+
+    The handles are keyed by path and options, and matched by UUID when given.
+    """
+
+    enable = config(True)
+    """bool : If ``False``, open a new file for each checkout."""
+    max_open = config(64)
+    """int : Maximum number of handles kept open."""
+    idle_timeout = config(300.0)
+    """float : Seconds before an idle handle is closed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle: OrderedDict[int, _Handle] = OrderedDict()
+        self._keys: defaultdict[tuple, list[_Handle]] = defaultdict(list)
+        self._n_open = 0
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _remove(self, handle: _Handle):
+        self._idle.pop(id(handle), None)
+        handles = self._keys[handle.key]
+        handles.remove(handle)
+        if not handles:
+            del self._keys[handle.key]
+        self._n_open -= 1
+        handle.pooled = False
+        return handle
+
+    def _expire(self, reserve: int = 0) -> list[_Handle]:
+        expired = []
+        deadline = time.monotonic() - self.idle_timeout
+        while self._idle:
+            handle = next(iter(self._idle.values()))
+            if handle.last_used > deadline and self._n_open + reserve <= self.max_open:
+                break
+            expired.append(self._remove(handle))
+        return expired
+
+    def _checkout(
+        self, path: str, uuid: Optional[UUID], options: dict
+    ) -> Optional[_Handle]:
+        key = (path, tuple(sorted(options.items())))
+        with self._lock:
+            self._check_fork()
+            to_close = self._expire()
+            handle = None
+            for idle in self._keys.get(key, ())[::-1]:
+                if id(idle) not in self._idle:
+                    continue
+                if uuid is not None and idle.uuid != uuid:
+                    to_close.append(self._remove(idle))
+                    continue
+                handle = self._idle.pop(id(idle))
+                break
+        for stale in to_close:
+            stale.close()
+        return handle
+
+    def _open(self, path: str, options: dict) -> _Handle:
+        import uproot
+
+        handle = _Handle(
+            (path, tuple(sorted(options.items()))), uproot.open(path, **options)
+        )
+        with self._lock:
+            self._check_fork()
+            to_close = self._expire(reserve=1)
+            if self._n_open < self.max_open:
+                self._n_open += 1
+                self._keys[handle.key].append(handle)
+            else:
+                handle.pooled = False
+        for evicted in to_close:
+            evicted.close()
+        return handle
+
+    def _release(self, handle: _Handle, broken: bool = False):
+        to_close = []
+        with self._lock:
+            if not handle.pooled or self._pid != os.getpid():
+                to_close.append(handle)
+            elif broken:
+                to_close.append(self._remove(handle))
+            else:
+                handle.last_used = time.monotonic()
+                self._idle[id(handle)] = handle
+                to_close.extend(self._expire())
+        for handle in to_close:
+            handle.close()
+
+    @contextmanager
+    def open(
+        self, path: PathLike, uuid: UUID = None, **options
+    ) -> Generator[ReadOnlyDirectory, None, None]:
+        """
+        Check out a handle of ``path``.
+
+        Parameters
+        ----------
+        path : PathLike
+            Path to ROOT file.
+        uuid : ~uuid.UUID, optional
+            If given, only reuse handles with the same UUID. Handles with a different UUID are considered stale and will be closed.
+        **options : dict, optional
+            Additional options passed to :func:`uproot.open`.
+
+        Yields
+        ------
+        ~uproot.reading.ReadOnlyDirectory
+            An opened ROOT file. The handle should not be used after exit.
+        """
+        path = str(path)
+        if uuid is ...:
+            uuid = None
+        if not self.enable:
+            import uproot
+
+            with uproot.open(path, **options) as file:
+                yield file
+            return
+        handle = self._checkout(path, uuid, options)
+        if handle is None:
+            handle = self._open(path, options)
+        try:
+            yield handle.file
+        except BaseException:
+            self._release(handle, broken=True)
+            raise
+        self._release(handle)
+
+    def invalidate(self, path: PathLike = None):
+        """
+        Close the idle handles of ``path`` and stop reusing the ones in use.
+
+        Parameters
+        ----------
+        path : PathLike, optional
+            Path to ROOT file. If not given, all handles will be invalidated.
+        """
+        if path is not None:
+            path = str(path)
+        to_close = []
+        with self._lock:
+            self._check_fork()
+            for key in [*self._keys]:
+                if path is None or key[0] == path:
+                    for handle in self._keys.pop(key):
+                        self._n_open -= 1
+                        handle.pooled = False
+                        if self._idle.pop(id(handle), None) is not None:
+                            to_close.append(handle)
+        for handle in to_close:
+            handle.close()
+
+    def close(self):
+        """
+        Close all idle handles.
+        """
+        self.invalidate()
+
+
+file_pool = FilePool()
+"""FilePool : The process-wide pool used by :mod:`heptools.root`."""
+
+atexit.register(file_pool.close)
@@ -11,17 +11,29 @@ import importlib
 import os
 import pickle
 import re
+import stat as st
 import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import PurePosixPath as Path
 from subprocess import PIPE, CalledProcessError, check_output
-from typing import Any, Generator, Literal
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Literal
 
 from ..utils import arg_set
 from ..utils.string import ensure
 from ..utils.wrapper import retry
 
-__all__ = ["EOS", "PathLike", "EOSError", "save", "load"]
+if TYPE_CHECKING:
+    from .eos_backend import EOSBackend
+
+__all__ = ["EOS", "PathLike", "EOSError", "EOSReport", "EOSMetrics", "save", "load"]
 
 
 class EOSError(Exception):
@@ -32,6 +44,340 @@ class EOSError(Exception):
         super().__init__(msg, *args)
 
 
+@dataclass
+class EOSReport:
+    """
+    Result of a batch operation of :class:`EOS`.
+    """
+
+    operation: str
+    """str : Name of the operation."""
+    results: dict[Any, Any] = field(default_factory=dict)
+    """dict : A mapping from the succeeded items to the returned values."""
+    errors: dict[Any, Exception] = field(default_factory=dict)
+    """dict : A mapping from the failed items to the errors after all retries."""
+
+    @property
+    def ok(self) -> bool:
+        """bool : Whether all items succeeded."""
+        return not self.errors
+
+    def raise_errors(self):
+        """
+        Raise the first error if any item failed.
+        """
+        for error in self.errors.values():
+            raise error
+
+
+@dataclass
+class EOSMetrics:
+    """
+    Statistics of one type of operation of :class:`EOS`. See :meth:`EOS.metrics`.
+    """
+
+    operation: str
+    """str : Type of the operation, e.g. ``xrdfs rm``, ``xrdcp`` or ``xrootd stat``."""
+    count: int = 0
+    """int : Number of calls."""
+    failures: int = 0
+    """int : Number of failed calls."""
+    total: float = 0.0
+    """float : Total latency in seconds."""
+    buckets: list[int] = field(default_factory=list)
+    """list[int] : Number of calls with latency less than or equal to each bound in :data:`EOS.metrics_buckets`. The last one counts all calls."""
+
+    def _observe(self, elapsed: float, ok: bool):
+        if not self.buckets:
+            self.buckets = [0] * (len(EOS.metrics_buckets) + 1)
+        self.count += 1
+        self.total += elapsed
+        if not ok:
+            self.failures += 1
+        for i, bound in enumerate(EOS.metrics_buckets):
+            if elapsed <= bound:
+                self.buckets[i] += 1
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns
+        -------
+        dict
+            A JSON serializable summary.
+        """
+        return {
+            "operation": self.operation,
+            "count": self.count,
+            "failures": self.failures,
+            "total": self.total,
+            "buckets": dict(
+                zip([*map(str, EOS.metrics_buckets), "+Inf"], self.buckets)
+            ),
+        }
+
+
+class _EOSMonitor:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: dict[str, EOSMetrics] = {}
+
+    def observe(self, operation: str, elapsed: float, ok: bool):
+        with self._lock:
+            metrics = self._metrics.get(operation)
+            if metrics is None:
+                metrics = self._metrics[operation] = EOSMetrics(operation)
+            metrics._observe(elapsed, ok)
+
+    def snapshot(self) -> dict[str, EOSMetrics]:
+        with self._lock:
+            return {
+                k: EOSMetrics(v.operation, v.count, v.failures, v.total, [*v.buckets])
+                for k, v in self._metrics.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._metrics.clear()
+
+
+_monitor = _EOSMonitor()
+_history_lock = threading.Lock()
+
+
+class _EOSHistory(deque):
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [*self][index]
+        return super().__getitem__(index)
+
+
+def _prometheus_label(value: str):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _eos_operation(args: list[str]) -> str:
+    if args[0] in ("xrdfs", "eos") and len(args) > 2:
+        return f"{args[0]} {args[2]}"
+    return args[0]
+
+
+def _eos_checked(operation: str, func: Callable, item):
+    args = item if isinstance(item, tuple) else (item,)
+    result = func(*args)
+    if result is None or result is False:
+        raise EOSError([operation, *map(str, args)], b"operation returned no result")
+    return result
+
+
+@dataclass
+class _eos_batch_job:
+    func: Callable
+    items: list
+    batch: Callable[[], list] = None
+    verify: Callable[[Any], Any] = None
+
+    def _verify(self, item):
+        try:
+            return self.verify(item)
+        except Exception:
+            return None
+
+    def __call__(self):
+        if self.batch is not None:
+            try:
+                return [
+                    (item, result, None)
+                    for item, result in zip(self.items, self.batch())
+                ]
+            except Exception:
+                ...
+        outputs = []
+        for item in self.items:
+            if self.batch is not None and (result := self._verify(item)):
+                outputs.append((item, result, None))
+                continue
+            try:
+                outputs.append((item, self.func(item), None))
+            except Exception as e:
+                outputs.append((item, None, e))
+        return outputs
+
+
+def _eos_removed(path: EOS):
+    return not path.exists
+
+
+def _eos_created(path: EOS):
+    if path.is_dir:
+        return path
+
+
+def _eos_copied(pair: tuple[EOS, EOS]):
+    src, dst = pair
+    if dst.exists and src.stat().st_size == dst.stat().st_size:
+        return dst
+
+
+class _StatCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: OrderedDict[EOS, tuple[float, os.stat_result | None]] = (
+            OrderedDict()
+        )
+        self._lists: OrderedDict[EOS, tuple[float, list[EOS]]] = OrderedDict()
+
+    @staticmethod
+    def _get(cache: OrderedDict, path: EOS):
+        if EOS.cache_ttl <= 0:
+            return False, None
+        found = cache.get(path)
+        if found is None or time.monotonic() - found[0] > EOS.cache_ttl:
+            return False, None
+        return True, found[1]
+
+    @staticmethod
+    def _put(cache: OrderedDict, path: EOS, value):
+        cache.pop(path, None)
+        cache[path] = (time.monotonic(), value)
+        while len(cache) > EOS.cache_size:
+            cache.popitem(last=False)
+
+    def get_stat(self, path: EOS):
+        with self._lock:
+            return self._get(self._stats, path)
+
+    def get_list(self, path: EOS):
+        with self._lock:
+            return self._get(self._lists, path)
+
+    def put_stat(self, path: EOS, value: os.stat_result | None):
+        if EOS.cache_ttl > 0:
+            with self._lock:
+                self._put(self._stats, path, value)
+
+    def put_list(self, path: EOS, entries: list[tuple[EOS, os.stat_result]]):
+        if EOS.cache_ttl > 0:
+            with self._lock:
+                self._put(self._lists, path, [entry for entry, _ in entries])
+                for entry, value in entries:
+                    self._put(self._stats, entry, value)
+
+    def invalidate(self, *paths: EOS, recursive: bool = False):
+        with self._lock:
+            if not (self._stats or self._lists):
+                return
+            for path in paths:
+                for cache in (self._stats, self._lists):
+                    cache.pop(path, None)
+                self._lists.pop(path.parent, None)
+                if recursive:
+                    for cache in (self._stats, self._lists):
+                        for key in [k for k in cache if k.isin(path)]:
+                            del cache[key]
+
+    @contextmanager
+    def invalidating(self, *paths: EOS, recursive: bool = False):
+        # other threads may cache the old state during the operation
+        paths = [path for path in paths if not path.is_local]
+        self.invalidate(*paths, recursive=recursive)
+        try:
+            yield
+        finally:
+            self.invalidate(*paths, recursive=recursive)
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+            self._lists.clear()
+
+
+_stat_cache = _StatCache()
+
+_XRDFS_DATE = "%Y-%m-%d %H:%M:%S"
+
+
+def _xrdfs_stat(output: str) -> os.stat_result:
+    info = {}
+    for line in output.splitlines():
+        key, _, value = line.partition(":")
+        info[key.strip()] = value.strip()
+    mtime = datetime.strptime(info["MTime"], _XRDFS_DATE).timestamp()
+    mode = st.S_IFDIR if "IsDir" in info.get("Flags", "") else st.S_IFREG
+    size = int(info.get("Size", 0))
+    return os.stat_result((mode, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
+
+def _xrdfs_ls(output: str) -> list[tuple[str, os.stat_result]]:
+    entries = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) < 5:
+            continue
+        if parts[-2].isdigit():
+            size, date = parts[-2], parts[-4:-2]
+        else:
+            size, date = parts[-4], parts[-3:-1]
+        mtime = datetime.strptime(" ".join(date), _XRDFS_DATE).timestamp()
+        mode = st.S_IFDIR if parts[0].startswith("d") else st.S_IFREG
+        entries.append(
+            (
+                parts[-1],
+                os.stat_result((mode, 0, 0, 1, 0, 0, int(size), mtime, mtime, mtime)),
+            )
+        )
+    return entries
+
+
+def _eos_missing(error: bytes | str) -> bool:
+    if isinstance(error, bytes):
+        error = error.decode(errors="replace")
+    return "[3011]" in error or "No such file or directory" in error
+
+
+def _adler32(path: PathLike) -> str:
+    value = 1
+    with open(path, "rb") as f:
+        while chunk := f.read(EOS.transfer_chunk_size):
+            value = zlib.adler32(chunk, value)
+    return f"{value:08x}"
+
+
+def _parse_checksum(output: bytes | str) -> str:
+    if isinstance(output, bytes):
+        output = output.decode(errors="replace")
+    algorithm, _, value = output.strip("\x00 \n").partition(" ")
+    if algorithm.lower() != "adler32" or not value:
+        raise ValueError(f'Unexpected checksum "{output}"')
+    return value.strip().lower().zfill(8)
+
+
+def _eos_mismatch(src: EOS, dst: EOS) -> str | None:
+    copied = dst.checksum()
+    expected = None if copied is None else src.checksum()
+    if expected is not None:
+        if expected != copied:
+            return f"adler32 mismatch: {expected} != {copied}"
+        return None
+    expected, copied = src.stat().st_size, dst.stat().st_size
+    if expected != copied:
+        return f"size mismatch: {expected} != {copied}"
+    return None
+
+
+def _backend_stat(backend: EOSBackend, path: EOS):
+    try:
+        return backend.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _eos_batch_cmd(args: tuple, results: list):
+    if not EOS.cmd(*args)[0]:
+        raise EOSError([*map(str, args)], b"")
+    return results
+
+
 class EOS:
     _host_pattern = re.compile(r"^[\w]+://[^/]+")
     _slash_pattern = re.compile(r"(?<!:)/{2,}")
@@ -39,8 +385,27 @@ class EOS:
     run: bool = True
     allow_fail: bool = False
     client: Literal["eos", "xrdfs"] = "xrdfs"
-
-    history: list[tuple[datetime, str, tuple[bool, bytes]]] = []
+    backend: EOSBackend = None
+    """EOSBackend : If given, the operations on remote paths will be forwarded to the backend instead of running subprocesses. See :mod:`~heptools.system.eos_backend`."""
+    batch_size: int = 64
+    """int : Maximum number of paths passed to one ``rm``, ``mkdir``, ``cp``, ``xrdfs rm`` or ``xrdcp`` command in batch operations."""
+    cache_ttl: float = 0
+    """float : Seconds to keep the status and listing of remote paths, which are shared by :data:`exists`, :data:`is_dir`, :meth:`stat`, :meth:`ls`, :meth:`walk` and :meth:`scan`. The cached paths are invalidated by the operations of this process, but not by others. If ``0``, the cache is disabled."""
+    cache_size: int = 100_000
+    """int : Maximum number of cached remote paths."""
+    transfer_streams: int = 1
+    """int : Number of parallel streams to copy one file between local and remote paths, passed to ``xrdcp --streams`` or used as the number of parallel chunks by the backends."""
+    transfer_chunk_size: int = 8 * 1024**2
+    """int : Size in bytes of each chunk to copy in parallel or to read when computing the checksum."""
+
+    history_size: int = 1000
+    """int : Maximum number of operations kept in :data:`history`. If ``0``, the operations will not be recorded."""
+    history: deque[tuple[datetime, str, tuple[bool, bytes]]] = _EOSHistory(maxlen=1000)
+    """~collections.deque : The time, command and result of the most recent operations. The output is only kept for failed operations."""
+    metrics_enabled: bool = False
+    """bool : If ``True``, the count, latency and failures of each type of operation will be collected. See :meth:`metrics`."""
+    metrics_buckets: tuple[float, ...] = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+    """tuple[float, ...] : Upper bounds of the latency histogram in seconds. Should not be changed after the metrics are collected."""
 
     def __init__(self, path: PathLike = None, host: str = ...):
         if path is None:
@@ -103,35 +468,114 @@ class EOS:
     def is_null(self):
         return self.path is None
 
+    @property
+    def _remote_stat(self):
+        return self.backend is not None or self.client == "xrdfs"
+
+    def _stat(self) -> os.stat_result | None:
+        found, result = _stat_cache.get_stat(self)
+        if found:
+            return result
+        if self.backend is not None:
+            ok, result = self.native("stat", partial(_backend_stat, self.backend), self)
+        elif self.client == "xrdfs":
+            try:
+                ok, result = self.call("stat", self.path)
+            except EOSError as e:
+                if not _eos_missing(str(e)):
+                    raise
+                ok, result = True, None
+            if not ok and _eos_missing(result):
+                ok, result = True, None
+            elif ok:
+                if not result:
+                    return None
+                result = _xrdfs_stat(result.decode())
+        else:
+            raise NotImplementedError(
+                f'`{self.stat.__qualname__}()` does not support remote files using "{self.client}" client'
+            )  # TODO
+        if not ok:
+            return None
+        _stat_cache.put_stat(self, result)
+        return result
+
+    def _scan(self) -> list[tuple[EOS, os.stat_result]]:
+        found, result = _stat_cache.get_list(self)
+        if found:
+            stats = [_stat_cache.get_stat(path) for path in result]
+            if all(hit for hit, _ in stats):
+                return [(path, stat) for path, (_, stat) in zip(result, stats)]
+        if self.backend is not None:
+            ok, result = self.native("scan", self.backend.scan, self)
+            if not ok or result is None:
+                return []
+        elif self.client == "xrdfs":
+            ok, result = self.call("ls", "-l", self.path)
+            if not ok:
+                return []
+            result = _xrdfs_ls(result.decode())
+        else:
+            raise NotImplementedError(
+                f'`{self.scan.__qualname__}()` does not support remote files using "{self.client}" client'
+            )  # TODO
+        result = [(EOS(path, self.host), stat) for path, stat in result]
+        _stat_cache.put_list(self, result)
+        return result
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clear the cached status and listing of remote paths. See :data:`cache_ttl`.
+        """
+        _stat_cache.clear()
+
     @property
     @_devnull(False)
     def is_dir(self):
         if not self.is_local:
-            raise NotImplementedError(
-                f"`{EOS.is_dir.fget.__qualname__}` only works for local files"
-            )  # TODO
-        return self.path.is_dir()
+            result = self._stat()
+            return result is not None and st.S_ISDIR(result.st_mode)
+        return os.path.isdir(self.path)
 
     @property
     @_devnull(False)
     def is_file(self):
         if not self.is_local:
-            raise NotImplementedError(
-                f"`{EOS.is_file.fget.__qualname__}` only works for local files"
-            )  # TODO
+            result = self._stat()
+            return result is not None and not st.S_ISDIR(result.st_mode)
         return not self.is_dir
 
     @property
     @_devnull(True)
     def exists(self):
         if not self.is_local:
+            if self._remote_stat:
+                return self._stat() is not None
             return self.call("ls", self.path)[0]
-        return self.path.exists()
+        return os.path.exists(self.path)
+
+    @classmethod
+    def _record(
+        cls, operation: str, args: list[str], output: tuple[bool, Any], start: float
+    ):
+        ok = output[0]
+        if cls.metrics_enabled:
+            _monitor.observe(operation, time.perf_counter() - start, ok)
+        if cls.history_size > 0:
+            if EOS.history.maxlen != cls.history_size:
+                with _history_lock:
+                    if EOS.history.maxlen != cls.history_size:
+                        EOS.history = _EOSHistory(EOS.history, maxlen=cls.history_size)
+            EOS.history.append(
+                (datetime.now(), " ".join(args), output if not ok else (True, b""))
+            )
 
     @classmethod
     @retry(1)
     def cmd(cls, *args) -> tuple[bool, bytes]:
         args = [str(arg) for arg in args if arg]
+        start = time.perf_counter()
         if cls.run:
             try:
                 output = (True, check_output(args, stderr=PIPE))
@@ -144,14 +588,86 @@ class EOS:
                     output = (False, str(e).encode())
         else:
             output = (True, b"")
-        cls.history.append((datetime.now(), " ".join(args), output))
+        cls._record(_eos_operation(args), args, output, start)
+        if not cls.allow_fail and not output[0]:
+            raise EOSError(args, output[1])
+        return output
+
+    @classmethod
+    @retry(1)
+    def native(cls, operation: str, func: Callable, *args) -> tuple[bool, Any]:
+        name = cls.backend.name
+        start = time.perf_counter()
+        if cls.run:
+            try:
+                output = (True, func(*args))
+            except Exception as e:
+                output = (False, f"{type(e).__name__}: {e}".encode())
+        else:
+            output = (True, None)
+        args = [name, operation, *map(str, args)]
+        cls._record(f"{name} {operation}", args, output, start)
         if not cls.allow_fail and not output[0]:
             raise EOSError(args, output[1])
         return output
 
+    @classmethod
+    def metrics(cls) -> dict[str, EOSMetrics]:
+        """
+        Returns
+        -------
+        dict[str, EOSMetrics]
+            A copy of the metrics collected since the last :meth:`reset_metrics`, keyed by operation. See :data:`metrics_enabled`.
+        """
+        return _monitor.snapshot()
+
+    @classmethod
+    def export_metrics(cls, prefix: str = "heptools_eos") -> str:
+        """
+        Export the metrics in the Prometheus text format.
+
+        Parameters
+        ----------
+        prefix : str, optional, default="heptools_eos"
+            Prefix of the metric names.
+
+        Returns
+        -------
+        str
+            ``{prefix}_operations_total``, ``{prefix}_failures_total`` and the histogram ``{prefix}_latency_seconds`` labeled by operation.
+        """
+        metrics = [
+            (f'operation="{_prometheus_label(operation)}"', metrics)
+            for operation, metrics in sorted(cls.metrics().items())
+        ]
+        bounds = [*map(str, cls.metrics_buckets), "+Inf"]
+        lines = [f"# TYPE {prefix}_operations_total counter"]
+        for label, metric in metrics:
+            lines.append(f"{prefix}_operations_total{{{label}}} {metric.count}")
+        lines.append(f"# TYPE {prefix}_failures_total counter")
+        for label, metric in metrics:
+            lines.append(f"{prefix}_failures_total{{{label}}} {metric.failures}")
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for label, metric in metrics:
+            for bound, count in zip(bounds, metric.buckets):
+                lines.append(
+                    f'{prefix}_latency_seconds_bucket{{{label},le="{bound}"}} {count}'
+                )
+            lines.append(f"{prefix}_latency_seconds_sum{{{label}}} {metric.total}")
+            lines.append(f"{prefix}_latency_seconds_count{{{label}}} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def reset_metrics(cls):
+        """
+        Clear the collected metrics.
+        """
+        _monitor.clear()
+
     @classmethod
     def set_retry(cls, max: int = ..., delay: float = ...):
         cls.cmd.set(max=max, delay=delay)
+        cls.native.set(max=max, delay=delay)
 
     def call(self, executable: str, *args):
         eos = () if self.is_local else (self.client, self.host)
@@ -159,6 +675,8 @@ class EOS:
 
     @_devnull(list)
     def ls(self):  # TODO test and improve
+        if not self.is_local and self._remote_stat:
+            return [path for path, _ in self._scan()]
         files = self.call("ls", self.path)[1].decode().split("\n")
         if self.is_local or self.client == "eos":
             return [self / f for f in files if f]
@@ -167,16 +685,24 @@ class EOS:
 
     @_devnull(False)
     def rm(self, recursive: bool = False):
-        if not self.is_local and recursive and self.client == "xrdfs":
-            raise NotImplementedError(
-                f'`{self.rm.__qualname__}()` does not support recursive removal of remote files using "xrdfs" client'
-            )  # TODO
-        return self.call("rm", "-r" if recursive else "", self.path)[0]
+        with _stat_cache.invalidating(self, recursive=recursive):
+            if not self.is_local and self.backend is not None:
+                return self.native("rm", self.backend.rm, self, recursive)[0]
+            if not self.is_local and recursive and self.client == "xrdfs":
+                raise NotImplementedError(
+                    f'`{self.rm.__qualname__}()` does not support recursive removal of remote files using "xrdfs" client'
+                )  # TODO
+            return self.call("rm", "-r" if recursive else "", self.path)[0]
 
     @_devnull()
     def mkdir(self, recursive: bool = False) -> EOS:
-        if self.call("mkdir", "-p" if recursive else "", self.path)[0]:
-            return self
+        with _stat_cache.invalidating(self, *self._parents()):
+            if not self.is_local and self.backend is not None:
+                result = self.native("mkdir", self.backend.mkdir, self, recursive)
+            else:
+                result = self.call("mkdir", "-p" if recursive else "", self.path)
+            if result[0]:
+                return self
 
     @_devnull()
     def join(self, *other: str):
@@ -184,12 +710,32 @@ class EOS:
             return EOS()
         return EOS(self.path.joinpath(*other), self.host)
 
+    def _scan_remote(self, concurrency: int):
+        stat = self._stat()
+        if stat is None:
+            return
+        if not st.S_ISDIR(stat.st_mode):
+            yield self, stat
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending = deque([pool.submit(EOS._scan, self)])
+            try:
+                while pending:
+                    for path, stat in pending.popleft().result():
+                        if st.S_ISDIR(stat.st_mode):
+                            pending.append(pool.submit(EOS._scan, path))
+                        else:
+                            yield path, stat
+            finally:
+                for future in pending:
+                    future.cancel()
+
     @_devnull_iter
-    def walk(self) -> Generator[EOS, Any, None]:
+    def walk(self, concurrency: int = 16) -> Generator[EOS, Any, None]:
         if not self.is_local:
-            raise NotImplementedError(
-                f"`{self.walk.__qualname__}()` only works for local files"
-            )  # TODO
+            for path, _ in self._scan_remote(concurrency):
+                yield path
+            return
         if self.is_file:
             yield self
         else:
@@ -199,11 +745,12 @@ class EOS:
                     yield root / file
 
     @_devnull_iter
-    def scan(self) -> Generator[tuple[EOS, os.stat_result], Any, None]:
+    def scan(
+        self, concurrency: int = 16
+    ) -> Generator[tuple[EOS, os.stat_result], Any, None]:
         if not self.is_local:
-            raise NotImplementedError(
-                f"`{self.scan.__qualname__}()` only works for local files"
-            )  # TODO
+            yield from self._scan_remote(concurrency)
+            return
         if self.is_file:
             yield self, self.stat()
         else:
@@ -213,12 +760,33 @@ class EOS:
                 else:
                     yield EOS(entry.path, self.host), entry.stat()
 
-    def stat(self):
+    def stat(self) -> os.stat_result:
         if not self.is_local:
-            raise NotImplementedError(
-                f"`{self.stat.__qualname__}()` only works for local files"
-            )  # TODO
-        return self.path.stat()
+            result = self._stat()
+            if result is None:
+                raise FileNotFoundError(f'No such file or directory: "{self}"')
+            return result
+        return os.stat(self.path)
+
+    def checksum(self) -> str | None:
+        """
+        Returns
+        -------
+        str or None
+            The adler32 checksum as 8 hexadecimal digits. For remote paths, the checksum is computed by the server. ``None`` if not available.
+        """
+        if self.is_local:
+            return _adler32(self.path)
+        if self.backend is not None:
+            return self.native("checksum", self.backend.checksum, self)[1]
+        if self.client == "xrdfs":
+            ok, result = self.call("query", "checksum", self.path)
+            if ok and result:
+                return _parse_checksum(result)
+            return None
+        raise NotImplementedError(
+            f'`{self.checksum.__qualname__}()` does not support remote files using "{self.client}" client'
+        )  # TODO
 
     def isin(self, other: PathLike):
         other = EOS(other)
@@ -252,8 +820,9 @@ class EOS:
         parents: bool = False,
         overwrite: bool = False,
         recursive: bool = False,
+        checksum: bool = False,
     ):
-        return self.cp(self, dst, parents, overwrite, recursive)
+        return self.cp(self, dst, parents, overwrite, recursive, checksum)
 
     def move_to(
         self,
@@ -261,8 +830,9 @@ class EOS:
         parents: bool = False,
         overwrite: bool = False,
         recursive: bool = False,
+        checksum: bool = False,
     ):
-        return self.mv(self, dst, parents, overwrite, recursive)
+        return self.mv(self, dst, parents, overwrite, recursive, checksum)
 
     @classmethod
     def cp(
@@ -272,22 +842,79 @@ class EOS:
         parents: bool = False,
         overwrite: bool = False,
         recursive: bool = False,
+        checksum: bool = False,
     ) -> EOS:
+        """
+        Copy ``src`` to ``dst``.
+
+        Parameters
+        ----------
+        src : PathLike
+            Source path.
+        dst : PathLike
+            Destination path.
+        parents : bool, optional, default=False
+            Create the parent directories of ``dst`` if not exist.
+        overwrite : bool, optional, default=False
+            Overwrite ``dst`` if exists.
+        recursive : bool, optional, default=False
+            Copy directories recursively.
+        checksum : bool, optional, default=False
+            Verify the adler32 checksum of ``dst`` against ``src`` when at least one of them is remote, or the size if the checksum is not available from :data:`backend`. The mismatched ``dst`` will be removed. Without :data:`backend`, the verification and cleanup are done by ``xrdcp --cksum adler32 --rm-bad-cksum``. Ignored when ``recursive=True``.
+
+        Returns
+        -------
+        EOS
+            ``dst`` if succeeded.
+        """
         src, dst = EOS(src), EOS(dst)
-        if parents:
-            dst.parent.mkdir(recursive=True)
-        if src.is_local and dst.is_local:
-            result = cls.cmd(
-                "cp", "-r" if recursive else "", "-n" if not overwrite else "", src, dst
-            )
-        else:
-            if recursive:
-                raise NotImplementedError(
-                    f"`{cls.cp.__qualname__}()` does not support recursive copying of remote files"
-                )  # TODO
-            result = cls.cmd("xrdcp", "-f" if overwrite else "", src, dst)
-        if result[0]:
-            return dst
+        with _stat_cache.invalidating(dst, recursive=recursive):
+            if parents:
+                dst.parent.mkdir(recursive=True)
+            verify = checksum and not recursive and not (src.is_local and dst.is_local)
+            if src.is_local and dst.is_local:
+                result = cls.cmd(
+                    "cp",
+                    "-r" if recursive else "",
+                    "-n" if not overwrite else "",
+                    src,
+                    dst,
+                )
+            elif cls.backend is not None:
+                result = cls.native(
+                    "cp", cls.backend.cp, src, dst, overwrite, recursive
+                )
+            else:
+                if recursive:
+                    raise NotImplementedError(
+                        f"`{cls.cp.__qualname__}()` does not support recursive copying of remote files"
+                    )  # TODO
+                result = cls.cmd(
+                    "xrdcp",
+                    "-f" if overwrite else "",
+                    *(
+                        ("--streams", cls.transfer_streams)
+                        if cls.transfer_streams > 1
+                        else ()
+                    ),
+                    *(("--cksum", "adler32", "--rm-bad-cksum") if verify else ()),
+                    src,
+                    dst,
+                )
+                verify = False
+            if result[0] and verify and cls.run:
+                _stat_cache.invalidate(dst)
+                mismatch = _eos_mismatch(src, dst)
+                if mismatch is not None:
+                    try:
+                        dst.rm()
+                    except EOSError:
+                        ...
+                    if not cls.allow_fail:
+                        raise EOSError(["cp", str(src), str(dst)], mismatch.encode())
+                    return None
+            if result[0]:
+                return dst
 
     @classmethod
     def mv(
@@ -297,31 +924,368 @@ class EOS:
         parents: bool = False,
         overwrite: bool = False,
         recursive: bool = False,
+        checksum: bool = False,
     ) -> EOS:
+        """
+        Move ``src`` to ``dst``. Between different hosts, ``src`` is copied by :meth:`cp` and only removed after the copy succeeded.
+
+        Parameters
+        ----------
+        src : PathLike
+            Source path.
+        dst : PathLike
+            Destination path.
+        parents : bool, optional, default=False
+            Create the parent directories of ``dst`` if not exist.
+        overwrite : bool, optional, default=False
+            Overwrite ``dst`` if exists.
+        recursive : bool, optional, default=False
+            Move directories recursively.
+        checksum : bool, optional, default=False
+            When copied between different hosts, verify the adler32 checksum before removing ``src``.
+
+        Returns
+        -------
+        EOS
+            ``dst`` if succeeded.
+        """
         src, dst = EOS(src), EOS(dst)
         if (src.path is None) or (dst.path is None):
             return EOS()
-        if src == dst:
-            return dst
-        if parents:
-            dst.parent.mkdir(recursive=True)
-        if src.host == dst.host:
-            result = src.call(
-                "mv",
-                "-n" if not overwrite and src.client != "xrdfs" else "",
-                src.path,
-                dst.path,
-            )[0]
-        else:
-            if recursive:
-                raise NotImplementedError(
-                    f"`{cls.mv.__qualname__}()` does not support recursive moving of remote files from different sites"
-                )  # TODO
-            result = cls.cp(src, dst, parents, overwrite, recursive)
+        with _stat_cache.invalidating(src, dst, recursive=True):
+            if src == dst:
+                return dst
+            if parents:
+                dst.parent.mkdir(recursive=True)
+            if src.host == dst.host and not src.is_local and cls.backend is not None:
+                result = cls.native("mv", cls.backend.mv, src, dst, overwrite)[0]
+            elif src.host == dst.host:
+                result = src.call(
+                    "mv",
+                    "-n" if not overwrite and src.client != "xrdfs" else "",
+                    src.path,
+                    dst.path,
+                )[0]
+            else:
+                if recursive:
+                    raise NotImplementedError(
+                        f"`{cls.mv.__qualname__}()` does not support recursive moving of remote files from different sites"
+                    )  # TODO
+                result = cls.cp(src, dst, parents, overwrite, recursive, checksum)
+                if result:
+                    result = src.rm()
             if result:
-                result = src.rm()
-        if result:
-            return dst
+                return dst
+
+    @classmethod
+    def _many(
+        cls,
+        operation: str,
+        func: Callable,
+        items: list,
+        batches: list[tuple[list, Callable[[], list]]],
+        concurrency: int,
+        retries: int,
+        delay: float,
+        report: EOSReport = None,
+        verify: Callable[[Any], Any] = None,
+    ) -> EOSReport:
+        func = retry(retries + 1, delay)(partial(_eos_checked, operation, func))
+        jobs = [_eos_batch_job(func, batch, call, verify) for batch, call in batches]
+        jobs.extend(_eos_batch_job(func, [item]) for item in items)
+        report = report or EOSReport(operation)
+        if not jobs:
+            return report
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as pool:
+            for outputs in pool.map(_eos_batch_job.__call__, jobs):
+                for item, result, error in outputs:
+                    if error is None:
+                        report.results[item] = result
+                    else:
+                        report.errors[item] = error
+        return report
+
+    @classmethod
+    def _batches(cls, groups: dict[tuple, list], args: Callable, result: Callable):
+        batches = []
+        for key, items in groups.items():
+            for start in range(0, len(items), cls.batch_size):
+                batch = items[start : start + cls.batch_size]
+                batches.append(
+                    (
+                        batch,
+                        partial(
+                            _eos_batch_cmd,
+                            args(key, batch),
+                            [*map(result, batch)],
+                        ),
+                    )
+                )
+        return batches
+
+    @classmethod
+    def rm_many(
+        cls,
+        paths: Iterable[PathLike],
+        recursive: bool = False,
+        concurrency: int = 16,
+        retries: int = 0,
+        delay: float = 0,
+    ) -> EOSReport:
+        """
+        Remove ``paths`` concurrently.
+
+        Parameters
+        ----------
+        paths : ~typing.Iterable[PathLike]
+            Paths to remove.
+        recursive : bool, optional, default=False
+            Remove directories recursively.
+        concurrency : int, optional, default=16
+            Maximum number of concurrent operations.
+        retries : int, optional, default=0
+            Number of retries for each failed path.
+        delay : float, optional, default=0
+            Seconds to wait before each retry.
+
+        Returns
+        -------
+        EOSReport
+            A mapping from path to the result of :meth:`rm`.
+
+        Notes
+        -----
+        The local paths and the remote paths using ``xrdfs`` client are removed in batches of :data:`batch_size` by a single command. If a batch fails, each path in the batch that still exists will be retried separately, so a missing path in a failed batch is reported as removed.
+        """
+        paths = [*dict.fromkeys(p for p in map(EOS, paths) if not p.is_null)]
+        groups, items = defaultdict(list), []
+        for path in paths:
+            if path.is_local:
+                groups[()].append(path)
+            elif cls.backend is None and cls.client == "xrdfs" and not recursive:
+                groups[(path.host,)].append(path)
+            else:
+                items.append(path)
+        with _stat_cache.invalidating(*paths, recursive=recursive):
+            batches = cls._batches(
+                groups,
+                lambda key, batch: (
+                    *(("xrdfs", *key) if key else ()),
+                    "rm",
+                    "-r" if recursive and not key else "",
+                    *(p.path for p in batch),
+                ),
+                lambda _: True,
+            )
+            return cls._many(
+                "rm",
+                partial(EOS.rm, recursive=recursive),
+                items,
+                batches,
+                concurrency,
+                retries,
+                delay,
+                verify=_eos_removed,
+            )
+
+    @classmethod
+    def mkdir_many(
+        cls,
+        paths: Iterable[PathLike],
+        recursive: bool = True,
+        concurrency: int = 16,
+        retries: int = 0,
+        delay: float = 0,
+    ) -> EOSReport:
+        """
+        Create directories concurrently.
+
+        Parameters
+        ----------
+        paths : ~typing.Iterable[PathLike]
+            Directories to create.
+        recursive : bool, optional, default=True
+            Create parent directories if needed. If ``True``, the directories that are parents of other ones in ``paths`` will be skipped.
+        concurrency : int, optional, default=16
+            Maximum number of concurrent operations.
+        retries : int, optional, default=0
+            Number of retries for each failed path.
+        delay : float, optional, default=0
+            Seconds to wait before each retry.
+
+        Returns
+        -------
+        EOSReport
+            A mapping from path to the result of :meth:`mkdir`. The skipped parents are not included.
+
+        Notes
+        -----
+        The local directories are created in batches of :data:`batch_size` by a single command. If a batch fails, each directory in the batch that does not exist will be retried separately.
+        """
+        paths = [*dict.fromkeys(p for p in map(EOS, paths) if not p.is_null)]
+        if recursive:
+            parents = {parent for path in paths for parent in path._parents()}
+            paths = [path for path in paths if path not in parents]
+        with _stat_cache.invalidating(
+            *paths, *{p for path in paths for p in path._parents()}
+        ):
+            groups, items = defaultdict(list), []
+            for path in paths:
+                if path.is_local:
+                    groups[()].append(path)
+                else:
+                    items.append(path)
+            batches = cls._batches(
+                groups,
+                lambda _, batch: (
+                    "mkdir",
+                    "-p" if recursive else "",
+                    *(p.path for p in batch),
+                ),
+                lambda path: path,
+            )
+            return cls._many(
+                "mkdir",
+                partial(EOS.mkdir, recursive=recursive),
+                items,
+                batches,
+                concurrency,
+                retries,
+                delay,
+                verify=_eos_created,
+            )
+
+    @classmethod
+    def stat_many(
+        cls,
+        paths: Iterable[PathLike],
+        concurrency: int = 16,
+        retries: int = 0,
+        delay: float = 0,
+    ) -> EOSReport:
+        """
+        Get the status of ``paths`` concurrently.
+
+        Parameters
+        ----------
+        paths : ~typing.Iterable[PathLike]
+            Paths to check.
+        concurrency : int, optional, default=16
+            Maximum number of concurrent operations.
+        retries : int, optional, default=0
+            Number of retries for each failed path.
+        delay : float, optional, default=0
+            Seconds to wait before each retry.
+
+        Returns
+        -------
+        EOSReport
+            A mapping from path to the result of :meth:`stat`.
+        """
+        paths = [*dict.fromkeys(p for p in map(EOS, paths) if not p.is_null)]
+        return cls._many("stat", EOS.stat, paths, [], concurrency, retries, delay)
+
+    @classmethod
+    def cp_many(
+        cls,
+        pairs: Iterable[tuple[PathLike, PathLike]],
+        parents: bool = False,
+        overwrite: bool = False,
+        concurrency: int = 16,
+        retries: int = 0,
+        delay: float = 0,
+    ) -> EOSReport:
+        """
+        Copy files concurrently.
+
+        Parameters
+        ----------
+        pairs : ~typing.Iterable[tuple[PathLike, PathLike]]
+            Pairs of source and destination.
+        parents : bool, optional, default=False
+            Create the parent directories of destinations by :meth:`mkdir_many` before copying.
+        overwrite : bool, optional, default=False
+            Overwrite the existing destinations.
+        concurrency : int, optional, default=16
+            Maximum number of concurrent operations.
+        retries : int, optional, default=0
+            Number of retries for each failed pair.
+        delay : float, optional, default=0
+            Seconds to wait before each retry.
+
+        Returns
+        -------
+        EOSReport
+            A mapping from ``(src, dst)`` to the result of :meth:`cp`. If the parent of ``dst`` cannot be created, the error will be reported for the pair.
+
+        Notes
+        -----
+        The pairs with the same file name and destination directory are copied in batches of :data:`batch_size` by a single ``cp`` or ``xrdcp --parallel`` command. If a batch fails, each pair in the batch will be retried separately unless the destination already has the same size as the source.
+        """
+        pairs = [
+            *dict.fromkeys(
+                (src, dst)
+                for src, dst in ((EOS(src), EOS(dst)) for src, dst in pairs)
+                if not (src.is_null or dst.is_null)
+            )
+        ]
+        with _stat_cache.invalidating(*(dst for _, dst in pairs)):
+            report = EOSReport("cp")
+            if parents:
+                created = cls.mkdir_many(
+                    (dst.parent for _, dst in pairs),
+                    concurrency=concurrency,
+                    retries=retries,
+                    delay=delay,
+                )
+                remaining = []
+                for src, dst in pairs:
+                    if (error := created.errors.get(dst.parent)) is not None:
+                        report.errors[src, dst] = error
+                    else:
+                        remaining.append((src, dst))
+                pairs = remaining
+            groups, items = defaultdict(list), []
+            for src, dst in pairs:
+                if src.name != dst.name or (
+                    cls.backend is not None and not (src.is_local and dst.is_local)
+                ):
+                    items.append((src, dst))
+                else:
+                    local = src.is_local and dst.is_local
+                    groups[local, dst.parent].append((src, dst))
+            batches = cls._batches(
+                groups,
+                lambda key, batch: (
+                    *(
+                        ("cp", "-n" if not overwrite else "")
+                        if key[0]
+                        else ("xrdcp", "--parallel", min(concurrency, len(batch)))
+                    ),
+                    "-f" if overwrite and not key[0] else "",
+                    *(src for src, _ in batch),
+                    ensure(str(key[1]), __suffix="/"),
+                ),
+                lambda pair: pair[1],
+            )
+            return cls._many(
+                "cp",
+                partial(EOS.cp, overwrite=overwrite),
+                items,
+                batches,
+                concurrency,
+                retries,
+                delay,
+                report,
+                _eos_copied,
+            )
+
+    def _parents(self):
+        parent = self.parent
+        while parent.path != parent.path.parent:
+            yield parent
+            parent = parent.parent
+        yield parent
 
     @property
     def name(self):
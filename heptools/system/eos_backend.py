@@ -0,0 +1,339 @@
+"""
+In-process backends of :class:`~heptools.system.eos.EOS` for remote paths.
+
+.. note::
+    By default, :class:`~heptools.system.eos.EOS` runs a new ``xrdfs``, ``xrdcp`` or ``eos`` process for each operation. Once a backend is assigned to :data:`EOS.backend <heptools.system.eos.EOS.backend>`, all operations on remote paths will be forwarded to it, while local paths are not affected.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .eos import EOS, PathLike
+
+__all__ = ["EOSBackend", "XRootDBackend", "LocalBackend"]
+
+_kXR_NotFound = 3011
+_kXR_Unsupported = 3013
+
+
+def _stat_result(is_dir: bool, size: int, mtime: float) -> os.stat_result:
+    mode = (stat.S_IFDIR | 0o755) if is_dir else (stat.S_IFREG | 0o644)
+    return os.stat_result((mode, 0, 0, 1, 0, 0, size, mtime, mtime, mtime))
+
+
+def _copy_chunk(src: int, dst: int, offset: int, size: int):
+    while size > 0:
+        data = os.pread(src, size, offset)
+        if not data:
+            raise EOFError(f"Unexpected end of file at {offset}")
+        written = os.pwrite(dst, data, offset)
+        offset += written
+        size -= written
+
+
+def _copy_chunks(src: str, dst: str, chunk_size: int, streams: int):
+    size = os.path.getsize(src)
+    if streams <= 1 or size <= chunk_size:
+        shutil.copyfile(src, dst)
+        return
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(dst_fd, size)
+            with ThreadPoolExecutor(max_workers=streams) as pool:
+                for future in [
+                    pool.submit(
+                        _copy_chunk,
+                        src_fd,
+                        dst_fd,
+                        offset,
+                        min(chunk_size, size - offset),
+                    )
+                    for offset in range(0, size, chunk_size)
+                ]:
+                    future.result()
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+class EOSBackend(ABC):
+    """
+    Base class of the backends. The failures should be reported by raising exceptions, which will be converted to :class:`~heptools.system.eos.EOSError` by :class:`~heptools.system.eos.EOS`.
+    """
+
+    name: str
+    """str : Name used in :data:`EOS.history <heptools.system.eos.EOS.history>`."""
+
+    @abstractmethod
+    def ls(self, path: EOS) -> list[str]:
+        """
+        Returns
+        -------
+        list[str]
+            The absolute paths of the entries in directory ``path``.
+        """
+
+    def scan(self, path: EOS) -> list[tuple[str, os.stat_result]]:
+        """
+        Returns
+        -------
+        list[tuple[str, ~os.stat_result]]
+            The absolute paths and status of the entries in directory ``path``. By default, :meth:`stat` is called for each entry returned by :meth:`ls`.
+        """
+        return [
+            (entry, self.stat(path.join(os.path.basename(entry))))
+            for entry in self.ls(path)
+        ]
+
+    @abstractmethod
+    def stat(self, path: EOS) -> os.stat_result:
+        """
+        Returns
+        -------
+        ~os.stat_result
+            At least ``st_mode``, ``st_size`` and ``st_mtime`` are available.
+
+        Raises
+        ------
+        FileNotFoundError
+            If ``path`` does not exist.
+        """
+
+    @abstractmethod
+    def rm(self, path: EOS, recursive: bool): ...
+
+    @abstractmethod
+    def mkdir(self, path: EOS, recursive: bool): ...
+
+    @abstractmethod
+    def mv(self, src: EOS, dst: EOS, overwrite: bool):
+        """
+        Move ``src`` to ``dst`` on the same host.
+        """
+
+    @abstractmethod
+    def cp(self, src: EOS, dst: EOS, overwrite: bool, recursive: bool):
+        """
+        Copy ``src`` to ``dst``. At least one of them is remote. A single file should be copied in :data:`EOS.transfer_streams <heptools.system.eos.EOS.transfer_streams>` parallel chunks when possible.
+        """
+
+    def checksum(self, path: EOS) -> str | None:
+        """
+        Returns
+        -------
+        str or None
+            The adler32 checksum of ``path`` as 8 hexadecimal digits. ``None`` if not supported, in which case the copies are verified by size. By default, ``None`` is returned.
+        """
+        return None
+
+
+class XRootDBackend(EOSBackend):
+    """
+    Use the :mod:`XRootD` Python bindings. One :class:`XRootD.client.FileSystem` is kept for each host, so the connections are reused across operations.
+
+    Parameters
+    ----------
+    timeout : int, optional, default=0
+        Timeout of each operation in seconds. If ``0``, the default of XRootD will be used.
+    """
+
+    name = "xrootd"
+
+    def __init__(self, timeout: int = 0):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    def __getstate__(self):
+        return {"timeout": self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _fs(self, path: EOS):
+        with self._lock:
+            client = self._clients.get(path.host)
+            if client is None:
+                from XRootD import client as xrd
+
+                client = self._clients[path.host] = xrd.FileSystem(path.host)
+            return client
+
+    @staticmethod
+    def _check(status, result=None):
+        if not status.ok:
+            if status.errno == _kXR_NotFound:
+                raise FileNotFoundError(status.message)
+            raise OSError(status.message)
+        return result
+
+    def ls(self, path: EOS):
+        listing = self._check(
+            *self._fs(path).dirlist(str(path.path), timeout=self.timeout)
+        )
+        return [str(path.path / entry.name) for entry in listing]
+
+    @staticmethod
+    def _stat_result(info):
+        from XRootD.client.flags import StatInfoFlags
+
+        return _stat_result(
+            bool(info.flags & StatInfoFlags.IS_DIR), info.size, info.modtime
+        )
+
+    def scan(self, path: EOS):
+        from XRootD.client.flags import DirListFlags
+
+        listing = self._check(
+            *self._fs(path).dirlist(
+                str(path.path), DirListFlags.STAT, timeout=self.timeout
+            )
+        )
+        return [
+            (str(path.path / entry.name), self._stat_result(entry.statinfo))
+            for entry in listing
+        ]
+
+    def stat(self, path: EOS):
+        return self._stat_result(
+            self._check(*self._fs(path).stat(str(path.path), timeout=self.timeout))
+        )
+
+    def rm(self, path: EOS, recursive: bool):
+        fs = self._fs(path)
+        if recursive and stat.S_ISDIR(self.stat(path).st_mode):
+            for entry in self.ls(path):
+                self.rm(path.join(os.path.basename(entry)), recursive=True)
+            self._check(*fs.rmdir(str(path.path), timeout=self.timeout))
+        else:
+            self._check(*fs.rm(str(path.path), timeout=self.timeout))
+
+    def mkdir(self, path: EOS, recursive: bool):
+        from XRootD.client.flags import MkDirFlags
+
+        flags = MkDirFlags.MAKEPATH if recursive else MkDirFlags.NONE
+        self._check(*self._fs(path).mkdir(str(path.path), flags, timeout=self.timeout))
+
+    def mv(self, src: EOS, dst: EOS, overwrite: bool):
+        self._check(
+            *self._fs(src).mv(str(src.path), str(dst.path), timeout=self.timeout)
+        )
+
+    def cp(self, src: EOS, dst: EOS, overwrite: bool, recursive: bool):
+        from XRootD import client as xrd
+
+        if recursive:
+            raise NotImplementedError("Recursive copy is not supported by XRootD")
+        from .eos import EOS
+
+        process = xrd.CopyProcess()
+        process.add_job(
+            str(src),
+            str(dst),
+            force=overwrite,
+            chunksize=EOS.transfer_chunk_size,
+            parallelchunks=max(EOS.transfer_streams, 1),
+        )
+        self._check(process.prepare())
+        status, results = process.run()
+        self._check(status)
+        for result in results:
+            self._check(result["status"])
+
+    def checksum(self, path: EOS):
+        from XRootD.client.flags import QueryCode
+
+        from .eos import _parse_checksum
+
+        status, result = self._fs(path).query(
+            QueryCode.CHECKSUM, str(path.path), timeout=self.timeout
+        )
+        if not status.ok and status.errno == _kXR_Unsupported:
+            return None
+        return _parse_checksum(self._check(status, result))
+
+
+class LocalBackend(EOSBackend):
+    """
+    A stand-in for remote storage on the local filesystem, which can be used in tests. The remote path ``root://host//path`` is mapped to ``{root}/host/path``.
+
+    Parameters
+    ----------
+    root : PathLike
+        Local directory to store the remote files.
+    """
+
+    name = "local"
+
+    def __init__(self, root: PathLike):
+        self.root = os.fspath(root)
+
+    def local(self, path: EOS) -> str:
+        """
+        Returns
+        -------
+        str
+            The local path that ``path`` is mapped to.
+        """
+        if path.is_local:
+            return str(path.path)
+        host = path.host.split("://", 1)[-1].strip("/")
+        return os.path.join(self.root, host, str(path.path).lstrip("/"))
+
+    def ls(self, path: EOS):
+        return [str(path.path / name) for name in sorted(os.listdir(self.local(path)))]
+
+    def scan(self, path: EOS):
+        with os.scandir(self.local(path)) as entries:
+            return sorted(
+                (str(path.path / entry.name), entry.stat()) for entry in entries
+            )
+
+    def stat(self, path: EOS):
+        return os.stat(self.local(path))
+
+    def rm(self, path: EOS, recursive: bool):
+        local = self.local(path)
+        if recursive and os.path.isdir(local):
+            shutil.rmtree(local)
+        else:
+            os.remove(local)
+
+    def mkdir(self, path: EOS, recursive: bool):
+        if recursive:
+            os.makedirs(self.local(path), exist_ok=True)
+        else:
+            os.mkdir(self.local(path))
+
+    def mv(self, src: EOS, dst: EOS, overwrite: bool):
+        dst = self.local(dst)
+        if not overwrite and os.path.exists(dst):
+            raise FileExistsError(dst)
+        os.replace(self.local(src), dst)
+
+    def cp(self, src: EOS, dst: EOS, overwrite: bool, recursive: bool):
+        src, dst = self.local(src), self.local(dst)
+        if not overwrite and os.path.exists(dst):
+            raise FileExistsError(dst)
+        if recursive and os.path.isdir(src):
+            shutil.copytree(src, dst, dirs_exist_ok=True)
+        else:
+            from .eos import EOS
+
+            _copy_chunks(src, dst, EOS.transfer_chunk_size, EOS.transfer_streams)
+
+    def checksum(self, path: EOS):
+        from .eos import _adler32
+
+        return _adler32(self.local(path))
@@ -0,0 +1,36 @@
+import os
+import tempfile
+
+import awkward as ak
+import numpy as np
+
+from heptools.root import Chain, Friend
+from heptools.root.io import TreeWriter
+
+with tempfile.TemporaryDirectory() as tmp:
+    writer = TreeWriter()
+    with writer(os.path.join(tmp, "main.root")):
+        writer.extend(ak.Array({"a": np.arange(10.0)}))
+    main = writer.tree
+    friend = Friend("ff")
+    with writer(os.path.join(tmp, "friend.root")):
+        writer.extend(
+            ak.Array(
+                {
+                    **{f"x{i}": np.arange(10.0) + i for i in range(8)},
+                    "y": np.arange(10.0) * 2,
+                    "j": ak.unflatten(np.arange(20, dtype=np.int32), np.full(10, 2)),
+                }
+            )
+        )
+    friend.add(main, writer.tree)
+
+    chain = Chain()
+    chain += main
+    chain.add_friend(friend, renaming=lambda friend, branch: (friend, branch))
+    record = chain.concat(lazy=True)
+    expected = record.materialize()
+    array = record.array
+    for field in expected.ff.fields:
+        assert ak.array_equal(array.ff[field], expected.ff[field]), field
+    assert ak.array_equal(array.a, expected.a)